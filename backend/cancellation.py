@@ -0,0 +1,63 @@
+"""Cancellation of the work behind one streaming request.
+
+A CancelScope groups the tasks working on a chat turn (the SSE generator
+itself, model queries, the speculative Stage 2). watch_disconnect() waits
+for the client's ``http.disconnect`` message and cancels the whole scope as
+soon as it arrives, so abandoned turns stop calling providers right away
+instead of at the next ``request.is_disconnected()`` poll.
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class CancelScope:
+    """Tasks cancelled together when the scope is cancelled."""
+
+    def __init__(self):
+        self.reason: Optional[str] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._watcher: Optional[asyncio.Task] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self.reason is not None
+
+    def attach(self, task: asyncio.Task) -> asyncio.Task:
+        """Cancel `task` with the scope (immediately if it already was). Returns the task."""
+        if self.cancelled:
+            task.cancel()
+        elif not task.done():
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return task
+
+    def cancel(self, reason: str = "cancelled"):
+        """Cancel every attached task that is still running."""
+        if self.cancelled:
+            return
+        self.reason = reason
+        for task in list(self._tasks):
+            if task is not asyncio.current_task():
+                task.cancel()
+        self._tasks.clear()
+
+    def watch_disconnect(self, request: Any):
+        """Cancel the scope when the client behind `request` disconnects."""
+        async def _watch():
+            while True:
+                message = await request.receive()
+                if message["type"] == "http.disconnect":
+                    break
+            logger.info("Client disconnected; cancelling its request")
+            self.cancel("client disconnected")
+
+        self._watcher = asyncio.create_task(_watch())
+
+    def close(self):
+        """Stop watching for disconnects (call once the request is finished)."""
+        if self._watcher is not None and not self._watcher.done():
+            self._watcher.cancel()
@@ -1,6 +1,7 @@
 """Configuration for the LLM Council."""
 
 import os
+import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,6 +12,68 @@ OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
 
+# Conversation storage backend: 'jsonl' (one log file per conversation) or
+# 'sqlite' (single WAL-mode database, safe for multiple workers)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "jsonl").strip().lower()
+
+# Per-provider request scheduling (see providers/rate_limit.py). Requests to
+# one provider beyond these limits queue instead of failing with 429.
+# PROVIDER_LIMITS is a JSON object mapping provider names to
+# {"concurrency": n, "rpm": requests per minute, "tpm": prompt tokens per
+# minute}, e.g. '{"groq": {"rpm": 30, "tpm": 6000}}'. 0 means unlimited.
+# PROVIDER_MAX_CONCURRENCY applies to providers without their own
+# "concurrency" entry; unlimited by default.
+PROVIDER_MAX_CONCURRENCY = int(os.getenv("PROVIDER_MAX_CONCURRENCY", "0"))
+PROVIDER_LIMITS = json.loads(os.getenv("PROVIDER_LIMITS") or "{}")
+# Retries of a rate-limited request, each after Retry-After (or backoff)
+RATE_LIMIT_RETRIES = int(os.getenv("RATE_LIMIT_RETRIES", "3"))
+
+# Per-call timeouts derived from each model's observed latency (see
+# latency.py): multiplier x p95, clamped to [min, max] seconds. Models
+# without enough history, or all models with ADAPTIVE_TIMEOUTS=0, get 120s.
+ADAPTIVE_TIMEOUTS = os.getenv("ADAPTIVE_TIMEOUTS", "1").strip().lower() not in ("0", "false", "no", "off")
+ADAPTIVE_TIMEOUT_MULTIPLIER = float(os.getenv("ADAPTIVE_TIMEOUT_MULTIPLIER", "3"))
+ADAPTIVE_TIMEOUT_MIN = float(os.getenv("ADAPTIVE_TIMEOUT_MIN", "30"))
+ADAPTIVE_TIMEOUT_MAX = float(os.getenv("ADAPTIVE_TIMEOUT_MAX", "300"))
+# Latency samples persisted across restarts
+LATENCY_STATS_FILE = os.getenv("LATENCY_STATS_FILE", "data/latency_stats.json")
+
+# Detached council runs (see runs.py): events kept per run for resuming,
+# and seconds a finished run stays available
+RUN_EVENT_BUFFER = int(os.getenv("RUN_EVENT_BUFFER", "5000"))
+RUN_RETENTION = float(os.getenv("RUN_RETENTION", "600"))
+
+# Opt-in cache of model responses keyed on (model, prompt, temperature).
+# Repeated identical queries are answered from memory or disk instead of
+# calling the provider again. Off by default: a cache hit returns the same
+# text a new sample at temperature > 0 would not.
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "").strip().lower() in ("1", "true", "yes", "on")
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "86400"))  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Disk tier (set RESPONSE_CACHE_DIR to an empty string to keep the cache in memory only)
+RESPONSE_CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR", "data/response_cache")
+RESPONSE_CACHE_DISK_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Cache of web search results keyed on (provider, optimized query, result
+# count, full-content count, hybrid mode). News-like queries expire quickly;
+# everything else is reused for a day. Memory only unless SEARCH_CACHE_DIR is set.
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "86400"))
+SEARCH_CACHE_TTL_CURRENT_EVENT = float(os.getenv("SEARCH_CACHE_TTL_CURRENT_EVENT", "900"))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "256"))
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+SEARCH_CACHE_DIR = os.getenv("SEARCH_CACHE_DIR", "")
+SEARCH_CACHE_DISK_MAX_BYTES = int(os.getenv("SEARCH_CACHE_DISK_MAX_BYTES", str(64 * 1024 * 1024)))
+
+# Page content fetched through Jina Reader, keyed on URL and stored gzipped on
+# disk. Pages younger than PAGE_CACHE_MAX_AGE are served as-is; older ones are
+# revalidated (ETag / Last-Modified) or refetched.
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+PAGE_CACHE_DIR = os.getenv("PAGE_CACHE_DIR", "data/page_cache")
+PAGE_CACHE_MAX_AGE = float(os.getenv("PAGE_CACHE_MAX_AGE", "604800"))
+PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
 
 def get_openrouter_api_key() -> str:
     """Get OpenRouter API key from settings or environment."""
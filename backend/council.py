@@ -1,13 +1,19 @@
 """3-stage LLM Council orchestration."""
 
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional, AsyncIterator
 import asyncio
 import logging
+import time
 from . import openrouter
 from . import ollama_client
 from .config import get_council_models, get_chairman_model
 from .search import perform_web_search, SearchProvider
 from .settings import get_settings
+from .providers.streaming import ThinkTagSplitter
+from .response_cache import get_cache, cache_key
+from .providers.rate_limit import get_limiter, estimate_tokens
+from .latency import get_tracker, adaptive_timeout
+from .cancellation import CancelScope
 
 logger = logging.getLogger(__name__)
 
@@ -35,21 +41,254 @@ PROVIDERS = {
     "custom": CustomOpenAIProvider(),
 }
 
-def get_provider_for_model(model_id: str) -> Any:
-    """Determine the provider for a given model ID."""
+def get_provider_name(model_id: str) -> str:
+    """Determine the provider key (in PROVIDERS) for a given model ID."""
     if ":" in model_id:
         provider_name = model_id.split(":")[0]
         if provider_name in PROVIDERS:
-            return PROVIDERS[provider_name]
+            return provider_name
 
     # Default to OpenRouter for unprefixed models (legacy support)
-    return PROVIDERS["openrouter"]
+    return "openrouter"
+
+
+def get_provider_for_model(model_id: str) -> Any:
+    """Determine the provider for a given model ID."""
+    return PROVIDERS[get_provider_name(model_id)]
 
 
-async def query_model(model: str, messages: List[Dict[str, str]], timeout: float = 120.0, temperature: float = 0.7) -> Dict[str, Any]:
-    """Dispatch query to appropriate provider."""
+async def _query_one(model: str, messages: List[Dict[str, str]], timeout: Optional[float], temperature: float, stage: str) -> Dict[str, Any]:
+    """Query one model through the response cache and its provider's limiter."""
+    cache = get_cache()
+    key = None
+    if cache is not None:
+        key = cache_key(model, messages, temperature)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+    provider = get_provider_for_model(model)
+    provider_name = get_provider_name(model)
+    if timeout is None:
+        timeout = adaptive_timeout(provider_name, model, stage)
+
+    async def _timed_query():
+        started = time.monotonic()
+        response = await provider.query(model, messages, timeout, temperature)
+        if response and not response.get('error'):
+            get_tracker().record(provider_name, model, stage, "response", time.monotonic() - started)
+        return response
+
+    # Queue behind the provider's concurrency and rate limits (retrying 429s)
+    limiter = get_limiter(provider_name)
+    response = await limiter.call(_timed_query, estimate_tokens(messages))
+    if cache is not None:
+        await cache.put(key, response)
+    return response
+
+
+async def _stream_one(model: str, messages: List[Dict[str, str]], timeout: Optional[float], temperature: float, stage: str) -> AsyncIterator[Dict[str, Any]]:
+    """Stream one model through the response cache and its provider's limiter."""
+    cache = get_cache()
+    key = None
+    if cache is not None:
+        key = cache_key(model, messages, temperature)
+        cached = await cache.get(key)
+        if cached is not None:
+            if cached.get('reasoning') and isinstance(cached['reasoning'], str):
+                yield {"type": "reasoning", "content": cached['reasoning']}
+            if cached.get('content') and isinstance(cached['content'], str):
+                yield {"type": "delta", "content": cached['content']}
+            yield {"type": "done", "response": cached}
+            return
+
     provider = get_provider_for_model(model)
-    return await provider.query(model, messages, timeout, temperature)
+    provider_name = get_provider_name(model)
+    if timeout is None:
+        timeout = adaptive_timeout(provider_name, model, stage, streaming=True)
+    limiter = get_limiter(provider_name)
+    tracker = get_tracker()
+    started = None
+    first_token = True
+
+    def _open_stream():
+        nonlocal started
+        started = time.monotonic()
+        return provider.stream(model, messages, timeout, temperature)
+
+    async for event in limiter.stream(_open_stream, estimate_tokens(messages)):
+        if event["type"] == "done":
+            response = event["response"]
+            if response and not response.get('error'):
+                tracker.record(provider_name, model, stage, "response", time.monotonic() - started)
+            if cache is not None:
+                await cache.put(key, response)
+        elif first_token:
+            first_token = False
+            tracker.record(provider_name, model, stage, "first_token", time.monotonic() - started)
+        yield event
+
+
+def _hedge_delay(model: str, stage: str, kind: str) -> float:
+    """Seconds to wait on `model` before hedging: a percentile of its history, or the default."""
+    settings = get_settings()
+    observed = get_tracker().percentile(get_provider_name(model), model, stage, kind, settings.hedge_percentile)
+    if observed is None:
+        return settings.hedge_default_delay
+    return max(observed, settings.hedge_min_delay)
+
+
+def _is_success(response: Optional[Dict[str, Any]]) -> bool:
+    return bool(response) and not response.get('error')
+
+
+def _mark_hedged(response: Dict[str, Any], fallback: str) -> Dict[str, Any]:
+    return {**response, "hedged_by": fallback}
+
+
+async def query_model(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: Optional[float] = None,
+    temperature: float = 0.7,
+    fallback: Optional[str] = None,
+    stage: str = "default"
+) -> Dict[str, Any]:
+    """
+    Dispatch query to appropriate provider.
+
+    Latency is tracked per (provider, model, stage); without an explicit
+    timeout, each call gets one derived from that history (see
+    latency.adaptive_timeout).
+
+    With RESPONSE_CACHE enabled, identical queries are answered from the
+    response cache; those responses carry ``cache_hit: True``.
+
+    With a fallback model, the query is hedged: if `model` has not answered
+    within its usual latency (see _hedge_delay) or fails, the same query goes
+    to `fallback` and the first successful answer wins; the other request is
+    cancelled. Answers from the fallback carry ``hedged_by: <fallback>``.
+    """
+    if not fallback or fallback == model:
+        return await _query_one(model, messages, timeout, temperature, stage)
+
+    async def _safe_query(m: str) -> Dict[str, Any]:
+        try:
+            return await _query_one(m, messages, timeout, temperature, stage)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return {"error": True, "error_message": str(e)}
+
+    primary = asyncio.create_task(_safe_query(model))
+    backup = None
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=_hedge_delay(model, stage, "response"))
+        if done and _is_success(primary.result()):
+            return primary.result()
+
+        logger.info(f"Hedging {model} with {fallback}")
+        backup = asyncio.create_task(_safe_query(fallback))
+        pending = {backup} if done else {primary, backup}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if _is_success(task.result()):
+                    return task.result() if task is primary else _mark_hedged(task.result(), fallback)
+        # Both failed: report the primary model's error
+        return primary.result()
+    finally:
+        for task in (primary, backup):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+async def stream_model(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: Optional[float] = None,
+    temperature: float = 0.7,
+    fallback: Optional[str] = None,
+    stage: str = "default"
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Dispatch a streaming query to the appropriate provider (see LLMProvider.stream).
+
+    Timeouts and latency tracking work as in query_model().
+
+    Cached responses (see query_model) are replayed as a single reasoning
+    and delta event before 'done'.
+
+    With a fallback model, the stream is hedged like query_model(), using
+    time to first token: whichever model streams first (or the fallback, if
+    `model` fails before producing output) is passed through, and the other
+    stream is cancelled.
+    """
+    if not fallback or fallback == model:
+        async for event in _stream_one(model, messages, timeout, temperature, stage):
+            yield event
+        return
+
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def _pump(m: str):
+        try:
+            async for event in _stream_one(m, messages, timeout, temperature, stage):
+                queue.put_nowait((m, event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            queue.put_nowait((m, {"type": "done", "response": {"error": True, "error_message": str(e)}}))
+
+    loop = asyncio.get_running_loop()
+    hedge_at = loop.time() + _hedge_delay(model, stage, "first_token")
+    tasks = {model: asyncio.create_task(_pump(model))}
+    failed: Dict[str, Dict[str, Any]] = {}
+    winner = None
+
+    def _start_fallback():
+        logger.info(f"Hedging {model} with {fallback}")
+        tasks[fallback] = asyncio.create_task(_pump(fallback))
+
+    try:
+        while True:
+            # The hedge timer only runs until a model has produced output
+            timeout_left = None
+            if winner is None and fallback not in tasks:
+                timeout_left = max(hedge_at - loop.time(), 0.0)
+            try:
+                m, event = await asyncio.wait_for(queue.get(), timeout=timeout_left)
+            except asyncio.TimeoutError:
+                _start_fallback()
+                continue
+
+            if winner is None:
+                if event["type"] == "done" and not _is_success(event["response"]):
+                    # Failed before producing output: fall over to the other model if possible
+                    failed[m] = event
+                    if fallback not in tasks:
+                        _start_fallback()
+                    if len(failed) < len(tasks):
+                        continue
+                    event = failed[model]  # both failed: report the primary model's error
+                    m = model
+                winner = m
+                for other, task in tasks.items():
+                    if other != winner:
+                        task.cancel()
+            elif m != winner:
+                continue
+
+            if event["type"] == "done":
+                if winner == fallback and _is_success(event["response"]):
+                    event = {"type": "done", "response": _mark_hedged(event["response"], fallback)}
+                yield event
+                return
+            yield event
+    finally:
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
 
 
 async def query_models_parallel(models: List[str], messages: List[Dict[str, str]]) -> Dict[str, Any]:
@@ -82,18 +321,54 @@ async def query_models_parallel(models: List[str], messages: List[Dict[str, str]
     return dict(results)
 
 
-async def stage1_collect_responses(user_query: str, search_context: str = "", request: Any = None) -> Any:
+def _build_stage1_result(model: str, response: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Convert a provider response into a Stage 1 result entry."""
+    if response is None:
+        return None
+    if response.get('error'):
+        # Include failed models with error info
+        return {
+            "model": model,
+            "response": None,
+            "error": response.get('error'),
+            "error_message": response.get('error_message', 'Unknown error')
+        }
+    # Successful response - ensure content is always a string
+    content = response.get('content', '')
+    if not isinstance(content, str):
+        # Handle case where API returns non-string content (array, object, etc.)
+        content = str(content) if content is not None else ''
+    result = {
+        "model": model,
+        "response": content,
+        "error": None
+    }
+    if response.get('cache_hit'):
+        result["cache_hit"] = True
+    if response.get('hedged_by'):
+        result["hedged_by"] = response['hedged_by']
+    return result
+
+
+async def stage1_collect_responses(user_query: str, search_context: str = "", cancel_scope: Optional[CancelScope] = None, stream_tokens: bool = False) -> Any:
     """
     Stage 1: Collect individual responses from all council models.
 
     Args:
         user_query: The user's question
         search_context: Optional web search results to provide context
-        request: FastAPI request object for checking disconnects
+        cancel_scope: Scope the model tasks join, so a client disconnect cancels them
+        stream_tokens: Stream answers from providers and yield token deltas
+
+    With settings.stage1_quorum and/or stage1_soft_deadline set, the stage
+    ends early once that many successful answers arrived, or once the
+    deadline passed with at least one; the remaining seats are cancelled.
 
     Yields:
         - First yield: total_models (int)
+        - When stream_tokens is set: {'model', 'delta'} dicts with answer text chunks
         - Subsequent yields: Individual model results (dict)
+        - When the stage ended early: finally {'dropped': [models], 'reason': 'quorum' | 'deadline'}
     """
     settings = get_settings()
 
@@ -128,65 +403,99 @@ async def stage1_collect_responses(user_query: str, search_context: str = "", re
 
     council_temp = settings.council_temperature
 
+    # Model tasks publish ("delta", model, text) and ("result", model, response)
+    # items here, so token deltas from all seats are multiplexed in arrival order
+    queue: asyncio.Queue = asyncio.Queue()
+
+    # Optional backup model per seat for hedged requests
+    fallbacks = settings.council_fallbacks or {}
+
     async def _query_safe(m: str):
+        fallback = fallbacks.get(m) or None
         try:
-            return m, await query_model(m, messages, temperature=council_temp)
+            if stream_tokens:
+                response = None
+                async for event in stream_model(m, messages, temperature=council_temp, fallback=fallback, stage="stage1"):
+                    if event["type"] == "delta":
+                        queue.put_nowait(("delta", m, event["content"]))
+                    elif event["type"] == "done":
+                        response = event["response"]
+            else:
+                response = await query_model(m, messages, temperature=council_temp, fallback=fallback, stage="stage1")
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            return m, {"error": True, "error_message": str(e)}
+            response = {"error": True, "error_message": str(e)}
+        queue.put_nowait(("result", m, response))
 
     # Create tasks
-    tasks = [asyncio.create_task(_query_safe(m)) for m in models]
-    
-    # Process as they complete
-    pending = set(tasks)
+    tasks = {m: asyncio.create_task(_query_safe(m)) for m in models}
+    if cancel_scope:
+        for t in tasks.values():
+            cancel_scope.attach(t)
+
+    # Early exit: quorum of successful answers, or soft deadline (0 disables either)
+    quorum = settings.stage1_quorum
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.stage1_soft_deadline if settings.stage1_soft_deadline > 0 else None
+    succeeded = 0
+
+    # Process items as they arrive
+    pending_models = list(models)
     try:
-        while pending:
-            # Check for client disconnect
-            if request and await request.is_disconnected():
-                logger.info("Client disconnected during Stage 1. Cancelling tasks...")
-                for t in pending:
-                    t.cancel()
-                raise asyncio.CancelledError("Client disconnected")
-
-            # Wait for the next task to complete (with timeout to check for disconnects)
-            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED, timeout=1.0)
-
-            for task in done:
+        while pending_models:
+            # Wait for the next item (until the soft deadline, if any). Once the
+            # deadline has passed without a successful answer, wait for the next
+            # item without a timeout; the deadline is re-checked when it arrives.
+            timeout = None
+            if deadline is not None and not (succeeded == 0 and loop.time() >= deadline):
+                timeout = max(deadline - loop.time(), 0.0)
+            try:
+                items = [await asyncio.wait_for(queue.get(), timeout=timeout)]
+            except asyncio.TimeoutError:
+                items = []
+
+            # Drain whatever else is queued, merging consecutive deltas per model
+            while not queue.empty():
+                item = queue.get_nowait()
+                last = items[-1] if items else None
+                if last and item[0] == "delta" and last[0] == "delta" and last[1] == item[1]:
+                    items[-1] = ("delta", item[1], last[2] + item[2])
+                else:
+                    items.append(item)
+
+            for kind, model, payload in items:
+                if kind == "delta":
+                    yield {"model": model, "delta": payload}
+                    continue
+
+                pending_models.remove(model)
                 try:
-                    model, response = await task
-                    
-                    result = None
-                    if response is not None:
-                        if response.get('error'):
-                            # Include failed models with error info
-                            result = {
-                                "model": model,
-                                "response": None,
-                                "error": response.get('error'),
-                                "error_message": response.get('error_message', 'Unknown error')
-                            }
-                        else:
-                            # Successful response - ensure content is always a string
-                            content = response.get('content', '')
-                            if not isinstance(content, str):
-                                # Handle case where API returns non-string content (array, object, etc.)
-                                content = str(content) if content is not None else ''
-                            result = {
-                                "model": model,
-                                "response": content,
-                                "error": None
-                            }
-                    
+                    result = _build_stage1_result(model, payload)
                     if result:
+                        if not result.get('error'):
+                            succeeded += 1
                         yield result
-                except asyncio.CancelledError:
-                    raise
                 except Exception as e:
                     logger.error(f"Error processing Stage 1 task result: {e}")
 
+            # Proceed without the stragglers once the quorum or deadline is met
+            if pending_models and succeeded:
+                reason = None
+                if quorum > 0 and succeeded >= quorum:
+                    reason = "quorum"
+                elif deadline is not None and loop.time() >= deadline:
+                    reason = "deadline"
+                if reason:
+                    logger.info(f"Stage 1 {reason} reached; dropping {pending_models}")
+                    for m in pending_models:
+                        tasks[m].cancel()
+                    yield {"dropped": list(pending_models), "reason": reason}
+                    return
+
     except asyncio.CancelledError:
         # Ensure all tasks are cancelled if we get cancelled
-        for t in tasks:
+        for t in tasks.values():
             if not t.done():
                 t.cancel()
         raise
@@ -196,10 +505,13 @@ async def stage2_collect_rankings(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
     search_context: str = "",
-    request: Any = None
+    cancel_scope: Optional[CancelScope] = None
 ) -> Any: # Returns an async generator
     """
     Stage 2: Collect peer rankings from all council models.
+
+    The model tasks join `cancel_scope`, if given, so a client disconnect
+    cancels them.
     
     Yields:
         - First yield: label_to_model mapping (dict)
@@ -259,26 +571,22 @@ async def stage2_collect_rankings(
 
     async def _query_safe(m: str):
         try:
-            return m, await query_model(m, messages, temperature=stage2_temp)
+            return m, await query_model(m, messages, temperature=stage2_temp, stage="stage2")
         except Exception as e:
             return m, {"error": True, "error_message": str(e)}
 
     # Create tasks
     tasks = [asyncio.create_task(_query_safe(m)) for m in successful_models]
+    if cancel_scope:
+        for t in tasks:
+            cancel_scope.attach(t)
 
     # Process as they complete
     pending = set(tasks)
     try:
         while pending:
-            # Check for client disconnect
-            if request and await request.is_disconnected():
-                logger.info("Client disconnected during Stage 2. Cancelling tasks...")
-                for t in pending:
-                    t.cancel()
-                raise asyncio.CancelledError("Client disconnected")
-
-            # Wait for the next task to complete (with timeout to check for disconnects)
-            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED, timeout=1.0)
+            # Wait for the next task to complete
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
 
             for task in done:
                 try:
@@ -312,6 +620,8 @@ async def stage2_collect_rankings(
                                 "parsed_ranking": parsed,
                                 "error": None
                             }
+                            if response.get('cache_hit'):
+                                result["cache_hit"] = True
                     
                     if result:
                         yield result
@@ -328,23 +638,112 @@ async def stage2_collect_rankings(
         raise
 
 
-async def stage3_synthesize_final(
-    user_query: str,
-    stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]],
-    search_context: str = ""
-) -> Dict[str, Any]:
+class Stage2Pipeline:
     """
-    Stage 3: Chairman synthesizes final response.
+    Stage 2 started speculatively while Stage 1 is still running.
 
-    Args:
-        user_query: The original user query
-        stage1_results: Individual model responses from Stage 1
-        stage2_results: Rankings from Stage 2
+    Once settings.stage2_pipeline_quorum successful Stage 1 answers exist,
+    the models that gave them start ranking those answers. A later answer
+    arriving within settings.stage2_rerank_window seconds of that start
+    restarts the ranking over the larger set; answers after the window are
+    left out of Stage 2 (they still reach the chairman through Stage 1).
 
-    Returns:
-        Dict with 'model' and 'response' keys
+    Feed Stage 1 results to add_stage1_result(), then iterate rankings()
+    once Stage 1 is done; it yields exactly what stage2_collect_rankings()
+    would. Call cancel() if the turn is abandoned.
     """
+
+    def __init__(self, user_query: str, search_context: str = "", cancel_scope: Optional[CancelScope] = None):
+        settings = get_settings()
+        self.user_query = user_query
+        self.search_context = search_context
+        self.cancel_scope = cancel_scope
+        self.quorum = settings.stage2_pipeline_quorum
+        self.rerank_window = settings.stage2_rerank_window
+
+        self._stage1_results: List[Dict[str, Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._started_at = 0.0
+        self._items: List[Any] = []
+        self._changed = asyncio.Event()
+        self._final = False
+        self.restarts = 0
+
+    def _successful(self) -> List[Dict[str, Any]]:
+        return [r for r in self._stage1_results if not r.get('error')]
+
+    def _start(self):
+        if self._task is not None:
+            self._task.cancel()
+            self.restarts += 1
+        self._items = []
+        self._started_at = asyncio.get_running_loop().time()
+        self._task = asyncio.create_task(self._collect(list(self._stage1_results)))
+        if self.cancel_scope:
+            self.cancel_scope.attach(self._task)
+        self._task.add_done_callback(lambda _: self._changed.set())
+
+    async def _collect(self, stage1_results: List[Dict[str, Any]]):
+        items = self._items
+        async for item in stage2_collect_rankings(self.user_query, stage1_results, self.search_context, self.cancel_scope):
+            items.append(item)
+            self._changed.set()
+
+    def add_stage1_result(self, result: Dict[str, Any]):
+        """Record a Stage 1 result, starting or restarting the speculative ranking as needed."""
+        if self._final:
+            return
+        if self._task is not None:
+            elapsed = asyncio.get_running_loop().time() - self._started_at
+            if result.get('error') or elapsed > self.rerank_window:
+                return  # nothing new to rank, or too late to re-rank
+            self._stage1_results.append(result)
+            logger.info(f"Late Stage 1 answer from {result.get('model')}; re-ranking")
+            self._start()
+            return
+
+        self._stage1_results.append(result)
+        if len(self._successful()) >= self.quorum:
+            logger.info(f"Stage 1 quorum of {self.quorum} reached; starting Stage 2 early")
+            self._start()
+
+    @property
+    def ranked_models(self) -> List[str]:
+        """Models whose Stage 1 answers are being ranked."""
+        return [r['model'] for r in self._successful()]
+
+    async def rankings(self) -> AsyncIterator[Any]:
+        """Yield the Stage 2 items (label mapping first, then results) once Stage 1 is done."""
+        self._final = True
+        if self._task is None:
+            self._start()  # quorum never reached: rank whatever Stage 1 produced
+
+        index = 0
+        while True:
+            self._changed.clear()
+            while index < len(self._items):
+                yield self._items[index]
+                index += 1
+            if self._task.done():
+                self._task.result()  # surface errors from the ranking task
+                if index >= len(self._items):
+                    return
+                continue
+            await self._changed.wait()
+
+    def cancel(self):
+        """Stop the speculative ranking."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+
+def _build_stage3_messages(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    search_context: str = ""
+) -> List[Dict[str, str]]:
+    """Build the chairman prompt messages for Stage 3."""
     settings = get_settings()
 
     # Build comprehensive context for chairman (only include successful responses)
@@ -389,56 +788,144 @@ async def stage3_synthesize_final(
 
     if is_default_prompt:
         # If using default, split into System (Persona) and User (Data) for better adherence at low temp
-        messages = [
+        return [
             {"role": "system", "content": "You are the Chairman of an LLM Council. Your task is to synthesize the provided model responses into a single, comprehensive answer."},
             {"role": "user", "content": chairman_prompt}
         ]
-    else:
-        # If custom prompt, send as single User message to respect user's custom persona/structure
-        messages = [{"role": "user", "content": chairman_prompt}]
+    # If custom prompt, send as single User message to respect user's custom persona/structure
+    return [{"role": "user", "content": chairman_prompt}]
+
+
+def build_stage3_result(chairman_model: str, response: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Convert a chairman response into the Stage 3 result entry.
+
+    Also used to assemble a partial synthesis from streamed text when the
+    client disconnects mid-stream.
+    """
+    # Check for error in response
+    if response is None or response.get('error'):
+        error_msg = response.get('error_message', 'Unknown error') if response else 'No response received'
+        return {
+            "model": chairman_model,
+            "response": f"Error synthesizing final answer: {error_msg}",
+            "error": True,
+            "error_message": error_msg
+        }
+
+    # Combine reasoning and content if available
+    content = response.get('content') or ''
+    reasoning = response.get('reasoning') or response.get('reasoning_details') or ''
+    
+    final_response = content
+    if reasoning and not content:
+        # If only reasoning is provided (some reasoning models do this)
+        final_response = f"**Reasoning:**\n{reasoning}"
+    elif reasoning and content:
+        # If both are provided, prepend reasoning in a collapsible block or just prepend
+        # For now, we'll just prepend it clearly
+        final_response = f"<think>\n{reasoning}\n</think>\n\n{content}"
+
+    if not final_response:
+         final_response = "No response generated by the Chairman."
+
+    result = {
+        "model": chairman_model,
+        "response": final_response,
+        "error": False
+    }
+    if response.get('cache_hit'):
+        result["cache_hit"] = True
+    return result
+
+
+async def stage3_synthesize_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    search_context: str = ""
+) -> Dict[str, Any]:
+    """
+    Stage 3: Chairman synthesizes final response.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        stage2_results: Rankings from Stage 2
+
+    Returns:
+        Dict with 'model' and 'response' keys
+    """
+    messages = _build_stage3_messages(user_query, stage1_results, stage2_results, search_context)
 
     # Query the chairman model with error handling
     chairman_model = get_chairman_model()
-    chairman_temp = settings.chairman_temperature
+    chairman_temp = get_settings().chairman_temperature
 
     try:
-        response = await query_model(chairman_model, messages, temperature=chairman_temp)
-
-        # Check for error in response
-        if response is None or response.get('error'):
-            error_msg = response.get('error_message', 'Unknown error') if response else 'No response received'
-            return {
-                "model": chairman_model,
-                "response": f"Error synthesizing final answer: {error_msg}",
-                "error": True,
-                "error_message": error_msg
-            }
-
-        # Combine reasoning and content if available
-        content = response.get('content') or ''
-        reasoning = response.get('reasoning') or response.get('reasoning_details') or ''
-        
-        final_response = content
-        if reasoning and not content:
-            # If only reasoning is provided (some reasoning models do this)
-            final_response = f"**Reasoning:**\n{reasoning}"
-        elif reasoning and content:
-            # If both are provided, prepend reasoning in a collapsible block or just prepend
-            # For now, we'll just prepend it clearly
-            final_response = f"<think>\n{reasoning}\n</think>\n\n{content}"
-
-        if not final_response:
-             final_response = "No response generated by the Chairman."
+        response = await query_model(chairman_model, messages, temperature=chairman_temp, stage="stage3")
+        return build_stage3_result(chairman_model, response)
 
+    except Exception as e:
+        logger.error(f"Unexpected error in Stage 3 synthesis: {e}")
         return {
             "model": chairman_model,
-            "response": final_response,
-            "error": False
+            "response": f"Error: Unable to generate final synthesis due to unexpected error.",
+            "error": True,
+            "error_message": str(e)
         }
 
+
+async def stage3_stream_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    search_context: str = ""
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stage 3 with the chairman output streamed as it is generated.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        stage2_results: Rankings from Stage 2
+
+    Yields:
+        - {'model', 'delta'} dicts with answer text chunks
+        - {'model', 'reasoning'} dicts with reasoning chunks (native reasoning
+          fields and inline <think> blocks alike)
+        - Finally the same result dict stage3_synthesize_final() returns
+    """
+    messages = _build_stage3_messages(user_query, stage1_results, stage2_results, search_context)
+
+    chairman_model = get_chairman_model()
+    chairman_temp = get_settings().chairman_temperature
+    splitter = ThinkTagSplitter()
+
+    def _to_item(event: Dict[str, Any]) -> Dict[str, Any]:
+        key = "reasoning" if event["type"] == "reasoning" else "delta"
+        return {"model": chairman_model, key: event["content"]}
+
+    try:
+        response = None
+        async for event in stream_model(chairman_model, messages, temperature=chairman_temp, stage="stage3"):
+            if event["type"] == "delta":
+                for split_event in splitter.feed(event["content"]):
+                    yield _to_item(split_event)
+            elif event["type"] == "reasoning":
+                yield _to_item(event)
+            elif event["type"] == "done":
+                response = event["response"]
+        for split_event in splitter.flush():
+            yield _to_item(split_event)
+
+        yield build_stage3_result(chairman_model, response)
+
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
         logger.error(f"Unexpected error in Stage 3 synthesis: {e}")
-        return {
+        yield {
             "model": chairman_model,
             "response": f"Error: Unable to generate final synthesis due to unexpected error.",
             "error": True,
@@ -0,0 +1,197 @@
+"""Rolling latency statistics per (provider, model, stage).
+
+Council calls record how long each model took to answer ("response") and,
+when streaming, to produce its first token ("first_token"). Percentiles of
+those samples drive per-call timeouts (adaptive_timeout) and hedged
+requests (see council.query_model).
+
+Samples are saved to LATENCY_STATS_FILE at most once a minute and on
+shutdown, and loaded again on startup, so estimates survive restarts.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .config import (
+    LATENCY_STATS_FILE,
+    ADAPTIVE_TIMEOUTS,
+    ADAPTIVE_TIMEOUT_MULTIPLIER,
+    ADAPTIVE_TIMEOUT_MIN,
+    ADAPTIVE_TIMEOUT_MAX,
+)
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per key
+WINDOW = 100
+# Fewer samples than this are not enough to estimate a percentile
+MIN_SAMPLES = 5
+# Timeout used while a model has too little history
+DEFAULT_TIMEOUT = 120.0
+# Minimum seconds between saves
+SAVE_INTERVAL = 60.0
+
+# (provider, model, stage, kind)
+Key = Tuple[str, str, str, str]
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LatencyTracker:
+    """Keeps the last WINDOW latency samples per (provider, model, stage, kind)."""
+
+    def __init__(self, path: Optional[str] = None, window: int = WINDOW):
+        self.path = path
+        self.window = window
+        self._samples: Dict[Key, Deque[float]] = {}
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._saving = False
+
+    def record(self, provider: str, model: str, stage: str, kind: str, seconds: float):
+        """Add one observed latency."""
+        key = (provider, model, stage, kind)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(round(seconds, 3))
+        self._dirty = True
+        self._maybe_save()
+
+    def percentile(self, provider: str, model: str, stage: str, kind: str, q: float) -> Optional[float]:
+        """
+        The q-th quantile (0-1) of recent samples, or None with too little history.
+
+        Falls back to the model's samples across all stages when this stage
+        has too few (a model's speed mostly depends on the model, not the prompt).
+        """
+        samples = self._samples.get((provider, model, stage, kind))
+        if not samples or len(samples) < MIN_SAMPLES:
+            samples = [
+                s for (p, m, _, k), values in self._samples.items()
+                if p == provider and m == model and k == kind
+                for s in values
+            ]
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return _quantile(sorted(samples), q)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """p50/p95 and sample count per key (for diagnostics)."""
+        rows = []
+        for (provider, model, stage, kind), samples in sorted(self._samples.items()):
+            ordered = sorted(samples)
+            rows.append({
+                "provider": provider,
+                "model": model,
+                "stage": stage,
+                "kind": kind,
+                "count": len(ordered),
+                "p50": _quantile(ordered, 0.5),
+                "p95": _quantile(ordered, 0.95),
+            })
+        return rows
+
+    # Persistence
+
+    def load(self):
+        """Load saved samples, ignoring a missing or unreadable file."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            for entry in data.get("samples", []):
+                key = (entry["provider"], entry["model"], entry["stage"], entry["kind"])
+                self._samples[key] = deque(entry["values"][-self.window:], maxlen=self.window)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable latency stats {self.path}: {e}")
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": [
+                {"provider": p, "model": m, "stage": s, "kind": k, "values": list(values)}
+                for (p, m, s, k), values in self._samples.items()
+            ]
+        }
+
+    def _write(self, snapshot: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.path)
+
+    def _maybe_save(self):
+        """Write new samples in the background, at most every SAVE_INTERVAL seconds."""
+        if not self.path or self._saving or time.monotonic() - self._last_save < SAVE_INTERVAL:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._saving = True
+        self._dirty = False
+        self._last_save = time.monotonic()
+        future = loop.run_in_executor(None, self._write, self._snapshot())
+
+        def _done(f):
+            self._saving = False
+            if f.exception() is not None:
+                logger.warning(f"Could not save latency stats: {f.exception()}")
+        future.add_done_callback(_done)
+
+    def save(self):
+        """Write any unsaved samples now. Called on application shutdown."""
+        if not self.path or not self._dirty:
+            return
+        try:
+            self._write(self._snapshot())
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save latency stats: {e}")
+
+
+_tracker: Optional[LatencyTracker] = None
+
+
+def get_tracker() -> LatencyTracker:
+    """Get the shared latency tracker, loading saved samples on first use."""
+    global _tracker
+    if _tracker is None:
+        _tracker = LatencyTracker(LATENCY_STATS_FILE or None)
+        _tracker.load()
+    return _tracker
+
+
+def save():
+    """Persist the shared tracker's samples, if it was used. Called on application shutdown."""
+    if _tracker is not None:
+        _tracker.save()
+
+
+def adaptive_timeout(provider: str, model: str, stage: str, streaming: bool = False) -> float:
+    """
+    Per-call timeout from the model's observed latency.
+
+    ADAPTIVE_TIMEOUT_MULTIPLIER x p95 of full response time (or, when
+    streaming, of time to first token, since the HTTP read timeout applies
+    between chunks), clamped to [ADAPTIVE_TIMEOUT_MIN, ADAPTIVE_TIMEOUT_MAX].
+    DEFAULT_TIMEOUT while there is too little history.
+    """
+    if not ADAPTIVE_TIMEOUTS:
+        return DEFAULT_TIMEOUT
+    kind = "first_token" if streaming else "response"
+    p95 = get_tracker().percentile(provider, model, stage, kind, 0.95)
+    if p95 is None:
+        return DEFAULT_TIMEOUT
+    return min(max(p95 * ADAPTIVE_TIMEOUT_MULTIPLIER, ADAPTIVE_TIMEOUT_MIN), ADAPTIVE_TIMEOUT_MAX)
@@ -1,22 +1,59 @@
 """FastAPI backend for LLM Council."""
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+from contextlib import asynccontextmanager
 import os
 import uuid
-import json
+import hashlib
 import asyncio
 
 from . import storage
-from .council import generate_conversation_title, generate_search_query, stage1_collect_responses, stage2_collect_rankings, stage3_synthesize_final, calculate_aggregate_rankings, PROVIDERS
-from .search import perform_web_search, SearchProvider
-from .settings import get_settings, update_settings, Settings, DEFAULT_COUNCIL_MODELS, DEFAULT_CHAIRMAN_MODEL, AVAILABLE_MODELS
-
-app = FastAPI(title="LLM Council Plus API")
+from . import latency
+from . import runs
+from . import sse
+from .serialization import ORJSON_AVAILABLE
+from .storage import aio as async_storage
+from .cancellation import CancelScope
+from .council import generate_conversation_title, generate_search_query, stage1_collect_responses, stage2_collect_rankings, Stage2Pipeline, stage3_synthesize_final, stage3_stream_final, build_stage3_result, calculate_aggregate_rankings, PROVIDERS
+from .search import perform_web_search, SearchProvider, shutdown_search_executor
+from .settings import get_settings, pin_settings, update_settings, Settings, DEFAULT_COUNCIL_MODELS, DEFAULT_CHAIRMAN_MODEL, AVAILABLE_MODELS
+from .providers.http_client import close_clients, HTTP2_AVAILABLE
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    print(f"Provider HTTP clients: pooled per host (HTTP/2 {'enabled' if HTTP2_AVAILABLE else 'disabled, install h2 to enable'})")
+    migrated = storage.migrate()
+    if migrated:
+        print(f"Migrated {migrated} conversation(s) into the '{storage.get_backend().name}' storage backend")
+    yield
+    # Stop detached runs, saving their partial results
+    await runs.shutdown()
+    # Keep latency history for adaptive timeouts across restarts
+    latency.save()
+    # Release pooled provider connections
+    await close_clients()
+    # Abandon in-flight DuckDuckGo searches
+    shutdown_search_executor()
+    # Let queued storage writes finish before closing the backend
+    async_storage.shutdown()
+    storage.close()
+
+
+# orjson renders large conversation payloads several times faster, when installed
+DefaultJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+app = FastAPI(
+    title="LLM Council Plus API",
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
+)
 
 FRONTEND_DIST_DIR = os.getenv(
     "FRONTEND_DIST_DIR",
@@ -39,6 +76,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Sync-Cursor"],
 )
 
 
@@ -52,6 +90,13 @@ class SendMessageRequest(BaseModel):
     content: str
     web_search: bool = False
     execution_mode: str = "full"  # 'chat_only', 'chat_ranking', 'full'
+    stream_tokens: bool = True  # Emit stage1_delta events with partial model output
+    detach: bool = False  # Run in the background; resume via /api/runs/{run_id}/events
+    # Event protocol: 1 repeats full results in *_complete events, 2 (compact)
+    # sends only model lists and aggregates there, as results already went out
+    # in the *_progress events
+    protocol: int = 1
+    compress: bool = False  # gzip/brotli-compress the stream (per Accept-Encoding)
 
 
 class ConversationMetadata(BaseModel):
@@ -60,6 +105,14 @@ class ConversationMetadata(BaseModel):
     created_at: str
     title: str
     message_count: int
+    updated_at: Optional[str] = None
+
+
+class ConversationChanges(BaseModel):
+    """Conversation list delta returned for `since` requests."""
+    updated: List[ConversationMetadata]
+    deleted: List[str]
+    cursor: str
 
 
 class Conversation(BaseModel):
@@ -79,6 +132,12 @@ async def health_check():
     return {"status": "ok", "service": "LLM Council API"}
 
 
+@app.get("/api/latency")
+async def get_latency_stats():
+    """Observed p50/p95 latencies per provider, model and stage (drive adaptive timeouts and hedging)."""
+    return latency.get_tracker().summary()
+
+
 @app.get("/")
 async def root():
     """Serve the frontend when built, otherwise return a basic health check."""
@@ -88,33 +147,78 @@ async def root():
     return {"status": "ok", "service": "LLM Council API"}
 
 
-@app.get("/api/conversations", response_model=List[ConversationMetadata])
-async def list_conversations():
-    """List all conversations (metadata only)."""
-    return storage.list_conversations()
+@app.get("/api/conversations", response_model=Union[List[ConversationMetadata], ConversationChanges])
+async def list_conversations(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    before: Optional[str] = None,
+    since: Optional[str] = None,
+):
+    """
+    List conversations (metadata only), newest first.
+
+    - limit/before: cursor pagination; pass the last entry's created_at as
+      `before` to fetch the next page
+    - since: return only conversations changed and ids deleted after this
+      sync cursor (from a previous response's X-Sync-Cursor header)
+
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
+    # Taken before reading, so writes racing with this request show up in the next delta
+    cursor = storage.now_iso()
+    version = await async_storage.listing_version()
+    etag = '"' + hashlib.sha1(f"{version}|{limit}|{before}|{since}".encode()).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Sync-Cursor": cursor}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    if since:
+        updated, deleted = await async_storage.list_changes(since)
+        content = {"updated": updated, "deleted": deleted, "cursor": cursor}
+    else:
+        content = await async_storage.list_conversations(limit=limit, before=before)
+    return DefaultJSONResponse(content=content, headers=headers)
 
 
 @app.post("/api/conversations", response_model=Conversation)
 async def create_conversation(request: CreateConversationRequest):
     """Create a new conversation."""
     conversation_id = str(uuid.uuid4())
-    conversation = storage.create_conversation(conversation_id)
+    conversation = await async_storage.create_conversation(conversation_id)
     return conversation
 
 
 @app.get("/api/conversations/{conversation_id}", response_model=Conversation)
-async def get_conversation(conversation_id: str):
-    """Get a specific conversation with all its messages."""
-    conversation = storage.get_conversation(conversation_id)
+async def get_conversation(conversation_id: str, view: str = Query("full", pattern="^(full|summary)$")):
+    """
+    Get a specific conversation with all its messages.
+
+    With view=summary, assistant messages carry only the final answer and
+    light metadata; those marked `summary: true` can be fetched in full from
+    /api/conversations/{id}/messages/{index}.
+    """
+    conversation = await async_storage.get_conversation(conversation_id, summary=(view == "summary"))
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return conversation
 
 
+@app.get("/api/conversations/{conversation_id}/messages/{index}")
+async def get_conversation_message(conversation_id: str, index: int):
+    """Get one full message (all stages and metadata) of a conversation."""
+    if index < 0:
+        raise HTTPException(status_code=404, detail="Message not found")
+    message = await async_storage.get_message(conversation_id, index)
+    if message is None:
+        raise HTTPException(status_code=404, detail="Message not found")
+    return message
+
+
 @app.delete("/api/conversations/{conversation_id}")
 async def delete_conversation(conversation_id: str):
     """Delete a conversation."""
-    deleted = storage.delete_conversation(conversation_id)
+    deleted = await async_storage.delete_conversation(conversation_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {"status": "deleted"}
@@ -131,28 +235,87 @@ async def send_message_stream(conversation_id: str, body: SendMessageRequest, re
             detail=f"Invalid execution_mode. Must be one of: {valid_modes}"
         )
     
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    # Check if conversation exists (metadata only, history is not needed here)
+    conversation = await async_storage.get_conversation_meta(conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
     # Check if this is the first message
-    is_first_message = len(conversation["messages"]) == 0
+    is_first_message = conversation["message_count"] == 0
+
+    async def event_generator(cancel_scope: Optional[CancelScope] = None):
+        # Everything this turn starts is cancelled together: when the client
+        # disconnects, or for detached runs, when the run is cancelled
+        if cancel_scope is None:
+            cancel_scope = CancelScope()
+            cancel_scope.watch_disconnect(request)
+        cancel_scope.attach(asyncio.current_task())
+        # Chairman text streamed so far, saved if the client disconnects mid-synthesis
+        stage3_partial = None
+        # Set once the assistant message is written, so a late cancellation doesn't save it twice
+        assistant_saved = False
+        # Stage 2 started during Stage 1 (pipelined mode), cancelled if the turn ends early
+        stage2_pipeline = None
+        # Full-content search fetches still running (progressive search mode)
+        content_task = None
+
+        def take_search_content():
+            """Swap in the full-content search context once its fetches have landed; returns an event or None."""
+            nonlocal search_context, content_task
+            if content_task is None or not content_task.done():
+                return None
+            task, content_task = content_task, None
+            if task.cancelled() or task.exception() or not task.result():
+                return None
+            search_context = task.result()
+            # A pipelined Stage 2 that has not started ranking yet picks it up too
+            if stage2_pipeline:
+                stage2_pipeline.search_context = search_context
+            return sse.event({'type': 'search_content', 'data': {'search_context': search_context}})
+
+        def assistant_message_args():
+            """Build storage.add_assistant_message() arguments from the generator's current state."""
+            metadata = {
+                "execution_mode": body.execution_mode,  # Save mode for historical context
+            }
+        
+            # Only include stage2/stage3 metadata if they were executed
+            if body.execution_mode in ["chat_ranking", "full"]:
+                metadata["label_to_model"] = label_to_model
+                metadata["aggregate_rankings"] = aggregate_rankings
+        
+            if search_context:
+                metadata["search_context"] = search_context
+            if search_query:
+                metadata["search_query"] = search_query
+            if stage1_dropped:
+                metadata["stage1_dropped"] = stage1_dropped
+
+            return (
+                conversation_id,
+                stage1_results,
+                stage2_results if body.execution_mode in ["chat_ranking", "full"] else None,
+                stage3_result if body.execution_mode == "full" else None,
+                metadata
+            )
 
-    async def event_generator():
         try:
+            # Pin one settings snapshot so every stage of this turn sees the same config
+            pin_settings()
+
             # Initialize variables for metadata
             stage1_results = []
+            stage1_dropped = None  # {'models', 'reason'} when Stage 1 ended early
             stage2_results = []
             stage3_result = None
             label_to_model = {}
             aggregate_rankings = {}
+            title_task = None
             
             # Add user message
-            storage.add_user_message(conversation_id, body.content)
+            await async_storage.add_user_message(conversation_id, body.content)
 
             # Start title generation in parallel (don't await yet)
-            title_task = None
             if is_first_message:
                 title_task = asyncio.create_task(generate_conversation_title(body.content))
 
@@ -160,11 +323,6 @@ async def send_message_stream(conversation_id: str, body: SendMessageRequest, re
             search_context = ""
             search_query = ""
             if body.web_search:
-                # Check for disconnect before starting search
-                if await request.is_disconnected():
-                    print("Client disconnected before web search")
-                    raise asyncio.CancelledError("Client disconnected")
-
                 settings = get_settings()
                 provider = SearchProvider(settings.search_provider)
 
@@ -176,21 +334,11 @@ async def send_message_stream(conversation_id: str, body: SendMessageRequest, re
                 if settings.brave_api_key and provider == SearchProvider.BRAVE:
                     os.environ["BRAVE_API_KEY"] = settings.brave_api_key
 
-                yield f"data: {json.dumps({'type': 'search_start', 'data': {'provider': provider.value}})}\n\n"
-
-                # Check for disconnect before generating search query
-                if await request.is_disconnected():
-                    print("Client disconnected during search setup")
-                    raise asyncio.CancelledError("Client disconnected")
+                yield sse.event({'type': 'search_start', 'data': {'provider': provider.value}})
 
                 # Generate search query (passthrough - no AI model needed)
                 search_query = generate_search_query(body.content)
 
-                # Check for disconnect before performing search
-                if await request.is_disconnected():
-                    print("Client disconnected before search execution")
-                    raise asyncio.CancelledError("Client disconnected")
-
                 # Run search (now fully async for Tavily/Brave, threaded only for DuckDuckGo)
                 search_result = await perform_web_search(
                     search_query, 
@@ -198,53 +346,81 @@ async def send_message_stream(conversation_id: str, body: SendMessageRequest, re
                     provider, 
                     settings.full_content_results,
                     settings.search_keyword_extraction,
-                    hybrid_mode=settings.search_hybrid_mode  # Combine web+news for DuckDuckGo
+                    hybrid_mode=settings.search_hybrid_mode,  # Combine web+news for DuckDuckGo
+                    # Stage 1 starts on ranked snippets; full content follows when fetched
+                    defer_content=settings.search_progressive_content
                 )
                 search_context = search_result["results"]
+                content_task = search_result.get("content_task")
+                if content_task:
+                    cancel_scope.attach(content_task)
                 extracted_query = search_result["extracted_query"]
                 search_intent = search_result.get("intent", "unknown")
-                yield f"data: {json.dumps({'type': 'search_complete', 'data': {'search_query': search_query, 'extracted_query': extracted_query, 'search_context': search_context, 'provider': provider.value, 'intent': search_intent}})}\n\n"
-                await asyncio.sleep(0.05)
+                yield sse.event({'type': 'search_complete', 'data': {'search_query': search_query, 'extracted_query': extracted_query, 'search_context': search_context, 'provider': provider.value, 'intent': search_intent}})
 
             # Stage 1: Collect responses
-            yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
-            await asyncio.sleep(0.05)
+            yield sse.event({'type': 'stage1_start'})
             
             total_models = 0
+
+            # Pipelined mode: rank early answers while slower models are still answering
+            if body.execution_mode in ["chat_ranking", "full"] and get_settings().stage2_pipeline_quorum > 0:
+                stage2_pipeline = Stage2Pipeline(body.content, search_context, cancel_scope)
             
-            async for item in stage1_collect_responses(body.content, search_context, request):
+            async for item in stage1_collect_responses(body.content, search_context, cancel_scope, stream_tokens=body.stream_tokens):
                 if isinstance(item, int):
                     total_models = item
                     print(f"DEBUG: Sending stage1_init with total={total_models}")
-                    yield f"data: {json.dumps({'type': 'stage1_init', 'total': total_models})}\n\n"
+                    yield sse.event({'type': 'stage1_init', 'total': total_models})
+                    continue
+
+                # Partial output from a model that is still answering
+                if 'delta' in item:
+                    yield sse.event({'type': 'stage1_delta', 'model': item['model'], 'delta': item['delta']})
+                    continue
+
+                # Quorum or soft deadline reached; these seats were cancelled
+                if 'dropped' in item:
+                    stage1_dropped = {"models": item['dropped'], "reason": item['reason']}
                     continue
                 
                 stage1_results.append(item)
-                yield f"data: {json.dumps({'type': 'stage1_progress', 'data': item, 'count': len(stage1_results), 'total': total_models})}\n\n"
-                await asyncio.sleep(0.01)
+                if stage2_pipeline:
+                    stage2_pipeline.add_stage1_result(item)
+                yield sse.event({'type': 'stage1_progress', 'data': item, 'count': len(stage1_results), 'total': total_models})
 
-            yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results})}\n\n"
-            await asyncio.sleep(0.05)
+                if event := take_search_content():
+                    yield event
+
+            if body.protocol >= 2:
+                yield sse.event({'type': 'stage1_complete', 'models': [r['model'] for r in stage1_results], 'dropped': stage1_dropped})
+            else:
+                yield sse.event({'type': 'stage1_complete', 'data': stage1_results, 'dropped': stage1_dropped})
 
             # Check if any models responded successfully in Stage 1
             if not any(r for r in stage1_results if not r.get('error')):
                 error_msg = 'All models failed to respond in Stage 1, likely due to rate limits or API errors. Please try again or adjust your model selection.'
-                storage.add_error_message(conversation_id, error_msg)
-                yield f"data: {json.dumps({'type': 'error', 'message': error_msg})}\n\n"
+                await async_storage.add_error_message(conversation_id, error_msg)
+                yield sse.event({'type': 'error', 'message': error_msg})
                 return # Stop further processing
 
             # Stage 2: Only if mode is 'chat_ranking' or 'full'
             if body.execution_mode in ["chat_ranking", "full"]:
-                yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-                await asyncio.sleep(0.05)
+                if event := take_search_content():
+                    yield event
+                yield sse.event({'type': 'stage2_start'})
                 
                 # Iterate over the async generator
-                async for item in stage2_collect_rankings(body.content, stage1_results, search_context, request):
+                if stage2_pipeline:
+                    stage2_items = stage2_pipeline.rankings()
+                else:
+                    stage2_items = stage2_collect_rankings(body.content, stage1_results, search_context, cancel_scope)
+                async for item in stage2_items:
                     # First item is the label mapping
                     if isinstance(item, dict) and not item.get('model'):
                         label_to_model = item
                         # Send init event with total count
-                        yield f"data: {json.dumps({'type': 'stage2_init', 'total': len(label_to_model)})}\n\n"
+                        yield sse.event({'type': 'stage2_init', 'total': len(label_to_model)})
                         continue
                     
                     # Subsequent items are results
@@ -252,88 +428,160 @@ async def send_message_stream(conversation_id: str, body: SendMessageRequest, re
                     
                     # Send progress update
                     print(f"Stage 2 Progress: {len(stage2_results)}/{len(label_to_model)} - {item['model']}")
-                    yield f"data: {json.dumps({'type': 'stage2_progress', 'data': item, 'count': len(stage2_results), 'total': len(label_to_model)})}\n\n"
-                    await asyncio.sleep(0.01)
+                    yield sse.event({'type': 'stage2_progress', 'data': item, 'count': len(stage2_results), 'total': len(label_to_model)})
 
                 aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-                yield f"data: {json.dumps({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings, 'search_query': search_query, 'search_context': search_context}})}\n\n"
-                await asyncio.sleep(0.05)
+                if body.protocol >= 2:
+                    # search_context already went out with search_complete
+                    yield sse.event({'type': 'stage2_complete', 'models': [r['model'] for r in stage2_results], 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings, 'search_query': search_query}})
+                else:
+                    yield sse.event({'type': 'stage2_complete', 'data': stage2_results, 'metadata': {'label_to_model': label_to_model, 'aggregate_rankings': aggregate_rankings, 'search_query': search_query, 'search_context': search_context}})
 
             # Stage 3: Only if mode is 'full'
             if body.execution_mode == "full":
-                yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-                await asyncio.sleep(0.05)
-
-                # Check for disconnect before starting Stage 3
-                if await request.is_disconnected():
-                    print("Client disconnected before Stage 3")
-                    raise asyncio.CancelledError("Client disconnected")
-
-                stage3_result = await stage3_synthesize_final(body.content, stage1_results, stage2_results, search_context)
-                yield f"data: {json.dumps({'type': 'stage3_complete', 'data': stage3_result})}\n\n"
+                if event := take_search_content():
+                    yield event
+                yield sse.event({'type': 'stage3_start'})
+
+                if body.stream_tokens:
+                    stage3_partial = {"model": None, "content": [], "reasoning": []}
+                    async for item in stage3_stream_final(body.content, stage1_results, stage2_results, search_context):
+                        if 'delta' in item:
+                            stage3_partial["model"] = item['model']
+                            stage3_partial["content"].append(item['delta'])
+                            yield sse.event({'type': 'stage3_delta', 'model': item['model'], 'delta': item['delta']})
+                            continue
+                        if 'reasoning' in item:
+                            stage3_partial["model"] = item['model']
+                            stage3_partial["reasoning"].append(item['reasoning'])
+                            yield sse.event({'type': 'stage3_reasoning', 'model': item['model'], 'delta': item['reasoning']})
+                            continue
+                        stage3_result = item
+                    stage3_partial = None
+                else:
+                    stage3_result = await stage3_synthesize_final(body.content, stage1_results, stage2_results, search_context)
+                yield sse.event({'type': 'stage3_complete', 'data': stage3_result})
 
             # Wait for title generation if it was started
             if title_task:
                 try:
                     title = await title_task
-                    storage.update_conversation_title(conversation_id, title)
-                    yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                    await async_storage.update_conversation_title(conversation_id, title)
+                    yield sse.event({'type': 'title_complete', 'data': {'title': title}})
                 except Exception as e:
                     print(f"Error waiting for title task: {e}")
 
-            # Save complete assistant message with metadata
-            metadata = {
-                "execution_mode": body.execution_mode,  # Save mode for historical context
-            }
-            
-            # Only include stage2/stage3 metadata if they were executed
-            if body.execution_mode in ["chat_ranking", "full"]:
-                metadata["label_to_model"] = label_to_model
-                metadata["aggregate_rankings"] = aggregate_rankings
-            
-            if search_context:
-                metadata["search_context"] = search_context
-            if search_query:
-                metadata["search_query"] = search_query
+            # Store the fullest search context that has landed
+            if event := take_search_content():
+                yield event
 
-            storage.add_assistant_message(
-                conversation_id,
-                stage1_results,
-                stage2_results if body.execution_mode in ["chat_ranking", "full"] else None,
-                stage3_result if body.execution_mode == "full" else None,
-                metadata
-            )
+            # Save complete assistant message with metadata (shielded: a cancellation
+            # arriving now must not drop it, and the cancel path won't save it again)
+            assistant_saved = True
+            await asyncio.shield(async_storage.add_assistant_message(*assistant_message_args()))
 
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield sse.event({'type': 'complete'})
 
         except asyncio.CancelledError:
             print(f"Stream cancelled for conversation {conversation_id}")
+            # Keep what the turn produced so far rather than dropping it: Stage 1
+            # answers, Stage 2 rankings and a partially streamed synthesis
+            if not assistant_saved:
+                try:
+                    if stage3_partial and (stage3_partial["content"] or stage3_partial["reasoning"]):
+                        stage3_result = build_stage3_result(stage3_partial["model"], {
+                            "content": "".join(stage3_partial["content"]),
+                            "reasoning": "".join(stage3_partial["reasoning"]),
+                        })
+                        stage3_result["partial"] = True
+                    if stage1_results or stage2_results or stage3_result:
+                        args = assistant_message_args()
+                        args[-1]["partial"] = True
+                        # Queued rather than awaited: awaiting here would be cancelled too
+                        async_storage.submit(storage.add_assistant_message, *args)
+                        print("Saved partial results after cancellation")
+                except Exception as e:
+                    print(f"Could not save partial results: {e}")
             # Even if cancelled, try to save the title if it's ready or nearly ready
             if title_task:
                 try:
                     # Give it a small grace period to finish if it's close
                     title = await asyncio.wait_for(title_task, timeout=2.0)
-                    storage.update_conversation_title(conversation_id, title)
+                    async_storage.submit(storage.update_conversation_title, conversation_id, title)
                     print(f"Saved title despite cancellation: {title}")
                 except Exception as e:
                     print(f"Could not save title during cancellation: {e}")
+            # A disconnect (or run cancellation) ended this turn; nobody is left to stream to
+            if cancel_scope.cancelled:
+                task = asyncio.current_task()
+                if hasattr(task, "uncancel"):
+                    task.uncancel()  # handled here; don't leave the cancellation pending (3.11+)
+                return
             raise
         except Exception as e:
             print(f"Stream error: {e}")
             # Save error to conversation history
-            storage.add_error_message(conversation_id, f"Error: {str(e)}")
+            await async_storage.add_error_message(conversation_id, f"Error: {str(e)}")
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
-    )
+            yield sse.event({'type': 'error', 'message': str(e)})
+        finally:
+            cancel_scope.close()
+            if stage2_pipeline:
+                stage2_pipeline.cancel()
+
+    if body.detach:
+        # Keeps running if this connection drops; the client resumes from the run's event stream
+        run = runs.start_run(conversation_id, event_generator)
+        events = run.events()
+    else:
+        events = event_generator()
+
+    return event_stream_response(events, request, body.compress)
+
+
+def event_stream_response(events, request: Request, compress: bool = False) -> StreamingResponse:
+    """SSE response for `events`, compressed when asked for and the client accepts gzip/br."""
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+    }
+    encoding = sse.negotiate_encoding(request.headers.get("accept-encoding", "")) if compress else None
+    if encoding:
+        events = sse.compress(events, encoding)
+        headers["Content-Encoding"] = encoding
+        headers["Vary"] = "Accept-Encoding"
+
+    return StreamingResponse(events, media_type="text/event-stream", headers=headers)
+
+
+@app.get("/api/runs/{run_id}/events")
+async def get_run_events(
+    run_id: str,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, ge=0),
+    compress: bool = False,
+):
+    """Stream a detached run's events after last_event_id (or the Last-Event-ID header)."""
+    run = runs.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    if last_event_id is None:
+        header = request.headers.get("last-event-id", "")
+        last_event_id = int(header) if header.isdigit() else 0
+
+    return event_stream_response(run.events(last_event_id), request, compress)
+
+
+@app.delete("/api/runs/{run_id}")
+async def cancel_run(run_id: str):
+    """Cancel a detached run; what it produced so far is saved."""
+    run = runs.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    run.cancel()
+    return {"status": "cancelled" if not run.done else "finished"}
 
 
 class UpdateSettingsRequest(BaseModel):
@@ -342,6 +590,7 @@ class UpdateSettingsRequest(BaseModel):
     search_keyword_extraction: Optional[str] = None
     ollama_base_url: Optional[str] = None
     full_content_results: Optional[int] = None
+    search_progressive_content: Optional[bool] = None
 
     # Custom OpenAI-compatible endpoint
     custom_endpoint_name: Optional[str] = None
@@ -378,6 +627,18 @@ class UpdateSettingsRequest(BaseModel):
     chairman_temperature: Optional[float] = None
     stage2_temperature: Optional[float] = None
 
+    # Stage 1 early exit
+    stage1_quorum: Optional[int] = None
+    stage1_soft_deadline: Optional[float] = None
+    stage2_pipeline_quorum: Optional[int] = None
+    stage2_rerank_window: Optional[float] = None
+
+    # Hedged requests
+    council_fallbacks: Optional[Dict[str, str]] = None
+    hedge_percentile: Optional[float] = None
+    hedge_min_delay: Optional[float] = None
+    hedge_default_delay: Optional[float] = None
+
     # Execution Mode
     execution_mode: Optional[str] = None
 
@@ -393,15 +654,14 @@ class TestTavilyRequest(BaseModel):
     api_key: str | None = None
 
 
-@app.get("/api/settings")
-async def get_app_settings():
-    """Get current application settings."""
-    settings = get_settings()
+def settings_response(settings: Settings) -> Dict[str, Any]:
+    """The settings as sent to the frontend by GET and PUT /api/settings (API keys only as *_set flags)."""
     return {
         "search_provider": settings.search_provider,
         "search_keyword_extraction": settings.search_keyword_extraction,
         "ollama_base_url": settings.ollama_base_url,
         "full_content_results": settings.full_content_results,
+        "search_progressive_content": settings.search_progressive_content,
 
         # Custom Endpoint
         "custom_endpoint_name": settings.custom_endpoint_name,
@@ -439,6 +699,18 @@ async def get_app_settings():
         "chairman_temperature": settings.chairman_temperature,
         "stage2_temperature": settings.stage2_temperature,
 
+        # Stage 1 early exit
+        "stage1_quorum": settings.stage1_quorum,
+        "stage1_soft_deadline": settings.stage1_soft_deadline,
+        "stage2_pipeline_quorum": settings.stage2_pipeline_quorum,
+        "stage2_rerank_window": settings.stage2_rerank_window,
+
+        # Hedged requests
+        "council_fallbacks": settings.council_fallbacks,
+        "hedge_percentile": settings.hedge_percentile,
+        "hedge_min_delay": settings.hedge_min_delay,
+        "hedge_default_delay": settings.hedge_default_delay,
+
         # Prompts
         "stage1_prompt": settings.stage1_prompt,
         "stage2_prompt": settings.stage2_prompt,
@@ -446,6 +718,12 @@ async def get_app_settings():
     }
 
 
+@app.get("/api/settings")
+async def get_app_settings():
+    """Get current application settings."""
+    return settings_response(get_settings())
+
+
 
 @app.get("/api/settings/defaults")
 async def get_default_settings():
@@ -510,6 +788,8 @@ async def update_app_settings(request: UpdateSettingsRequest):
                 detail="full_content_results must be between 0 and 10"
             )
         updates["full_content_results"] = request.full_content_results
+    if request.search_progressive_content is not None:
+        updates["search_progressive_content"] = request.search_progressive_content
 
     # Prompt updates
     if request.stage1_prompt is not None:
@@ -595,6 +875,54 @@ async def update_app_settings(request: UpdateSettingsRequest):
     if request.stage2_temperature is not None:
         updates["stage2_temperature"] = request.stage2_temperature
 
+    # Stage 1 early exit
+    if request.stage1_quorum is not None:
+        if request.stage1_quorum < 0:
+            raise HTTPException(status_code=400, detail="stage1_quorum must be 0 or greater")
+        updates["stage1_quorum"] = request.stage1_quorum
+    if request.stage1_soft_deadline is not None:
+        if request.stage1_soft_deadline < 0 or request.stage1_soft_deadline > 600:
+            raise HTTPException(
+                status_code=400,
+                detail="stage1_soft_deadline must be between 0 and 600 seconds"
+            )
+        updates["stage1_soft_deadline"] = request.stage1_soft_deadline
+    if request.stage2_pipeline_quorum is not None:
+        if request.stage2_pipeline_quorum == 1 or request.stage2_pipeline_quorum < 0:
+            raise HTTPException(
+                status_code=400,
+                detail="stage2_pipeline_quorum must be 0 (off) or at least 2"
+            )
+        updates["stage2_pipeline_quorum"] = request.stage2_pipeline_quorum
+    if request.stage2_rerank_window is not None:
+        if request.stage2_rerank_window < 0 or request.stage2_rerank_window > 600:
+            raise HTTPException(
+                status_code=400,
+                detail="stage2_rerank_window must be between 0 and 600 seconds"
+            )
+        updates["stage2_rerank_window"] = request.stage2_rerank_window
+
+    # Hedged requests
+    if request.council_fallbacks is not None:
+        # Drop cleared entries and members hedged with themselves
+        updates["council_fallbacks"] = {
+            model: fallback
+            for model, fallback in request.council_fallbacks.items()
+            if fallback and fallback != model
+        }
+    if request.hedge_percentile is not None:
+        if request.hedge_percentile < 0.5 or request.hedge_percentile > 0.99:
+            raise HTTPException(status_code=400, detail="hedge_percentile must be between 0.5 and 0.99")
+        updates["hedge_percentile"] = request.hedge_percentile
+    if request.hedge_min_delay is not None:
+        if request.hedge_min_delay < 0:
+            raise HTTPException(status_code=400, detail="hedge_min_delay must be 0 or greater")
+        updates["hedge_min_delay"] = request.hedge_min_delay
+    if request.hedge_default_delay is not None:
+        if request.hedge_default_delay < 0:
+            raise HTTPException(status_code=400, detail="hedge_default_delay must be 0 or greater")
+        updates["hedge_default_delay"] = request.hedge_default_delay
+
     # Prompts   # Execution Mode
     if request.execution_mode is not None:
         valid_modes = ["chat_only", "chat_ranking", "full"]
@@ -610,46 +938,7 @@ async def update_app_settings(request: UpdateSettingsRequest):
     else:
         settings = get_settings()
 
-    return {
-        "search_provider": settings.search_provider,
-        "search_keyword_extraction": settings.search_keyword_extraction,
-        "ollama_base_url": settings.ollama_base_url,
-        "full_content_results": settings.full_content_results,
-
-        # Custom Endpoint
-        "custom_endpoint_name": settings.custom_endpoint_name,
-        "custom_endpoint_url": settings.custom_endpoint_url,
-
-        # API Key Status
-        "serper_api_key_set": bool(settings.serper_api_key),
-        "tavily_api_key_set": bool(settings.tavily_api_key),
-        "brave_api_key_set": bool(settings.brave_api_key),
-        "openrouter_api_key_set": bool(settings.openrouter_api_key),
-        "openai_api_key_set": bool(settings.openai_api_key),
-        "anthropic_api_key_set": bool(settings.anthropic_api_key),
-        "google_api_key_set": bool(settings.google_api_key),
-        "mistral_api_key_set": bool(settings.mistral_api_key),
-        "deepseek_api_key_set": bool(settings.deepseek_api_key),
-        "groq_api_key_set": bool(settings.groq_api_key),
-        "custom_endpoint_api_key_set": bool(settings.custom_endpoint_api_key),
-
-        # Enabled Providers
-        "enabled_providers": settings.enabled_providers,
-        "direct_provider_toggles": settings.direct_provider_toggles,
-
-        # Council Configuration (unified)
-        "council_models": settings.council_models,
-        "chairman_model": settings.chairman_model,
-
-        # Remote/Local filters
-        "council_member_filters": settings.council_member_filters,
-        "chairman_filter": settings.chairman_filter,
-
-        # Prompts
-        "stage1_prompt": settings.stage1_prompt,
-        "stage2_prompt": settings.stage2_prompt,
-        "stage3_prompt": settings.stage3_prompt,
-    }
+    return settings_response(settings)
 
 
 @app.get("/api/models/direct")
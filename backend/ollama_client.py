@@ -1,9 +1,12 @@
 """Ollama API client for making LLM requests."""
 
 import asyncio
+import json
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from .config import get_ollama_base_url
+from .providers.http_client import get_client
+from .providers.streaming import delta_event, reasoning_event, done_event, error_response
 
 # Retry configuration
 MAX_RETRIES = 2
@@ -48,19 +51,20 @@ async def query_model(
 
     for attempt in range(MAX_RETRIES):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    api_url,
-                    json=payload
-                )
-
-                response.raise_for_status()
-                data = response.json()
-                
-                return {
-                    'content': data.get('message', {}).get('content', ''),
-                    'error': None
-                }
+            client = get_client(base_url)
+            response = await client.post(
+                api_url,
+                json=payload,
+                timeout=timeout
+            )
+
+            response.raise_for_status()
+            data = response.json()
+            
+            return {
+                'content': data.get('message', {}).get('content', ''),
+                'error': None
+            }
 
         except httpx.HTTPStatusError as e:
             print(f"HTTP error querying Ollama model {model}: {e}")
@@ -92,6 +96,98 @@ async def query_model(
     }
 
 
+async def stream_model(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: float = 120.0,
+    temperature: float = 0.7
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a single model via the Ollama chat API (NDJSON lines).
+
+    Args:
+        model: Ollama model identifier (e.g., "llama3")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds
+        temperature: Model temperature
+
+    Yields:
+        delta/reasoning events, then a done event with a query_model()-style response
+    """
+    base_url = get_ollama_base_url()
+    if base_url.endswith('/'):
+        base_url = base_url[:-1]
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": True,
+        "options": {
+            "temperature": temperature
+        }
+    }
+
+    content_parts = []
+    reasoning_parts = []
+    try:
+        client = get_client(base_url)
+        async with client.stream("POST", f"{base_url}/api/chat", json=payload, timeout=timeout) as response:
+            if response.status_code != 200:
+                await response.aread()
+                yield done_event({
+                    'content': None,
+                    'error': f"http_{response.status_code}",
+                    'error_message': f"Error: http_{response.status_code}"
+                })
+                return
+
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                if chunk.get('error'):
+                    yield done_event(error_response(f"Error: {chunk['error']}", content_parts))
+                    return
+
+                message = chunk.get('message') or {}
+                if message.get('thinking'):
+                    reasoning_parts.append(message['thinking'])
+                    yield reasoning_event(message['thinking'])
+                if message.get('content'):
+                    content_parts.append(message['content'])
+                    yield delta_event(message['content'])
+
+                if chunk.get('done'):
+                    break
+
+    except httpx.ConnectError:
+        print(f"Connection error streaming from Ollama at {base_url}")
+        yield done_event({
+            'content': None,
+            'error': "connection_error",
+            'error_message': "Could not connect to Ollama. Is it running?"
+        })
+        return
+    except httpx.TimeoutException:
+        print(f"Timeout streaming Ollama model {model}")
+        yield done_event(error_response("Request timed out", content_parts))
+        return
+    except Exception as e:
+        print(f"Error streaming Ollama model {model}: {e}")
+        yield done_event(error_response(f"Error: {e}", content_parts))
+        return
+
+    yield done_event({
+        'content': "".join(content_parts),
+        'reasoning': "".join(reasoning_parts) or None,
+        'error': None
+    })
+
+
 async def query_models_parallel(
     models: List[str],
     messages: List[Dict[str, str]]
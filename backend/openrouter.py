@@ -2,8 +2,10 @@
 
 import asyncio
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from .config import get_openrouter_api_key, OPENROUTER_API_URL
+from .providers.http_client import get_client
+from .providers.streaming import stream_openai_compatible, done_event
 
 # Retry configuration
 MAX_RETRIES = 2
@@ -51,48 +53,48 @@ async def query_model(
 
     for attempt in range(MAX_RETRIES):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    OPENROUTER_API_URL,
-                    headers=headers,
-                    json=payload
-                )
-
-                # Handle rate limiting with retry
-                if response.status_code == 429:
-                    retry_delay = INITIAL_RETRY_DELAY * (2 ** attempt)
-                    print(f"Rate limited on {model}, retrying in {retry_delay}s (attempt {attempt + 1}/{MAX_RETRIES})")
-                    last_error = "rate_limited"
-                    await asyncio.sleep(retry_delay)
-                    continue
-
-                # Handle other client errors without retry
-                if response.status_code == 400:
-                    error_detail = "bad_request"
-                    try:
-                        error_data = response.json()
-                        error_detail = error_data.get("error", {}).get("message", "bad_request")
-                    except:
-                        pass
-                    print(f"Bad request for {model}: {error_detail}")
-                    return {
-                        'content': None,
-                        'error': 'bad_request',
-                        'error_message': f"Model returned error: {error_detail}"
-                    }
-
-                response.raise_for_status()
-
-                data = response.json()
-                message = data['choices'][0]['message']
+            client = get_client(OPENROUTER_API_URL)
+            response = await client.post(
+                OPENROUTER_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=timeout
+            )
 
+            # Rate limits are retried by the provider scheduler (providers/rate_limit.py),
+            # which honors Retry-After and holds back the other queued requests too
+            if response.status_code == 429:
+                print(f"Rate limited on {model}")
+                last_error = "rate_limited"
+                break
+
+            # Handle other client errors without retry
+            if response.status_code == 400:
+                error_detail = "bad_request"
+                try:
+                    error_data = response.json()
+                    error_detail = error_data.get("error", {}).get("message", "bad_request")
+                except:
+                    pass
+                print(f"Bad request for {model}: {error_detail}")
                 return {
-                    'content': message.get('content'),
-                    'reasoning': message.get('reasoning'), # Capture reasoning field (common in DeepSeek R1/reasoning models)
-                    'reasoning_details': message.get('reasoning_details'),
-                    'error': None
+                    'content': None,
+                    'error': 'bad_request',
+                    'error_message': f"Model returned error: {error_detail}"
                 }
 
+            response.raise_for_status()
+
+            data = response.json()
+            message = data['choices'][0]['message']
+
+            return {
+                'content': message.get('content'),
+                'reasoning': message.get('reasoning'), # Capture reasoning field (common in DeepSeek R1/reasoning models)
+                'reasoning_details': message.get('reasoning_details'),
+                'error': None
+            }
+
         except httpx.HTTPStatusError as e:
             print(f"HTTP error querying model {model}: {e}")
             last_error = f"http_{e.response.status_code}"
@@ -123,6 +125,54 @@ async def query_model(
     }
 
 
+async def stream_model(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: float = 120.0,
+    temperature: float = 0.7
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a single model via OpenRouter.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds
+        temperature: Model temperature
+
+    Yields:
+        delta/reasoning events, then a done event with a query_model()-style response
+    """
+    api_key = get_openrouter_api_key()
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature
+    }
+
+    # 429s before the first token are retried by the provider scheduler (providers/rate_limit.py)
+    async for event in stream_openai_compatible(OPENROUTER_API_URL, headers, payload, timeout, "OpenRouter"):
+        if event["type"] != "done":
+            yield event
+            continue
+
+        response = event["response"]
+        if response.get("status_code") == 429:
+            print(f"Rate limited on {model}")
+            response = {
+                'content': None,
+                'error': 'rate_limited',
+                'error_message': "Rate limited - too many requests"
+            }
+        yield done_event(response)
+        return
+
+
 async def query_models_parallel(
     models: List[str],
     messages: List[Dict[str, str]],
@@ -185,52 +235,52 @@ async def fetch_models() -> List[Dict[str, Any]]:
     Returns a list of model definitions compatible with the frontend.
     """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get("https://openrouter.ai/api/v1/models")
-            if response.status_code != 200:
-                print(f"Failed to fetch OpenRouter models: {response.status_code}")
-                return []
+        client = get_client("https://openrouter.ai/api/v1/models")
+        response = await client.get("https://openrouter.ai/api/v1/models", timeout=10.0)
+        if response.status_code != 200:
+            print(f"Failed to fetch OpenRouter models: {response.status_code}")
+            return []
+        
+        data = response.json()
+        models = []
+        for item in data.get("data", []):
+            model_id = item.get("id", "")
             
-            data = response.json()
-            models = []
-            for item in data.get("data", []):
-                model_id = item.get("id", "")
-                
-                # Skip known broken models
-                if model_id in BROKEN_MODELS:
-                    continue
-                
-                # Determine if free based on pricing
-                pricing = item.get("pricing", {})
-                is_free = (
-                    float(pricing.get("prompt", 0)) == 0 and 
-                    float(pricing.get("completion", 0)) == 0
-                )
-                
-                # Extract provider from ID (e.g. "google/gemini" -> "Google")
-                provider = "OpenRouter" # Default
-                if "/" in model_id:
-                    provider_slug = model_id.split("/")[0]
-                    # Capitalize nicely
-                    if provider_slug == "openai": provider = "OpenAI"
-                    elif provider_slug == "anthropic": provider = "Anthropic"
-                    elif provider_slug == "google": provider = "Google"
-                    elif provider_slug == "meta-llama": provider = "Meta"
-                    elif provider_slug == "mistralai": provider = "Mistral"
-                    elif provider_slug == "deepseek": provider = "DeepSeek"
-                    else: provider = provider_slug.title()
-                
-                models.append({
-                    "id": model_id,
-                    "name": item.get("name"),
-                    "provider": provider, 
-                    "source": "openrouter", # Explicitly set for frontend grouping
-                    "context_length": item.get("context_length"),
-                    "is_free": is_free,
-                    "pricing": pricing
-                })
+            # Skip known broken models
+            if model_id in BROKEN_MODELS:
+                continue
+            
+            # Determine if free based on pricing
+            pricing = item.get("pricing", {})
+            is_free = (
+                float(pricing.get("prompt", 0)) == 0 and 
+                float(pricing.get("completion", 0)) == 0
+            )
             
-            return models
+            # Extract provider from ID (e.g. "google/gemini" -> "Google")
+            provider = "OpenRouter" # Default
+            if "/" in model_id:
+                provider_slug = model_id.split("/")[0]
+                # Capitalize nicely
+                if provider_slug == "openai": provider = "OpenAI"
+                elif provider_slug == "anthropic": provider = "Anthropic"
+                elif provider_slug == "google": provider = "Google"
+                elif provider_slug == "meta-llama": provider = "Meta"
+                elif provider_slug == "mistralai": provider = "Mistral"
+                elif provider_slug == "deepseek": provider = "DeepSeek"
+                else: provider = provider_slug.title()
+            
+            models.append({
+                "id": model_id,
+                "name": item.get("name"),
+                "provider": provider, 
+                "source": "openrouter", # Explicitly set for frontend grouping
+                "context_length": item.get("context_length"),
+                "is_free": is_free,
+                "pricing": pricing
+            })
+        
+        return models
     except Exception as e:
         print(f"Error fetching OpenRouter models: {e}")
         return []
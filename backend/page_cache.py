@@ -0,0 +1,193 @@
+"""Disk cache of page content fetched through Jina Reader.
+
+Full-content fetches take seconds each and the same URLs come up again
+across turns and search providers. Pages are stored gzip-compressed under
+PAGE_CACHE_DIR, one file per URL, and served without a request for
+PAGE_CACHE_MAX_AGE seconds. After that they are revalidated with
+If-None-Match / If-Modified-Since when the original response carried an
+ETag or Last-Modified header (a 304 keeps the stored copy), and refetched
+otherwise. If a refetch fails, the stale copy is used rather than nothing.
+
+The directory is kept under PAGE_CACHE_MAX_BYTES by deleting the least
+recently stored pages. Disable with PAGE_CACHE=0.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import serialization
+from .config import PAGE_CACHE_ENABLED, PAGE_CACHE_DIR, PAGE_CACHE_MAX_AGE, PAGE_CACHE_MAX_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+class PageCache:
+    """URL-keyed, size-bounded, compressed page store with HTTP revalidation."""
+
+    def __init__(self, directory: str, max_age: float, max_bytes: int):
+        self.directory = directory
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        # Estimated disk usage, computed on first write
+        self._disk_bytes: Optional[int] = None
+        # Serializes replacing entries with the usage accounting and pruning
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key[:2], f"{key}.json.gz")
+
+    # Disk access (runs on worker threads)
+
+    def _read(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self._path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = serialization.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"Discarding unreadable page cache entry {path}: {e}")
+            self._remove(path)
+            return None
+        # A different URL with the same hash prefix is not a hit
+        return entry if entry.get("url") == url else None
+
+    def _write(self, entry: Dict[str, Any]):
+        path = self._path(entry["url"])
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # A temp file per write: parallel searches may store the same page at once
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(serialization.dumps(entry))
+            size = os.path.getsize(tmp_path)
+
+            with self._lock:
+                try:
+                    replaced = os.path.getsize(path)
+                except OSError:
+                    replaced = 0
+                os.replace(tmp_path, path)
+                if self._disk_bytes is None:
+                    self._disk_bytes = sum(size for _, size, _ in self._scan())
+                else:
+                    self._disk_bytes += size - replaced
+                if self._disk_bytes > self.max_bytes:
+                    self._prune()
+        finally:
+            self._remove(tmp_path)  # already gone unless the write failed
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every stored page."""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith(".json.gz"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _prune(self):
+        """Delete the least recently stored pages until usage is below 90% of the cap."""
+        files = sorted(self._scan())
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        for _, size, path in files:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+        self._disk_bytes = total
+
+    # Public API
+
+    async def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """The stored entry for `url` (fresh or stale), or None."""
+        try:
+            entry = await asyncio.to_thread(self._read, url)
+        except Exception as e:
+            logger.warning(f"Page cache read failed: {e}")
+            return None
+        if entry is None:
+            self.misses += 1
+        elif self.is_fresh(entry):
+            self.hits += 1
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        """Whether an entry can be served without asking the server."""
+        return time.time() - entry.get("stored_at", 0) < self.max_age
+
+    def validators(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Conditional request headers for revalidating a stale entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def store(self, url: str, content: str, headers: Any = None):
+        """Store freshly fetched content with the response's validators."""
+        if not content:
+            return
+        headers = headers or {}
+        await self._save({
+            "url": url,
+            "stored_at": time.time(),
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "content": content,
+        })
+
+    async def refresh(self, entry: Dict[str, Any]):
+        """Mark a revalidated (304) entry as fresh again."""
+        self.revalidated += 1
+        await self._save({**entry, "stored_at": time.time()})
+
+    async def _save(self, entry: Dict[str, Any]):
+        try:
+            await asyncio.to_thread(self._write, entry)
+        except Exception as e:
+            logger.warning(f"Page cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, revalidation and miss counters."""
+        return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+
+_cache: Optional[PageCache] = None
+
+
+def get_page_cache() -> Optional[PageCache]:
+    """Get the shared page cache, or None when PAGE_CACHE is disabled."""
+    global _cache
+    if not PAGE_CACHE_ENABLED or not PAGE_CACHE_DIR:
+        return None
+    if _cache is None:
+        _cache = PageCache(PAGE_CACHE_DIR, PAGE_CACHE_MAX_AGE, PAGE_CACHE_MAX_BYTES)
+    return _cache
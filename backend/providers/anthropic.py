@@ -1,8 +1,10 @@
 """Anthropic provider implementation."""
 
-import httpx
-from typing import List, Dict, Any
+import json
+from typing import List, Dict, Any, AsyncIterator
 from .base import LLMProvider
+from .http_client import get_client
+from .streaming import iter_sse_data, delta_event, reasoning_event, done_event, error_response
 from ..settings import get_settings
 
 class AnthropicProvider(LLMProvider):
@@ -31,106 +33,191 @@ class AnthropicProvider(LLMProvider):
                 filtered_messages.append(msg)
         
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                payload = {
-                    "model": model,
-                    "messages": filtered_messages,
-                    "max_tokens": 4096,
-                    "temperature": temperature
+            client = get_client(self.BASE_URL)
+            payload = {
+                "model": model,
+                "messages": filtered_messages,
+                "max_tokens": 4096,
+                "temperature": temperature
+            }
+            if system_message:
+                payload["system"] = system_message
+                
+            response = await client.post(
+                f"{self.BASE_URL}/messages",
+                headers={
+                    "x-api-key": api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json"
+                },
+                json=payload,
+                timeout=timeout
+            )
+            
+            if response.status_code != 200:
+                return {
+                    "error": True, 
+                    "error_message": f"Anthropic API error: {response.status_code} - {response.text}"
                 }
-                if system_message:
-                    payload["system"] = system_message
-                    
-                response = await client.post(
-                    f"{self.BASE_URL}/messages",
-                    headers={
-                        "x-api-key": api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json"
-                    },
-                    json=payload
-                )
                 
-                if response.status_code != 200:
-                    return {
-                        "error": True, 
-                        "error_message": f"Anthropic API error: {response.status_code} - {response.text}"
-                    }
-                    
-                data = response.json()
-                content = data["content"][0]["text"]
-                return {"content": content, "error": False}
+            data = response.json()
+            content = data["content"][0]["text"]
+            return {"content": content, "error": False}
                 
         except Exception as e:
             return {"error": True, "error_message": str(e)}
 
+    async def stream(self, model_id: str, messages: List[Dict[str, str]], timeout: float = 120.0, temperature: float = 0.7) -> AsyncIterator[Dict[str, Any]]:
+        api_key = self._get_api_key()
+        if not api_key:
+            yield done_event({"error": True, "error_message": "Anthropic API key not configured"})
+            return
+
+        model = model_id.removeprefix("anthropic:")
+
+        system_message = ""
+        filtered_messages = []
+        for msg in messages:
+            if msg["role"] == "system":
+                system_message = msg["content"]
+            else:
+                filtered_messages.append(msg)
+
+        payload = {
+            "model": model,
+            "messages": filtered_messages,
+            "max_tokens": 4096,
+            "temperature": temperature,
+            "stream": True
+        }
+        if system_message:
+            payload["system"] = system_message
+
+        content_parts = []
+        reasoning_parts = []
+        try:
+            client = get_client(self.BASE_URL)
+            async with client.stream(
+                "POST",
+                f"{self.BASE_URL}/messages",
+                headers={
+                    "x-api-key": api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json"
+                },
+                json=payload,
+                timeout=timeout
+            ) as response:
+                if response.status_code != 200:
+                    body = (await response.aread()).decode(errors="replace")
+                    yield done_event(error_response(
+                        f"Anthropic API error: {response.status_code} - {body}",
+                        status_code=response.status_code
+                    ))
+                    return
+
+                # Anthropic event stream: content_block_delta carries text/thinking chunks
+                async for data in iter_sse_data(response):
+                    try:
+                        event = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    event_type = event.get("type")
+                    if event_type == "content_block_delta":
+                        delta = event.get("delta", {})
+                        if delta.get("type") == "text_delta" and delta.get("text"):
+                            content_parts.append(delta["text"])
+                            yield delta_event(delta["text"])
+                        elif delta.get("type") == "thinking_delta" and delta.get("thinking"):
+                            reasoning_parts.append(delta["thinking"])
+                            yield reasoning_event(delta["thinking"])
+                    elif event_type == "error":
+                        message = event.get("error", {}).get("message", "Unknown error")
+                        yield done_event(error_response(f"Anthropic API error: {message}", content_parts))
+                        return
+                    elif event_type == "message_stop":
+                        break
+
+        except Exception as e:
+            yield done_event(error_response(str(e) or type(e).__name__, content_parts))
+            return
+
+        yield done_event({
+            "content": "".join(content_parts),
+            "reasoning": "".join(reasoning_parts) or None,
+            "error": False
+        })
+
     async def get_models(self) -> List[Dict[str, Any]]:
         api_key = self._get_api_key()
         if not api_key:
             return []
             
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/models",
-                    headers={
-                        "x-api-key": api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json"
-                    }
-                )
-                
-                if response.status_code != 200:
-                    # Fallback to hardcoded list if API fails (e.g. older keys or API not enabled)
-                    return [
-                        {"id": "anthropic:claude-opus-4-7", "name": "Claude Opus 4.7 [Anthropic]", "provider": "Anthropic"},
-                        {"id": "anthropic:claude-opus-4-6", "name": "Claude Opus 4.6 [Anthropic]", "provider": "Anthropic"},
-                        {"id": "anthropic:claude-sonnet-4-6", "name": "Claude Sonnet 4.6 [Anthropic]", "provider": "Anthropic"},
-                        {"id": "anthropic:claude-haiku-4-5-20251001", "name": "Claude Haiku 4.5 [Anthropic]", "provider": "Anthropic"},
-                        {"id": "anthropic:claude-3-5-sonnet-20241022", "name": "Claude 3.5 Sonnet [Anthropic]", "provider": "Anthropic"},
-                    ]
-                    
-                data = response.json()
-                models = []
-                
-                for model in data.get("data", []):
-                    if model.get("type") == "model":
-                        models.append({
-                            "id": f"anthropic:{model['id']}",
-                            "name": f"{model.get('display_name', model['id'])} [Anthropic]",
-                            "provider": "Anthropic"
-                        })
+            client = get_client(self.BASE_URL)
+            response = await client.get(
+                f"{self.BASE_URL}/models",
+                headers={
+                    "x-api-key": api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json"
+                },
+                timeout=10.0
+            )
+            
+            if response.status_code != 200:
+                # Fallback to hardcoded list if API fails (e.g. older keys or API not enabled)
+                return [
+                    {"id": "anthropic:claude-opus-4-7", "name": "Claude Opus 4.7 [Anthropic]", "provider": "Anthropic"},
+                    {"id": "anthropic:claude-opus-4-6", "name": "Claude Opus 4.6 [Anthropic]", "provider": "Anthropic"},
+                    {"id": "anthropic:claude-sonnet-4-6", "name": "Claude Sonnet 4.6 [Anthropic]", "provider": "Anthropic"},
+                    {"id": "anthropic:claude-haiku-4-5-20251001", "name": "Claude Haiku 4.5 [Anthropic]", "provider": "Anthropic"},
+                    {"id": "anthropic:claude-3-5-sonnet-20241022", "name": "Claude 3.5 Sonnet [Anthropic]", "provider": "Anthropic"},
+                ]
                 
-                return sorted(models, key=lambda x: x["name"])
+            data = response.json()
+            models = []
+            
+            for model in data.get("data", []):
+                if model.get("type") == "model":
+                    models.append({
+                        "id": f"anthropic:{model['id']}",
+                        "name": f"{model.get('display_name', model['id'])} [Anthropic]",
+                        "provider": "Anthropic"
+                    })
+            
+            return sorted(models, key=lambda x: x["name"])
                 
         except Exception:
             return []
 
     async def validate_key(self, api_key: str) -> Dict[str, Any]:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/messages",
-                    headers={
-                        "x-api-key": api_key,
-                        "anthropic-version": "2023-06-01",
-                        "content-type": "application/json"
-                    },
-                    json={
-                        "model": "claude-haiku-4-5-20251001",
-                        "messages": [{"role": "user", "content": "Hi"}],
-                        "max_tokens": 1
-                    }
-                )
-
-                if response.status_code == 200:
-                    return {"success": True, "message": "API key is valid"}
-
-                error_body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
-                error_detail = error_body.get("error", {}).get("message", response.text)
-
-                if response.status_code == 401:
-                    return {"success": False, "message": f"Invalid API key: {error_detail}"}
-                return {"success": False, "message": f"Anthropic API error ({response.status_code}): {error_detail}"}
+            client = get_client(self.BASE_URL)
+            response = await client.post(
+                f"{self.BASE_URL}/messages",
+                headers={
+                    "x-api-key": api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json"
+                },
+                json={
+                    "model": "claude-haiku-4-5-20251001",
+                    "messages": [{"role": "user", "content": "Hi"}],
+                    "max_tokens": 1
+                },
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                return {"success": True, "message": "API key is valid"}
+
+            error_body = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
+            error_detail = error_body.get("error", {}).get("message", response.text)
+
+            if response.status_code == 401:
+                return {"success": False, "message": f"Invalid API key: {error_detail}"}
+            return {"success": False, "message": f"Anthropic API error ({response.status_code}): {error_detail}"}
         except Exception as e:
             return {"success": False, "message": str(e)}
@@ -1,7 +1,7 @@
 """Base class for LLM providers."""
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -21,6 +21,34 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def stream(self, model_id: str, messages: List[Dict[str, str]], timeout: float = 120.0, temperature: float = 0.7) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a query to the LLM token by token.
+
+        Providers with a native streaming API override this; the default
+        falls back to query() and emits the whole answer as a single delta.
+
+        Args:
+            model_id: The ID of the model to query.
+            messages: List of message dicts (role, content).
+            timeout: Request timeout in seconds.
+
+        Yields:
+            {'type': 'delta', 'content': str} for answer text,
+            {'type': 'reasoning', 'content': str} for thinking text, and
+            finally {'type': 'done', 'response': dict} where the response has
+            the same shape as query().
+        """
+        response = await self.query(model_id, messages, timeout, temperature)
+        if response and not response.get('error'):
+            reasoning = response.get('reasoning')
+            if reasoning and isinstance(reasoning, str):
+                yield {"type": "reasoning", "content": reasoning}
+            content = response.get('content')
+            if content and isinstance(content, str):
+                yield {"type": "delta", "content": content}
+        yield {"type": "done", "response": response}
+
     @abstractmethod
     async def get_models(self) -> List[Dict[str, Any]]:
         """
@@ -1,8 +1,10 @@
 """Custom OpenAI-compatible endpoint provider."""
 
 import httpx
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 from .base import LLMProvider
+from .http_client import get_client
+from .streaming import stream_openai_compatible, done_event
 from ..settings import get_settings
 
 
@@ -35,30 +37,60 @@ class CustomOpenAIProvider(LLMProvider):
             if api_key:
                 headers["Authorization"] = f"Bearer {api_key}"
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    f"{base_url}/chat/completions",
-                    headers=headers,
-                    json={
-                        "model": model,
-                        "messages": messages,
-                        "temperature": temperature
-                    }
-                )
-
-                if response.status_code != 200:
-                    return {
-                        "error": True,
-                        "error_message": f"{name} API error: {response.status_code} - {response.text}"
-                    }
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                return {"content": content, "error": False}
+            client = get_client(base_url)
+            response = await client.post(
+                f"{base_url}/chat/completions",
+                headers=headers,
+                json={
+                    "model": model,
+                    "messages": messages,
+                    "temperature": temperature
+                },
+                timeout=timeout
+            )
+
+            if response.status_code != 200:
+                return {
+                    "error": True,
+                    "error_message": f"{name} API error: {response.status_code} - {response.text}"
+                }
+
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            return {"content": content, "error": False}
 
         except Exception as e:
             return {"error": True, "error_message": str(e)}
 
+    async def stream(self, model_id: str, messages: List[Dict[str, str]], timeout: float = 120.0, temperature: float = 0.7) -> AsyncIterator[Dict[str, Any]]:
+        name, base_url, api_key = self._get_config()
+
+        if not base_url:
+            yield done_event({"error": True, "error_message": f"{name} endpoint URL not configured"})
+            return
+
+        model = model_id.removeprefix("custom:")
+
+        if base_url.endswith('/'):
+            base_url = base_url[:-1]
+
+        headers = {"Content-Type": "application/json"}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+
+        async for event in stream_openai_compatible(
+            f"{base_url}/chat/completions",
+            headers=headers,
+            payload={
+                "model": model,
+                "messages": messages,
+                "temperature": temperature
+            },
+            timeout=timeout,
+            provider_name=name
+        ):
+            yield event
+
     async def get_models(self) -> List[Dict[str, Any]]:
         name, base_url, api_key = self._get_config()
 
@@ -74,35 +106,36 @@ class CustomOpenAIProvider(LLMProvider):
             if api_key:
                 headers["Authorization"] = f"Bearer {api_key}"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{base_url}/models",
-                    headers=headers
-                )
+            client = get_client(base_url)
+            response = await client.get(
+                f"{base_url}/models",
+                headers=headers,
+                timeout=10.0
+            )
 
-                if response.status_code != 200:
-                    return []
+            if response.status_code != 200:
+                return []
 
-                data = response.json()
-                models = []
+            data = response.json()
+            models = []
 
-                for model in data.get("data", []):
-                    model_id = model.get("id", "")
-                    if not model_id:
-                        continue
+            for model in data.get("data", []):
+                model_id = model.get("id", "")
+                if not model_id:
+                    continue
 
-                    mid = model_id.lower()
-                    # Filter out non-chat models
-                    if any(x in mid for x in ["embed", "whisper", "tts", "dall-e", "audio", "transcribe"]):
-                        continue
+                mid = model_id.lower()
+                # Filter out non-chat models
+                if any(x in mid for x in ["embed", "whisper", "tts", "dall-e", "audio", "transcribe"]):
+                    continue
 
-                    models.append({
-                        "id": f"custom:{model_id}",
-                        "name": f"{model_id} [{name}]",
-                        "provider": name
-                    })
+                models.append({
+                    "id": f"custom:{model_id}",
+                    "name": f"{model_id} [{name}]",
+                    "provider": name
+                })
 
-                return sorted(models, key=lambda x: x["name"])
+            return sorted(models, key=lambda x: x["name"])
 
         except Exception:
             return []
@@ -121,23 +154,24 @@ class CustomOpenAIProvider(LLMProvider):
             if api_key:
                 headers["Authorization"] = f"Bearer {api_key}"
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{url}/models",
-                    headers=headers
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    model_count = len(data.get("data", []))
-                    return {
-                        "success": True,
-                        "message": f"Connected successfully. Found {model_count} models."
-                    }
-                elif response.status_code == 401:
-                    return {"success": False, "message": "Authentication failed. Check your API key."}
-                else:
-                    return {"success": False, "message": f"API error: {response.status_code}"}
+            client = get_client(url)
+            response = await client.get(
+                f"{url}/models",
+                headers=headers,
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                model_count = len(data.get("data", []))
+                return {
+                    "success": True,
+                    "message": f"Connected successfully. Found {model_count} models."
+                }
+            elif response.status_code == 401:
+                return {"success": False, "message": "Authentication failed. Check your API key."}
+            else:
+                return {"success": False, "message": f"API error: {response.status_code}"}
 
         except httpx.ConnectError:
             return {"success": False, "message": "Connection failed. Check the URL."}
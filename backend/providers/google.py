@@ -1,8 +1,10 @@
 """Google Gemini provider implementation."""
 
-import httpx
-from typing import List, Dict, Any
+import json
+from typing import List, Dict, Any, AsyncIterator
 from .base import LLMProvider
+from .http_client import get_client
+from .streaming import iter_sse_data, delta_event, reasoning_event, done_event, error_response
 from ..settings import get_settings
 
 class GoogleProvider(LLMProvider):
@@ -34,74 +36,162 @@ class GoogleProvider(LLMProvider):
                 contents.append({"role": "model", "parts": [{"text": msg["content"]}]})
         
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                payload = {
-                    "contents": contents,
-                    "generationConfig": {
-                        "temperature": temperature
-                    }
+            client = get_client(self.BASE_URL)
+            payload = {
+                "contents": contents,
+                "generationConfig": {
+                    "temperature": temperature
                 }
-                if system_instruction:
-                    payload["system_instruction"] = system_instruction
-                    
-                response = await client.post(
-                    f"{self.BASE_URL}/{model}:generateContent",
-                    params={"key": api_key},
-                    headers={"Content-Type": "application/json"},
-                    json=payload
-                )
+            }
+            if system_instruction:
+                payload["system_instruction"] = system_instruction
                 
-                if response.status_code != 200:
-                    return {
-                        "error": True, 
-                        "error_message": f"Google API error: {response.status_code} - {response.text}"
-                    }
-                    
-                data = response.json()
-                try:
-                    content = data["candidates"][0]["content"]["parts"][0]["text"]
-                    return {"content": content, "error": False}
-                except (KeyError, IndexError):
-                    return {"error": True, "error_message": "Unexpected response format from Google API"}
+            response = await client.post(
+                f"{self.BASE_URL}/{model}:generateContent",
+                params={"key": api_key},
+                headers={"Content-Type": "application/json"},
+                json=payload,
+                timeout=timeout
+            )
+            
+            if response.status_code != 200:
+                return {
+                    "error": True, 
+                    "error_message": f"Google API error: {response.status_code} - {response.text}"
+                }
+                
+            data = response.json()
+            try:
+                content = data["candidates"][0]["content"]["parts"][0]["text"]
+                return {"content": content, "error": False}
+            except (KeyError, IndexError):
+                return {"error": True, "error_message": "Unexpected response format from Google API"}
                 
         except Exception as e:
             return {"error": True, "error_message": str(e)}
 
+    async def stream(self, model_id: str, messages: List[Dict[str, str]], timeout: float = 120.0, temperature: float = 0.7) -> AsyncIterator[Dict[str, Any]]:
+        api_key = self._get_api_key()
+        if not api_key:
+            yield done_event({"error": True, "error_message": "Google API key not configured"})
+            return
+
+        model = model_id.removeprefix("google:")
+
+        contents = []
+        system_instruction = None
+
+        for msg in messages:
+            if msg["role"] == "system":
+                system_instruction = {"parts": [{"text": msg["content"]}]}
+            elif msg["role"] == "user":
+                contents.append({"role": "user", "parts": [{"text": msg["content"]}]})
+            elif msg["role"] == "assistant":
+                contents.append({"role": "model", "parts": [{"text": msg["content"]}]})
+
+        payload = {
+            "contents": contents,
+            "generationConfig": {
+                "temperature": temperature
+            }
+        }
+        if system_instruction:
+            payload["system_instruction"] = system_instruction
+
+        content_parts = []
+        reasoning_parts = []
+        try:
+            client = get_client(self.BASE_URL)
+            async with client.stream(
+                "POST",
+                f"{self.BASE_URL}/{model}:streamGenerateContent",
+                params={"key": api_key, "alt": "sse"},
+                headers={"Content-Type": "application/json"},
+                json=payload,
+                timeout=timeout
+            ) as response:
+                if response.status_code != 200:
+                    body = (await response.aread()).decode(errors="replace")
+                    yield done_event(error_response(
+                        f"Google API error: {response.status_code} - {body}",
+                        status_code=response.status_code
+                    ))
+                    return
+
+                # Each SSE event is a partial GenerateContentResponse
+                async for data in iter_sse_data(response):
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    if chunk.get("error"):
+                        message = chunk["error"].get("message", "Unknown error")
+                        yield done_event(error_response(f"Google API error: {message}", content_parts))
+                        return
+
+                    for candidate in chunk.get("candidates") or []:
+                        for part in (candidate.get("content") or {}).get("parts") or []:
+                            text = part.get("text")
+                            if not text:
+                                continue
+                            if part.get("thought"):
+                                reasoning_parts.append(text)
+                                yield reasoning_event(text)
+                            else:
+                                content_parts.append(text)
+                                yield delta_event(text)
+
+        except Exception as e:
+            yield done_event(error_response(str(e) or type(e).__name__, content_parts))
+            return
+
+        if not content_parts and not reasoning_parts:
+            yield done_event({"error": True, "error_message": "Unexpected response format from Google API"})
+            return
+
+        yield done_event({
+            "content": "".join(content_parts),
+            "reasoning": "".join(reasoning_parts) or None,
+            "error": False
+        })
+
     async def get_models(self) -> List[Dict[str, Any]]:
         api_key = self._get_api_key()
         if not api_key:
             return []
             
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    self.BASE_URL,
-                    params={"key": api_key, "pageSize": 100}
-                )
+            client = get_client(self.BASE_URL)
+            response = await client.get(
+                self.BASE_URL,
+                params={"key": api_key, "pageSize": 100},
+                timeout=10.0
+            )
+            
+            if response.status_code != 200:
+                return []
                 
-                if response.status_code != 200:
-                    return []
+            data = response.json()
+            models = []
+            
+            for model in data.get("models", []):
+                # Filter for models that support content generation
+                if "generateContent" in model.get("supportedGenerationMethods", []):
+                    # Clean up ID (remove models/ prefix)
+                    model_id = model["name"].removeprefix("models/")
                     
-                data = response.json()
-                models = []
-                
-                for model in data.get("models", []):
-                    # Filter for models that support content generation
-                    if "generateContent" in model.get("supportedGenerationMethods", []):
-                        # Clean up ID (remove models/ prefix)
-                        model_id = model["name"].removeprefix("models/")
+                    # Extra safety check for embeddings/vision-only if they sneak in
+                    if "embed" in model_id.lower() or "vision" in model_id.lower():
+                        continue
                         
-                        # Extra safety check for embeddings/vision-only if they sneak in
-                        if "embed" in model_id.lower() or "vision" in model_id.lower():
-                            continue
-                            
-                        models.append({
-                            "id": f"google:{model_id}",
-                            "name": f"{model.get('displayName', model_id)} [Google]",
-                            "provider": "Google"
-                        })
-                
-                return sorted(models, key=lambda x: x["name"])
+                    models.append({
+                        "id": f"google:{model_id}",
+                        "name": f"{model.get('displayName', model_id)} [Google]",
+                        "provider": "Google"
+                    })
+            
+            return sorted(models, key=lambda x: x["name"])
                 
         except Exception:
             return []
@@ -109,23 +199,24 @@ class GoogleProvider(LLMProvider):
     async def validate_key(self, api_key: str) -> Dict[str, Any]:
         try:
             # Test by listing models (more robust than generating content with a specific model)
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    self.BASE_URL,
-                    params={"key": api_key, "pageSize": 1}
-                )
-                
-                if response.status_code == 200:
-                    return {"success": True, "message": "API key is valid"}
-                else:
-                    try:
-                        error_data = response.json()
-                        if "error" in error_data:
-                            message = error_data['error'].get('message', 'Unknown error')
-                            return {"success": False, "message": f"Error {response.status_code}: {message}"}
-                        else:
-                            return {"success": False, "message": f"Error {response.status_code}: {str(error_data)[:200]}"}
-                    except:
-                        return {"success": False, "message": f"Error {response.status_code}: {response.text[:200]}"}
+            client = get_client(self.BASE_URL)
+            response = await client.get(
+                self.BASE_URL,
+                params={"key": api_key, "pageSize": 1},
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                return {"success": True, "message": "API key is valid"}
+            else:
+                try:
+                    error_data = response.json()
+                    if "error" in error_data:
+                        message = error_data['error'].get('message', 'Unknown error')
+                        return {"success": False, "message": f"Error {response.status_code}: {message}"}
+                    else:
+                        return {"success": False, "message": f"Error {response.status_code}: {str(error_data)[:200]}"}
+                except:
+                    return {"success": False, "message": f"Error {response.status_code}: {response.text[:200]}"}
         except Exception as e:
             return {"success": False, "message": str(e)}
@@ -0,0 +1,78 @@
+"""Shared pooled HTTP clients for LLM provider requests."""
+
+import importlib.util
+import logging
+from typing import Dict
+from urllib.parse import urlsplit
+
+import httpx
+
+from .rate_limit import note_rate_limited, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+# Connection pool tuning (applied per host)
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection is kept open for reuse
+DEFAULT_TIMEOUT = 120.0  # seconds, overridden per request by callers
+
+# HTTP/2 needs the optional 'h2' package (installed with `httpx[http2]`)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One client (and therefore one connection pool) per scheme://host:port
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _origin(url: str) -> str:
+    """Reduce a URL to the origin used as the pool key."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+async def _on_response(response: httpx.Response):
+    """Report 429s (with their Retry-After) to the provider's rate limiter."""
+    if response.status_code == 429:
+        note_rate_limited(parse_retry_after(response.headers))
+
+
+def get_client(url: str) -> httpx.AsyncClient:
+    """
+    Get the pooled async client for the host of the given URL.
+
+    Clients are created lazily and reused across requests so council members
+    keep their TCP/TLS connections alive between stages. Callers should pass
+    a per-request ``timeout`` instead of closing or reconfiguring the client.
+
+    Args:
+        url: Any URL on the target host (base URL or full endpoint)
+
+    Returns:
+        Shared httpx.AsyncClient for that host
+    """
+    origin = _origin(url)
+    client = _clients.get(origin)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE and origin.startswith("https://"),
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            event_hooks={"response": [_on_response]},
+        )
+        _clients[origin] = client
+    return client
+
+
+async def close_clients():
+    """Close every pooled client. Called on application shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP client: {e}")
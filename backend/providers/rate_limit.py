@@ -0,0 +1,201 @@
+"""Per-provider request scheduling.
+
+Every provider gets a ProviderLimiter that caps concurrent requests and
+spreads them over requests-per-minute and tokens-per-minute budgets (token
+buckets). Calls over budget wait in line instead of being sent and failing
+with 429.
+
+When a provider answers 429 anyway, the pooled HTTP clients report it here
+(see http_client.get_client). The limiter then pauses all of that provider's
+queued calls for the Retry-After delay, or an exponential backoff when the
+header is missing. The rate-limited call is retried up to RATE_LIMIT_RETRIES
+times.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import aclosing, asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from ..config import PROVIDER_MAX_CONCURRENCY, PROVIDER_LIMITS, RATE_LIMIT_RETRIES
+
+logger = logging.getLogger(__name__)
+
+INITIAL_RETRY_DELAY = 1.0  # seconds, doubled per attempt when there is no Retry-After
+MAX_RETRY_DELAY = 60.0  # upper bound for Retry-After values we honor
+
+
+class _CallState:
+    """Outcome of one attempt, filled in by the HTTP response hook."""
+
+    def __init__(self, limiter: "ProviderLimiter", attempt: int):
+        self.limiter = limiter
+        self.attempt = attempt
+        self.rate_limited = False
+
+
+# The attempt currently running in this task (set by ProviderLimiter.slot)
+_current_call: contextvars.ContextVar[Optional[_CallState]] = contextvars.ContextVar("rate_limit_call", default=None)
+
+
+def parse_retry_after(headers: Any) -> Optional[float]:
+    """Seconds to wait from Retry-After (seconds or HTTP date) or retry-after-ms headers."""
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def note_rate_limited(retry_after: Optional[float] = None):
+    """Record a 429 for the call running in this task, pausing its provider."""
+    call = _current_call.get()
+    if call is None:
+        return
+    call.rate_limited = True
+    if retry_after is None or retry_after <= 0:
+        delay = INITIAL_RETRY_DELAY * (2 ** call.attempt)
+    else:
+        delay = retry_after
+    call.limiter.pause(min(delay, MAX_RETRY_DELAY))
+
+
+def estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough prompt size in tokens (~4 characters each) for tokens-per-minute budgets."""
+    chars = sum(len(m.get("content") or "") for m in messages if isinstance(m.get("content"), str))
+    return chars // 4 + 1
+
+
+class TokenBucket:
+    """Budget of `per_minute` units refilled continuously; callers reserve and wait off any debt."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` (capped at capacity) and return how long to wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= min(amount, self.capacity)
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+class ProviderLimiter:
+    """Concurrency cap, rate budgets and 429 pause for one provider."""
+
+    def __init__(self, name: str, concurrency: int = 0, rpm: float = 0, tpm: float = 0):
+        self.name = name
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency) if concurrency > 0 else None
+        self._requests = TokenBucket(rpm) if rpm > 0 else None
+        self._tokens = TokenBucket(tpm) if tpm > 0 else None
+        self._paused_until = 0.0
+
+    def pause(self, seconds: float):
+        """Hold back every call to this provider for `seconds` (e.g. after a 429)."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.info(f"Rate limited by {self.name}; pausing requests for {seconds:.1f}s")
+
+    async def _wait_for_budget(self, tokens: int):
+        wait = 0.0
+        if self._requests:
+            wait = max(wait, self._requests.reserve(1))
+        if self._tokens:
+            wait = max(wait, self._tokens.reserve(tokens))
+        wait = max(wait, self._paused_until - time.monotonic())
+        if wait > 0:
+            await asyncio.sleep(wait)
+        # A 429 elsewhere may have extended the pause while we slept
+        while (remaining := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(remaining)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0, attempt: int = 0) -> AsyncIterator[_CallState]:
+        """Wait for a concurrency slot and rate budget, then run one attempt inside it."""
+        call = _CallState(self, attempt)
+        if self._semaphore:
+            await self._semaphore.acquire()
+        reset = None
+        try:
+            await self._wait_for_budget(tokens)
+            reset = _current_call.set(call)
+            yield call
+        finally:
+            if reset is not None:
+                _current_call.reset(reset)
+            if self._semaphore:
+                self._semaphore.release()
+
+    async def call(self, query: Callable[[], Awaitable[Dict[str, Any]]], tokens: int = 0) -> Dict[str, Any]:
+        """Run `query()` under this limiter, retrying it after 429 responses."""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with self.slot(tokens, attempt) as call:
+                response = await query()
+            if not call.rate_limited or attempt == RATE_LIMIT_RETRIES:
+                return response
+            logger.info(f"Retrying rate-limited {self.name} request (attempt {attempt + 2}/{RATE_LIMIT_RETRIES + 1})")
+        return response
+
+    async def stream(self, open_stream: Callable[[], AsyncIterator[Dict[str, Any]]], tokens: int = 0) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream `open_stream()` under this limiter.
+
+        A 429 that arrives before any output is retried like call(); once
+        events have been passed on, the error is returned as is. Each
+        attempt's stream is closed before its slot is released, so the
+        concurrency cap covers every open response.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            async with self.slot(tokens, attempt) as call, aclosing(open_stream()) as events:
+                streamed = False
+                async for event in events:
+                    if (
+                        event["type"] == "done"
+                        and call.rate_limited
+                        and not streamed
+                        and attempt < RATE_LIMIT_RETRIES
+                    ):
+                        break
+                    streamed = streamed or event["type"] != "done"
+                    yield event
+                else:
+                    return
+            logger.info(f"Retrying rate-limited {self.name} stream (attempt {attempt + 2}/{RATE_LIMIT_RETRIES + 1})")
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+
+
+def get_limiter(provider_name: str) -> ProviderLimiter:
+    """Get the shared limiter for a provider, configured from PROVIDER_LIMITS."""
+    limiter = _limiters.get(provider_name)
+    if limiter is None:
+        limits = PROVIDER_LIMITS.get(provider_name, {})
+        limiter = ProviderLimiter(
+            provider_name,
+            concurrency=int(limits.get("concurrency", PROVIDER_MAX_CONCURRENCY)),
+            rpm=float(limits.get("rpm", 0)),
+            tpm=float(limits.get("tpm", 0)),
+        )
+        _limiters[provider_name] = limiter
+    return limiter
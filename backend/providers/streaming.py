@@ -0,0 +1,179 @@
+"""Helpers for consuming streamed LLM responses."""
+
+import json
+from typing import AsyncIterator, Dict, Any, List
+
+import httpx
+
+from .http_client import get_client
+
+
+def delta_event(content: str) -> Dict[str, Any]:
+    """Stream event carrying a chunk of answer text."""
+    return {"type": "delta", "content": content}
+
+
+def reasoning_event(content: str) -> Dict[str, Any]:
+    """Stream event carrying a chunk of reasoning/thinking text."""
+    return {"type": "reasoning", "content": content}
+
+
+def done_event(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Final stream event; ``response`` has the same shape as LLMProvider.query()."""
+    return {"type": "done", "response": response}
+
+
+def error_response(message: str, content_parts: List[str] = None, status_code: int = None) -> Dict[str, Any]:
+    """Build a query()-style error dict, keeping any text streamed before the failure."""
+    response = {"error": True, "error_message": message}
+    if content_parts:
+        response["content"] = "".join(content_parts)
+    if status_code is not None:
+        response["status_code"] = status_code
+    return response
+
+
+class ThinkTagSplitter:
+    """
+    Route inline ``<think>...</think>`` text in a delta stream to reasoning events.
+
+    Some models (DeepSeek R1, QwQ, ...) emit their reasoning inside the answer
+    text instead of a separate field. Tags may be split across chunks, so a
+    possible partial tag at the end of a chunk is held back until the next one.
+    """
+
+    OPEN_TAG = "<think>"
+    CLOSE_TAG = "</think>"
+
+    def __init__(self):
+        self._buffer = ""
+        self._in_think = False
+
+    def _event(self, text: str) -> Dict[str, Any]:
+        return reasoning_event(text) if self._in_think else delta_event(text)
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of answer text and return the events it completes."""
+        self._buffer += text
+        events = []
+        while True:
+            tag = self.CLOSE_TAG if self._in_think else self.OPEN_TAG
+            index = self._buffer.find(tag)
+            if index != -1:
+                if index:
+                    events.append(self._event(self._buffer[:index]))
+                self._buffer = self._buffer[index + len(tag):]
+                self._in_think = not self._in_think
+                continue
+
+            # Hold back a trailing prefix of the tag we are looking for
+            held = 0
+            for size in range(min(len(tag) - 1, len(self._buffer)), 0, -1):
+                if self._buffer.endswith(tag[:size]):
+                    held = size
+                    break
+            ready = self._buffer[:len(self._buffer) - held]
+            if ready:
+                events.append(self._event(ready))
+            self._buffer = self._buffer[len(ready):]
+            return events
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """Return any held-back text once the stream has ended."""
+        events = [self._event(self._buffer)] if self._buffer else []
+        self._buffer = ""
+        return events
+
+
+async def iter_sse_data(response: httpx.Response) -> AsyncIterator[str]:
+    """Yield the ``data`` payload of each Server-Sent Event in a streamed response."""
+    data_lines = []
+    async for line in response.aiter_lines():
+        if not line:
+            if data_lines:
+                yield "\n".join(data_lines)
+                data_lines = []
+            continue
+        if line.startswith(":"):
+            continue  # SSE comment / keep-alive
+        if line.startswith("data:"):
+            data_lines.append(line[5:].lstrip())
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+async def stream_openai_compatible(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    timeout: float,
+    provider_name: str
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream an OpenAI-compatible chat completion (``stream: true`` SSE).
+
+    Args:
+        url: Full chat completions URL
+        headers: Request headers (auth etc.)
+        payload: Request body without the ``stream`` flag
+        timeout: Request timeout in seconds
+        provider_name: Name used in error messages
+
+    Yields:
+        delta/reasoning events, then a single done event
+    """
+    content_parts = []
+    reasoning_parts = []
+
+    try:
+        client = get_client(url)
+        async with client.stream(
+            "POST",
+            url,
+            headers=headers,
+            json={**payload, "stream": True},
+            timeout=timeout
+        ) as response:
+            if response.status_code != 200:
+                body = (await response.aread()).decode(errors="replace")
+                yield done_event(error_response(
+                    f"{provider_name} API error: {response.status_code} - {body}",
+                    status_code=response.status_code
+                ))
+                return
+
+            async for data in iter_sse_data(response):
+                if data == "[DONE]":
+                    break
+                try:
+                    chunk = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+
+                if chunk.get("error"):
+                    error = chunk["error"]
+                    message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                    yield done_event(error_response(f"{provider_name} API error: {message}", content_parts))
+                    return
+
+                for choice in chunk.get("choices") or []:
+                    delta = choice.get("delta") or {}
+                    # DeepSeek uses reasoning_content, OpenRouter uses reasoning
+                    reasoning = delta.get("reasoning") or delta.get("reasoning_content")
+                    if reasoning:
+                        reasoning_parts.append(reasoning)
+                        yield reasoning_event(reasoning)
+                    text = delta.get("content")
+                    if text:
+                        content_parts.append(text)
+                        yield delta_event(text)
+
+    except Exception as e:
+        yield done_event(error_response(str(e) or type(e).__name__, content_parts))
+        return
+
+    yield done_event({
+        "content": "".join(content_parts),
+        "reasoning": "".join(reasoning_parts) or None,
+        "error": False
+    })
@@ -0,0 +1,268 @@
+"""Opt-in cache of model responses.
+
+Identical queries (same model, normalized messages and temperature) are
+answered from an in-memory LRU, backed by a directory of JSON files that
+survives restarts, instead of calling the provider again. Enable with
+RESPONSE_CACHE=1; see config.py for the TTL and size limits.
+
+Only successful responses are stored. Hits are returned as copies marked
+``cache_hit: True`` so stage results can report them.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import (
+    RESPONSE_CACHE_ENABLED,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_DISK_MAX_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or the stored entry format changes
+KEY_VERSION = 1
+
+
+def _normalize_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Keep only role and content, with line endings and outer whitespace normalized."""
+    normalized = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            content = content.replace("\r\n", "\n").strip()
+        normalized.append({"role": str(message.get("role", "")).strip().lower(), "content": content})
+    return normalized
+
+
+def cache_key(model: str, messages: List[Dict[str, Any]], temperature: float) -> str:
+    """Content address of a query: sha256 over model, normalized messages and temperature."""
+    payload = json.dumps(
+        {
+            "v": KEY_VERSION,
+            "model": model,
+            "messages": _normalize_messages(messages),
+            "temperature": round(float(temperature), 3),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + disk) TTL cache of provider responses."""
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        directory: Optional[str] = None,
+        disk_max_bytes: int = 0,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory or None
+        self.disk_max_bytes = disk_max_bytes
+
+        # key -> (expires_at, size, response); most recently used last
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._bytes = 0
+        # Estimated disk usage, computed on first write
+        self._disk_bytes: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    # Memory tier (event loop only)
+
+    def _remember(self, key: str, response: Dict[str, Any], size: int, expires_at: float):
+        if size > self.max_bytes:
+            return
+        self._forget(key)
+        self._entries[key] = (expires_at, size, response)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def _forget(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    # Disk tier (runs on worker threads)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Dict[str, Any], int]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = f.read()
+            entry = json.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove_disk(key)
+            return None
+
+        expires_at = entry.get("expires_at") or entry.get("stored_at", 0) + self.ttl
+        if expires_at <= time.time():
+            self._remove_disk(key)
+            return None
+        return expires_at, entry["response"], len(raw)
+
+    def _write_disk(self, key: str, response: Dict[str, Any], stored_at: float, expires_at: float):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps({"stored_at": stored_at, "expires_at": expires_at, "response": response}, ensure_ascii=False)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+        else:
+            self._disk_bytes += len(data)
+        if self._disk_bytes > self.disk_max_bytes:
+            self._prune_disk()
+
+    def _remove_disk(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _scan_disk(self) -> List[Tuple[float, int, str]]:
+        """(mtime, size, path) of every stored entry."""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _prune_disk(self):
+        """
+        Delete entries older than the TTL, then the oldest ones until usage is
+        below 90% of the cap. (Entries stored with a shorter TTL are dropped
+        when next read.)
+        """
+        files = sorted(self._scan_disk())
+        total = sum(size for _, size, _ in files)
+        cutoff = time.time() - self.ttl
+        target = self.disk_max_bytes * 0.9
+        for mtime, size, path in files:
+            if mtime > cutoff and total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    # Public API
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a response; returns a copy marked cache_hit, or None."""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, _, response = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return {**response, "cache_hit": True}
+            self._forget(key)
+
+        if self.directory:
+            try:
+                stored = await asyncio.to_thread(self._read_disk, key)
+            except Exception as e:
+                logger.warning(f"Cache read from {self.directory} failed: {e}")
+                stored = None
+            if stored is not None:
+                expires_at, response, size = stored
+                self._remember(key, response, size, expires_at)
+                self.hits += 1
+                return {**response, "cache_hit": True}
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, response: Optional[Dict[str, Any]]):
+        """Store a successful response (errors and empty answers are not cached)."""
+        if not response or response.get("error") or not (response.get("content") or response.get("reasoning")):
+            return
+        await self._store(key, response, self.ttl)
+
+    async def _store(self, key: str, response: Dict[str, Any], ttl: float):
+        """Store an entry in both tiers, expiring after `ttl` seconds."""
+        response = {k: v for k, v in response.items() if k != "cache_hit"}
+        try:
+            size = len(json.dumps(response, ensure_ascii=False))
+        except (TypeError, ValueError):
+            return  # not JSON-serializable; skip rather than fail the query
+
+        stored_at = time.time()
+        self._remember(key, response, size, stored_at + ttl)
+        if self.directory:
+            try:
+                await asyncio.to_thread(self._write_disk, key, response, stored_at, stored_at + ttl)
+            except Exception as e:
+                logger.warning(f"Cache write to {self.directory} failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and memory usage."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def clear(self):
+        """Drop the memory tier (disk entries expire on their own)."""
+        self._entries.clear()
+        self._bytes = 0
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Get the shared response cache, or None when RESPONSE_CACHE is not enabled."""
+    global _cache
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = ResponseCache(
+            ttl=RESPONSE_CACHE_TTL,
+            max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+            max_bytes=RESPONSE_CACHE_MAX_BYTES,
+            directory=RESPONSE_CACHE_DIR,
+            disk_max_bytes=RESPONSE_CACHE_DISK_MAX_BYTES,
+        )
+    return _cache
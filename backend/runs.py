@@ -0,0 +1,135 @@
+"""Detached council runs with resumable event streams.
+
+A run executes one council turn as a background task that keeps going when
+the client disconnects. Its SSE events are numbered and kept in a bounded
+ring buffer, so a client that lost its connection can reconnect to
+``GET /api/runs/{id}/events`` with ``Last-Event-ID`` (or ``?last_event_id=``)
+and receive everything it missed. Finished runs are forgotten after
+RUN_RETENTION seconds.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Callable, Deque, Dict, Optional, Tuple
+
+from . import sse
+from .cancellation import CancelScope
+from .config import RUN_EVENT_BUFFER, RUN_RETENTION
+
+logger = logging.getLogger(__name__)
+
+
+class Run:
+    """One background council turn and its recent events."""
+
+    def __init__(self, conversation_id: str, buffer_size: int = RUN_EVENT_BUFFER):
+        self.id = str(uuid.uuid4())
+        self.conversation_id = conversation_id
+        self.cancel_scope = CancelScope()
+        self.done = False
+        self.finished_at: Optional[float] = None
+
+        # (event id, SSE chunk); ids start at 1
+        self._events: Deque[Tuple[int, str]] = deque(maxlen=buffer_size)
+        self._last_id = 0
+        # Replaced on every publish; subscribers wait on the one they saw
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def publish(self, chunk: str):
+        """Buffer an SSE chunk ("data: ...\\n\\n") and wake subscribers."""
+        self._last_id += 1
+        self._events.append((self._last_id, chunk))
+        self._wake()
+
+    def _wake(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def start(self, events: AsyncIterator[str]):
+        """Drive `events` to completion in the background, publishing each chunk."""
+        async def _drive():
+            try:
+                async for chunk in events:
+                    self.publish(chunk)
+            except Exception as e:
+                logger.error(f"Run {self.id} failed: {e}")
+            finally:
+                self.done = True
+                self.finished_at = time.monotonic()
+                self.cancel_scope.close()
+                self._wake()
+
+        self.publish(sse.event({'type': 'run_started', 'run_id': self.id}))
+        self._task = asyncio.create_task(_drive())
+
+    def cancel(self):
+        """Stop the turn; the results collected so far are saved as a partial message, like on a disconnect."""
+        self.cancel_scope.cancel("run cancelled")
+
+    async def events(self, last_event_id: int = 0) -> AsyncIterator[str]:
+        """
+        Yield buffered and new events after `last_event_id`, each with its SSE id,
+        until the run is done. Events already waiting (e.g. the backlog of a
+        resuming client) are coalesced into one write.
+
+        If older events were already evicted from the buffer, an
+        ``events_missed`` event says how many; the client should reload the
+        conversation once the run completes.
+        """
+        after = last_event_id
+        while True:
+            changed = self._changed
+            if self._events:
+                pending = []
+                first_id = self._events[0][0]
+                if after < first_id - 1:
+                    pending.append(sse.event({'type': 'events_missed', 'count': first_id - 1 - after}))
+                    after = first_id - 1
+                for event_id, chunk in islice(self._events, after - first_id + 1, None):
+                    pending.append(sse.with_id(chunk, event_id))
+                    after = event_id
+                if pending:
+                    yield sse.batch(pending)
+            if self.done:
+                return
+            await changed.wait()
+
+
+_runs: Dict[str, Run] = {}
+
+
+def _prune():
+    cutoff = time.monotonic() - RUN_RETENTION
+    for run_id in [r.id for r in _runs.values() if r.done and r.finished_at < cutoff]:
+        del _runs[run_id]
+
+
+def start_run(conversation_id: str, make_events: Callable[[CancelScope], AsyncIterator[str]]) -> Run:
+    """Start a detached run of `make_events(cancel_scope)` and register it."""
+    _prune()
+    run = Run(conversation_id)
+    _runs[run.id] = run
+    run.start(make_events(run.cancel_scope))
+    return run
+
+
+def get_run(run_id: str) -> Optional[Run]:
+    """Look up a running or recently finished run."""
+    _prune()
+    return _runs.get(run_id)
+
+
+async def shutdown():
+    """Cancel unfinished runs and wait for them to save what they have (application shutdown)."""
+    tasks = []
+    for run in _runs.values():
+        if not run.done:
+            run.cancel()
+            tasks.append(run._task)
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
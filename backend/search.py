@@ -1,16 +1,21 @@
 """Web search module with multiple provider support."""
 
 from ddgs import DDGS
-from typing import List, Dict, Optional, Tuple, Set
+from ddgs.exceptions import RatelimitException
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple, Set
 from enum import Enum
 import logging
 import httpx
 import os
 import time
 import asyncio
+import functools
 import yake
 import re
 from datetime import datetime
+from .page_cache import get_page_cache
+from .search_cache import get_search_cache, search_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +100,74 @@ CONVERSATIONAL_FLUFF = [
     r'\?+$'
 ]
 
+# Stop words dropped when tokenizing queries and results for relevance scoring
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
+    'as', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'under', 'again', 'further', 'then', 'once',
+    'here', 'there', 'when', 'where', 'why', 'how', 'all', 'each',
+    'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor',
+    'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
+    'can', 'just', 'don', 'now', 'and', 'but', 'or', 'because',
+    'this', 'that', 'these', 'those', 'it', 'its'
+})
+
+# Result hosts (or any parent domain, e.g. "gov" for "www.nasa.gov") scored as authoritative
+AUTHORITATIVE_DOMAINS = frozenset({
+    'wikipedia.org', 'britannica.com', 'reuters.com', 'apnews.com',
+    'bbc.com', 'bbc.co.uk', 'nytimes.com', 'wsj.com', 'bloomberg.com',
+    'techcrunch.com', 'theverge.com', 'arstechnica.com', 'wired.com',
+    'nature.com', 'science.org', 'gov', 'edu'
+})
+
+# Result hosts scored as low quality (plus Pinterest under any TLD and reddit.com/user/ pages)
+LOW_QUALITY_DOMAINS = frozenset({
+    'facebook.com', 'twitter.com', 'instagram.com', 'tiktok.com'
+})
+
+# Phrases in a result summary that mark it as fresh
+FRESHNESS_INDICATORS = ('today', 'yesterday', 'this week', 'hours ago', 'minutes ago')
+
+
+# =============================================================================
+# PRECOMPILED PATTERNS
+# =============================================================================
+# Query analysis runs on every search turn, so every regex it needs is
+# compiled once here; phrase lists become a single alternation each.
+
+def _phrase_alternation(phrases) -> re.Pattern:
+    """Case-insensitive pattern matching any of `phrases` as whole words (longest first)."""
+    ordered = sorted(phrases, key=lambda p: (-len(p), p))
+    return re.compile(r'\b(?:' + '|'.join(re.escape(p) for p in ordered) + r')\b', re.IGNORECASE)
+
+
+_RECENT_YEAR_RE = re.compile(rf'\b(20{CURRENT_YEAR % 100}|20{(CURRENT_YEAR - 1) % 100})\b')
+_COMPANY_RES = tuple(re.compile(p, re.IGNORECASE) for p in COMPANY_PATTERNS)
+_COMPARISON_RE = re.compile(
+    r'\b(?:vs\.?|versus|compare|comparison|difference between|which is better|pros and cons'
+    r'|advantages|disadvantages)\b'
+)
+_RESEARCH_RE = re.compile(
+    r'\b(?:history of|origin of|evolution of|impact of|effects of|causes of'
+    r'|theory|research|study|analysis)\b'
+)
+_FLUFF_RES = tuple(re.compile(p, re.IGNORECASE) for p in CONVERSATIONAL_FLUFF)
+_ROLE_PLAY_RE = re.compile(
+    r'\b(act(ing)?|behave|pretend|imagine you are|you are|be) as (a|an|the)?\s*\w+(\s+\w+)?\b',
+    re.IGNORECASE
+)
+_ROLE_PLAY_TITLES_RE = _phrase_alternation(ROLE_PLAY_TITLES)
+_NOISE_PHRASES_RE = _phrase_alternation(NOISE_PHRASES)
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEADING_ARTICLE_RE = re.compile(r'^(the|a|an)\s+', re.IGNORECASE)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_NUMBER_RE = re.compile(r'^[\$€£]?\d+[\.,]?\d*[%]?$')
+_YEAR_RE = re.compile(r'\b20\d{2}\b')
+_WORD_RE = re.compile(r'\b[a-zA-Z0-9]{3,}\b')
+
 
 # =============================================================================
 # QUERY INTENT DETECTION
@@ -111,48 +184,27 @@ def detect_query_intent(query: str) -> str:
         "research" - In-depth research topics
     """
     query_lower = query.lower()
-    
+
+    # Comparison and research phrasing decide the intent outright
+    if _COMPARISON_RE.search(query_lower):
+        return "comparison"
+    if _RESEARCH_RE.search(query_lower):
+        return "research"
+
     # Check for current event indicators
-    current_event_score = 0
-    
-    # Direct indicator words
-    for indicator in CURRENT_EVENT_INDICATORS:
-        if indicator in query_lower:
-            current_event_score += 1
-    
+    current_event_score = sum(1 for indicator in CURRENT_EVENT_INDICATORS if indicator in query_lower)
+
     # Year references (current or recent years)
-    if re.search(rf'\b(20{CURRENT_YEAR % 100}|20{(CURRENT_YEAR - 1) % 100})\b', query_lower):
+    if _RECENT_YEAR_RE.search(query_lower):
         current_event_score += 2
-    
+
     # Company/business patterns
-    for pattern in COMPANY_PATTERNS:
-        if re.search(pattern, query_lower, re.IGNORECASE):
-            current_event_score += 1
-    
-    # Check for comparison intent
-    comparison_patterns = [
-        r'\bvs\.?\b', r'\bversus\b', r'\bcompare\b', r'\bcomparison\b',
-        r'\bdifference between\b', r'\bwhich is better\b', r'\bpros and cons\b',
-        r'\badvantages\b', r'\bdisadvantages\b'
-    ]
-    for pattern in comparison_patterns:
-        if re.search(pattern, query_lower):
-            return "comparison"
-    
-    # Check for research/in-depth topics
-    research_patterns = [
-        r'\bhistory of\b', r'\borigin of\b', r'\bevolution of\b',
-        r'\bimpact of\b', r'\beffects of\b', r'\bcauses of\b',
-        r'\btheory\b', r'\bresearch\b', r'\bstudy\b', r'\banalysis\b'
-    ]
-    for pattern in research_patterns:
-        if re.search(pattern, query_lower):
-            return "research"
-    
+    current_event_score += sum(1 for pattern in _COMPANY_RES if pattern.search(query_lower))
+
     # Score-based decision
     if current_event_score >= 2:
         return "current_event"
-    
+
     return "factual"
 
 
@@ -178,8 +230,8 @@ def optimize_search_query(user_query: str) -> Dict:
     
     # Clean the query - remove conversational fluff
     cleaned = user_query.strip()
-    for pattern in CONVERSATIONAL_FLUFF:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+    for pattern in _FLUFF_RES:
+        cleaned = pattern.sub('', cleaned)
     cleaned = cleaned.strip()
     
     # If cleaning removed too much, use original
@@ -187,21 +239,18 @@ def optimize_search_query(user_query: str) -> Dict:
         cleaned = user_query.strip()
     
     # Remove role-play patterns
-    cleaned = re.sub(
-        r'\b(act(ing)?|behave|pretend|imagine you are|you are|be) as (a|an|the)?\s*\w+(\s+\w+)?\b',
-        '', cleaned, flags=re.IGNORECASE
-    )
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _ROLE_PLAY_RE.sub('', cleaned)
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
     
     # Remove leading articles that don't add search value
-    cleaned = re.sub(r'^(the|a|an)\s+', '', cleaned, flags=re.IGNORECASE)
+    cleaned = _LEADING_ARTICLE_RE.sub('', cleaned)
     
     # Extract key entities (nouns, proper nouns, numbers)
     # Simple approach: keep capitalized words, numbers, and quoted phrases
     entities = []
     
     # Extract quoted phrases
-    quoted = re.findall(r'"([^"]+)"', cleaned)
+    quoted = _QUOTED_RE.findall(cleaned)
     entities.extend(quoted)
     
     # Extract potential entities (capitalized sequences, numbers with context)
@@ -214,7 +263,7 @@ def optimize_search_query(user_query: str) -> Dict:
         if word[0].isupper() and len(word) > 1:
             entities.append(word)
         # Keep numbers with context (e.g., "2026", "$100")
-        if re.match(r'^[\$€£]?\d+[\.,]?\d*[%]?$', word):
+        if _NUMBER_RE.match(word):
             entities.append(word)
     
     # Build optimized queries
@@ -224,7 +273,7 @@ def optimize_search_query(user_query: str) -> Dict:
     # For current events, add temporal context
     if intent == "current_event":
         # Check if year is already mentioned
-        if not re.search(rf'\b20\d{{2}}\b', cleaned):
+        if not _YEAR_RE.search(cleaned):
             news_query = f"{cleaned} {CURRENT_YEAR}"
         else:
             news_query = cleaned
@@ -256,21 +305,32 @@ def optimize_search_query(user_query: str) -> Dict:
 
 def _tokenize(text: str) -> Set[str]:
     """Simple tokenization for relevance scoring."""
-    # Lowercase and extract words
-    words = re.findall(r'\b[a-zA-Z0-9]+\b', text.lower())
-    # Filter out very short words and common stop words
-    stop_words = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                  'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                  'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-                  'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by', 'from',
-                  'as', 'into', 'through', 'during', 'before', 'after', 'above',
-                  'below', 'between', 'under', 'again', 'further', 'then', 'once',
-                  'here', 'there', 'when', 'where', 'why', 'how', 'all', 'each',
-                  'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor',
-                  'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very',
-                  'can', 'just', 'don', 'now', 'and', 'but', 'or', 'because',
-                  'this', 'that', 'these', 'those', 'it', 'its'}
-    return {w for w in words if len(w) > 2 and w not in stop_words}
+    # Lowercase and extract words of 3+ characters, then drop stop words
+    return set(_WORD_RE.findall(text.lower())).difference(STOP_WORDS)
+
+
+def _url_quality(url: str) -> float:
+    """URL quality signal from the result's host: 0.9 authoritative, 0.2 low quality, else 0.5."""
+    # scheme://[user@]host[:port]/path -> host, path
+    rest = url.partition('://')[2] or url
+    host, _, path = rest.partition('/')
+    host = host.rpartition('@')[2].partition(':')[0].partition('?')[0]
+    labels = host.split('.')
+    # The host and each parent domain, e.g. {"en.wikipedia.org", "wikipedia.org", "org"}
+    suffixes = {'.'.join(labels[i:]) for i in range(len(labels))}
+
+    # Penalize low-quality indicators
+    if (
+        not suffixes.isdisjoint(LOW_QUALITY_DOMAINS)
+        or 'pinterest' in labels
+        or ('reddit.com' in suffixes and path.startswith('user/'))
+    ):
+        return 0.2
+
+    # Boost authoritative domains
+    if not suffixes.isdisjoint(AUTHORITATIVE_DOMAINS):
+        return 0.9
+    return 0.5
 
 
 def score_result_relevance(result: Dict, query_terms: Set[str], intent: str = "factual") -> float:
@@ -305,30 +365,7 @@ def score_result_relevance(result: Dict, query_terms: Set[str], intent: str = "f
     score += summary_score * 0.35
     
     # URL quality signals (low weight - 0.15)
-    url = result.get('url', '').lower()
-    url_score = 0.5  # Base score
-    
-    # Boost authoritative domains
-    authoritative_domains = [
-        'wikipedia.org', 'britannica.com', 'reuters.com', 'apnews.com',
-        'bbc.com', 'bbc.co.uk', 'nytimes.com', 'wsj.com', 'bloomberg.com',
-        'techcrunch.com', 'theverge.com', 'arstechnica.com', 'wired.com',
-        'nature.com', 'science.org', 'gov', 'edu'
-    ]
-    for domain in authoritative_domains:
-        if domain in url:
-            url_score = 0.9
-            break
-    
-    # Penalize low-quality indicators
-    low_quality_indicators = ['pinterest', 'facebook.com', 'twitter.com', 
-                              'instagram.com', 'tiktok.com', 'reddit.com/user/']
-    for indicator in low_quality_indicators:
-        if indicator in url:
-            url_score = 0.2
-            break
-    
-    score += url_score * 0.15
+    score += _url_quality(result.get('url', '').lower()) * 0.15
     
     # Freshness bonus for current events (0.1 weight)
     if intent == "current_event":
@@ -338,11 +375,9 @@ def score_result_relevance(result: Dict, query_terms: Set[str], intent: str = "f
         if current_year_str in summary or current_year_str in title:
             freshness_score = 0.8
         # Check for time indicators
-        time_indicators = ['today', 'yesterday', 'this week', 'hours ago', 'minutes ago']
-        for indicator in time_indicators:
-            if indicator in summary.lower():
-                freshness_score = 1.0
-                break
+        summary_lower = summary.lower()
+        if any(indicator in summary_lower for indicator in FRESHNESS_INDICATORS):
+            freshness_score = 1.0
         score += freshness_score * 0.1
     else:
         # For non-current-event queries, give neutral freshness score
@@ -385,23 +420,16 @@ def _preprocess_query(query: str) -> str:
     Remove noise phrases and role-play titles from query BEFORE keyword extraction.
     This prevents YAKE from extracting words from these phrases.
     """
-    import re
-    cleaned = query
-
     # Remove role-play patterns like "act as a financial analyst"
     # This catches variations like "act as an expert", "acting as a consultant", etc.
-    cleaned = re.sub(r'\b(act(ing)?|behave|pretend|imagine you are|you are|be) as (a|an|the)?\s*\w+(\s+\w+)?\b', '', cleaned, flags=re.IGNORECASE)
-
-    # Remove specific role-play titles
-    for title in ROLE_PLAY_TITLES:
-        cleaned = re.sub(rf'\b{re.escape(title)}\b', '', cleaned, flags=re.IGNORECASE)
+    cleaned = _ROLE_PLAY_RE.sub('', query)
 
-    # Remove noise phrases
-    for phrase in NOISE_PHRASES:
-        cleaned = re.sub(rf'\b{re.escape(phrase)}\b', '', cleaned, flags=re.IGNORECASE)
+    # Remove specific role-play titles, then noise phrases
+    cleaned = _ROLE_PLAY_TITLES_RE.sub('', cleaned)
+    cleaned = _NOISE_PHRASES_RE.sub('', cleaned)
 
     # Clean up extra whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
 
     return cleaned
 
@@ -488,7 +516,11 @@ def extract_search_keywords(query: str, max_keywords: int = 6) -> str:
 
 # Rate limit handling
 MAX_RETRIES = 2
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds (doubled on each retry)
+
+# Worker threads reserved for the blocking DDGS client (kept separate from the
+# default executor so bursts of searches cannot starve other to_thread() users)
+DDGS_WORKERS = int(os.getenv("DDGS_WORKERS", "4"))
 
 # Total timeout budget for all search operations (including content fetching)
 SEARCH_TIMEOUT_BUDGET = 60  # seconds total
@@ -514,6 +546,58 @@ def get_sync_client() -> httpx.Client:
     return _sync_client
 
 
+_ddgs_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_ddgs_executor() -> ThreadPoolExecutor:
+    """Get the DDGS thread pool, creating it on first use."""
+    global _ddgs_executor
+    if _ddgs_executor is None:
+        _ddgs_executor = ThreadPoolExecutor(max_workers=DDGS_WORKERS, thread_name_prefix="ddgs")
+    return _ddgs_executor
+
+
+def shutdown_search_executor():
+    """Stop the DDGS thread pool without waiting for in-flight searches. Called on application shutdown."""
+    global _ddgs_executor
+    if _ddgs_executor is not None:
+        _ddgs_executor.shutdown(wait=False, cancel_futures=True)
+        _ddgs_executor = None
+
+
+def _ddgs_query_sync(kind: str, query: str, max_results: int) -> List[Dict]:
+    """Run one DDGS text or news query (blocking; the library has no async API)."""
+    with DDGS() as ddgs:
+        search = ddgs.news if kind == "news" else ddgs.text
+        return list(search(query, max_results=max_results))
+
+
+async def _ddgs_query(kind: str, query: str, max_results: int) -> List[Dict]:
+    """
+    Run a DDGS query on the DDGS thread pool, retrying rate limits with backoff.
+
+    Returns the raw results, or an empty list if the query fails.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return await loop.run_in_executor(
+                _get_ddgs_executor(),
+                functools.partial(_ddgs_query_sync, kind, query, max_results),
+            )
+        except RatelimitException as e:
+            if attempt < MAX_RETRIES:
+                delay = RETRY_DELAY * (2 ** attempt)
+                logger.warning(f"DuckDuckGo rate limit hit on {kind} search, retrying in {delay}s...")
+                await asyncio.sleep(delay)
+            else:
+                logger.warning(f"{kind.capitalize()} search failed: {e}")
+        except Exception as e:
+            logger.warning(f"{kind.capitalize()} search failed: {e}")
+            break
+    return []
+
+
 class SearchProvider(str, Enum):
     DUCKDUCKGO = "duckduckgo"
     TAVILY = "tavily"
@@ -527,8 +611,9 @@ async def perform_web_search(
     provider: SearchProvider = SearchProvider.DUCKDUCKGO,
     full_content_results: int = 3,
     keyword_extraction: str = "direct",
-    hybrid_mode: bool = True
-) -> Dict[str, str]:
+    hybrid_mode: bool = True,
+    defer_content: bool = False
+) -> Dict[str, Any]:
     """
     Perform a web search using the specified provider.
 
@@ -539,9 +624,12 @@ async def perform_web_search(
         full_content_results: Number of top results to fetch full content for (0 to disable)
         keyword_extraction: "yake" for keyword extraction, "direct" for raw query
         hybrid_mode: For DuckDuckGo, whether to combine web+news search (default True)
+        defer_content: Return ranked snippets without waiting for full-content fetches
 
     Returns:
-        Dict with 'results' (formatted string), 'extracted_query' (query used), 'intent' (detected intent)
+        Dict with 'results' (formatted string), 'extracted_query' (query used), 'intent' (detected intent).
+        With defer_content, also 'content_task' when fetches are still running: a task
+        resolving to the results with full content (or to the snippets if it fails).
     """
     # For DuckDuckGo with new optimization, we handle query processing internally
     # For other providers, use the legacy keyword extraction if enabled
@@ -550,30 +638,54 @@ async def perform_web_search(
             extracted_query = extract_search_keywords(query)
         else:
             extracted_query = query.strip()
+        # Only used to pick the cache lifetime; these providers report intent "unknown"
+        intent = detect_query_intent(query)
+        cache_query = extracted_query
     else:
         # DuckDuckGo uses internal query optimization
         extracted_query = query.strip()
+        query_info = optimize_search_query(query)
+        intent = query_info["intent"]
+        cache_query = query_info["web_query"]
+
+    # Reuse a recent identical search (same provider, optimized query and options)
+    cache = get_search_cache()
+    if cache:
+        key = search_cache_key(
+            provider.value,
+            cache_query,
+            max_results,
+            full_content_results,
+            hybrid_mode and provider == SearchProvider.DUCKDUCKGO,
+        )
+        cached = await cache.get(key)
+        if cached is not None:
+            logger.info(f"Search cache hit ({provider.value}, intent={intent})")
+            return cached
+
+    # Full-content fetches still running when defer_content is set
+    background: Optional[List[asyncio.Task]] = [] if defer_content else None
 
     try:
         if provider == SearchProvider.TAVILY:
             results = await _search_tavily(extracted_query, max_results)
-            return {"results": results, "extracted_query": extracted_query, "intent": "unknown"}
+            result = {"results": results, "extracted_query": extracted_query, "intent": "unknown"}
         elif provider == SearchProvider.BRAVE:
-            results = await _search_brave(extracted_query, max_results, full_content_results)
-            return {"results": results, "extracted_query": extracted_query, "intent": "unknown"}
+            results = await _search_brave(extracted_query, max_results, full_content_results, background)
+            result = {"results": results, "extracted_query": extracted_query, "intent": "unknown"}
         elif provider == SearchProvider.SERPER:
-            results = await _search_serper(extracted_query, max_results, full_content_results)
-            return {"results": results, "extracted_query": extracted_query, "intent": "unknown"}
+            results = await _search_serper(extracted_query, max_results, full_content_results, background)
+            result = {"results": results, "extracted_query": extracted_query, "intent": "unknown"}
         else:
             # DuckDuckGo - now with hybrid search, optimization, and reranking
-            query_info = optimize_search_query(query)
             results = await _search_duckduckgo(
                 query, 
                 max_results, 
                 full_content_results,
-                hybrid_mode=hybrid_mode
+                hybrid_mode=hybrid_mode,
+                background=background
             )
-            return {
+            result = {
                 "results": results, 
                 "extracted_query": query_info["web_query"],
                 "intent": query_info["intent"]
@@ -587,12 +699,33 @@ async def perform_web_search(
             "intent": "unknown"
         }
 
+    if background:
+        # Cache the enriched results once the fetches land, not the snippets
+        async def _enrich() -> str:
+            try:
+                enriched = await background[0]
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Full-content fetch failed, keeping snippets: {e}")
+                return result["results"]
+            if cache:
+                await cache.put(key, {**result, "results": enriched}, intent)
+            return enriched
+
+        return {**result, "content_task": asyncio.create_task(_enrich())}
+
+    if cache:
+        await cache.put(key, result, intent)
+    return result
+
 
 async def _search_duckduckgo(
     query: str, 
     max_results: int = 8, 
     full_content_results: int = 3,
-    hybrid_mode: bool = True
+    hybrid_mode: bool = True,
+    background: Optional[List[asyncio.Task]] = None
 ) -> str:
     """
     Search using DuckDuckGo with hybrid web+news strategy and intelligent reranking.
@@ -608,6 +741,7 @@ async def _search_duckduckgo(
         max_results: Maximum final results to return
         full_content_results: Number of top results to fetch full content for
         hybrid_mode: Whether to combine web and news search
+        background: If given, return snippets at once and defer content fetches (see _complete_results)
     """
     start_time = time.time()
     
@@ -623,73 +757,48 @@ async def _search_duckduckgo(
         print(f"🔍 News query: '{news_query[:60]}...'")
 
     # Step 2: Run searches (hybrid or single based on intent and settings)
-    def _do_ddgs_search():
-        """Sync helper for DDGS library which doesn't support async."""
-        web_results = []
-        news_results = []
-        
-        # Determine search strategy based on intent
-        do_web_search = True
-        do_news_search = hybrid_mode and intent in ("current_event", "factual")
-        
-        # Adjust result counts for hybrid mode
-        if hybrid_mode and do_news_search:
-            web_count = max(max_results - 2, 4)  # More web results
-            news_count = max(4, max_results // 2)  # Fewer news results
-        else:
-            web_count = max_results + 2  # Fetch extra to allow filtering
-            news_count = 0
-        
-        for attempt in range(MAX_RETRIES + 1):
-            try:
-                with DDGS() as ddgs:
-                    # Web search
-                    if do_web_search:
-                        try:
-                            raw_web = list(ddgs.text(web_query, max_results=web_count))
-                            for result in raw_web:
-                                web_results.append({
-                                    'title': result.get('title', 'No Title'),
-                                    'url': result.get('url', result.get('href', '#')),
-                                    'summary': result.get('body', result.get('excerpt', '')),
-                                    'source': result.get('source', ''),
-                                    'type': 'web',
-                                    'content': None
-                                })
-                        except Exception as e:
-                            logger.warning(f"Web search failed: {e}")
-                    
-                    # News search (for hybrid mode)
-                    if do_news_search and news_count > 0:
-                        try:
-                            raw_news = list(ddgs.news(news_query, max_results=news_count))
-                            for result in raw_news:
-                                news_results.append({
-                                    'title': result.get('title', 'No Title'),
-                                    'url': result.get('url', result.get('link', '#')),
-                                    'summary': result.get('body', result.get('excerpt', '')),
-                                    'source': result.get('source', ''),
-                                    'type': 'news',
-                                    'date': result.get('date', ''),
-                                    'content': None
-                                })
-                        except Exception as e:
-                            logger.warning(f"News search failed: {e}")
-                    
-                    break  # Success, exit retry loop
-                    
-            except Exception as e:
-                if "Ratelimit" in str(e) and attempt < MAX_RETRIES:
-                    logger.warning(f"DuckDuckGo rate limit hit, retrying in {RETRY_DELAY}s...")
-                    time.sleep(RETRY_DELAY * (attempt + 1))
-                else:
-                    raise
-        
-        return web_results, news_results
+    do_news_search = hybrid_mode and intent in ("current_event", "factual")
+
+    # Adjust result counts for hybrid mode
+    if do_news_search:
+        web_count = max(max_results - 2, 4)  # More web results
+        news_count = max(4, max_results // 2)  # Fewer news results
+    else:
+        web_count = max_results + 2  # Fetch extra to allow filtering
+        news_count = 0
+
+    # Web and news searches run concurrently on the DDGS thread pool
+    searches = [_ddgs_query("web", web_query, web_count)]
+    if news_count > 0:
+        searches.append(_ddgs_query("news", news_query, news_count))
+    raw_results = await asyncio.gather(*searches)
+    raw_web = raw_results[0]
+    raw_news = raw_results[1] if news_count > 0 else []
+
+    web_results = [
+        {
+            'title': result.get('title', 'No Title'),
+            'url': result.get('url', result.get('href', '#')),
+            'summary': result.get('body', result.get('excerpt', '')),
+            'source': result.get('source', ''),
+            'type': 'web',
+            'content': None
+        }
+        for result in raw_web
+    ]
+    news_results = [
+        {
+            'title': result.get('title', 'No Title'),
+            'url': result.get('url', result.get('link', '#')),
+            'summary': result.get('body', result.get('excerpt', '')),
+            'source': result.get('source', ''),
+            'type': 'news',
+            'date': result.get('date', ''),
+            'content': None
+        }
+        for result in raw_news
+    ]
 
-    # Execute sync DDGS search in thread pool
-    web_results, news_results = await asyncio.to_thread(_do_ddgs_search)
-    
     print(f"📊 Got {len(web_results)} web results, {len(news_results)} news results")
     
     # Step 3: Merge and deduplicate results
@@ -732,47 +841,58 @@ async def _search_duckduckgo(
             url = r.get('url', '')
             if url and url != '#':
                 urls_to_fetch.append((i, url))
-    
-    if urls_to_fetch:
-        elapsed = time.time() - start_time
-        remaining = SEARCH_TIMEOUT_BUDGET - elapsed
-
-        if remaining > 5:  # Need at least 5s to fetch content
-            fetch_timeout = min(remaining, 25.0)
-
-            async def fetch_with_index(idx: int, url: str):
-                """Wrapper to return index along with content for result mapping."""
-                content = await _fetch_with_jina(url, timeout=fetch_timeout)
-                return (idx, content)
-
-            tasks = [fetch_with_index(idx, url) for idx, url in urls_to_fetch]
-
-            print(f"⚡ Starting PARALLEL fetch of {len(tasks)} URLs via Jina Reader...")
-            fetch_start = time.time()
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            fetch_elapsed = time.time() - fetch_start
-            print(f"⚡ Parallel fetch completed in {fetch_elapsed:.2f}s")
-
-            successful = 0
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.warning(f"Parallel Jina fetch failed: {result}")
-                    continue
-
-                idx, content = result
-                if content:
-                    successful += 1
-                    if len(content) < 500:
-                        original_summary = final_results[idx]['summary']
-                        content += f"\n\n[System Note: Full content fetch yielded limited text.]\nOriginal Summary: {original_summary}"
-                    final_results[idx]['content'] = content
-            print(f"⚡ Successfully fetched content from {successful}/{len(tasks)} URLs")
-        else:
-            logger.warning("Search timeout budget exhausted, skipping content fetches")
 
     # Step 7: Format results
+    return await _complete_results(final_results, urls_to_fetch, start_time, background=background)
+
+
+async def _fetch_full_content(results: List[Dict], urls_to_fetch: List[Tuple[int, str]], start_time: float, label: str = ""):
+    """
+    Fetch full content for (index, url) pairs IN PARALLEL via Jina Reader.
+    Stores it in each result's 'content'; stops at the search timeout budget.
+    """
+    elapsed = time.time() - start_time
+    remaining = SEARCH_TIMEOUT_BUDGET - elapsed
+
+    if remaining <= 5:  # Need at least 5s to fetch content
+        logger.warning("Search timeout budget exhausted, skipping content fetches")
+        return
+
+    fetch_timeout = min(remaining, 25.0)
+
+    async def fetch_with_index(idx: int, url: str):
+        """Wrapper to return index along with content for result mapping."""
+        content = await _fetch_with_jina(url, timeout=fetch_timeout)
+        return (idx, content)
+
+    tasks = [fetch_with_index(idx, url) for idx, url in urls_to_fetch]
+
+    print(f"⚡ {label}Starting PARALLEL fetch of {len(tasks)} URLs via Jina Reader...")
+    fetch_start = time.time()
+    fetched = await asyncio.gather(*tasks, return_exceptions=True)
+    fetch_elapsed = time.time() - fetch_start
+    print(f"⚡ {label}Parallel fetch completed in {fetch_elapsed:.2f}s")
+
+    successful = 0
+    for result in fetched:
+        if isinstance(result, Exception):
+            logger.warning(f"Parallel Jina fetch failed: {result}")
+            continue
+
+        idx, content = result
+        if content:
+            successful += 1
+            if len(content) < 500:
+                original_summary = results[idx]['summary']
+                content += f"\n\n[System Note: Full content fetch yielded limited text.]\nOriginal Summary: {original_summary}"
+            results[idx]['content'] = content
+    print(f"⚡ {label}Successfully fetched content from {successful}/{len(tasks)} URLs")
+
+
+def _format_results(results: List[Dict]) -> str:
+    """Format results for the prompt: full content (truncated) where fetched, else the snippet."""
     formatted = []
-    for r in final_results:
+    for r in results:
         text = f"Result {r['index']}:\nTitle: {r['title']}\nURL: {r['url']}"
         if r.get('source'):
             text += f"\nSource: {r['source']}"
@@ -781,6 +901,7 @@ async def _search_duckduckgo(
         if r.get('relevance_score'):
             text += f"\n[Relevance: {r['relevance_score']:.2f}]"
         if r.get('content'):
+            # Truncate content to ~2000 chars
             content = r['content'][:2000]
             if len(r['content']) > 2000:
                 content += "..."
@@ -792,6 +913,34 @@ async def _search_duckduckgo(
     return "\n\n".join(formatted)
 
 
+async def _complete_results(
+    results: List[Dict],
+    urls_to_fetch: List[Tuple[int, str]],
+    start_time: float,
+    label: str = "",
+    background: Optional[List[asyncio.Task]] = None
+) -> str:
+    """
+    Fetch full content for the top results and format them.
+
+    When `background` is a list, the snippets are formatted and returned right
+    away instead; the fetches continue in a task (appended to `background`)
+    that resolves to the formatted results with full content.
+    """
+    if background is not None and urls_to_fetch:
+        async def _enrich() -> str:
+            await _fetch_full_content(results, urls_to_fetch, start_time, label)
+            return _format_results(results)
+
+        snippets = _format_results(results)
+        background.append(asyncio.create_task(_enrich()))
+        return snippets
+
+    if urls_to_fetch:
+        await _fetch_full_content(results, urls_to_fetch, start_time, label)
+    return _format_results(results)
+
+
 def _fetch_with_jina_sync(url: str, timeout: float = 25.0) -> Optional[str]:
     """
     Fetch article content using Jina Reader API (sync version for DuckDuckGo).
@@ -820,24 +969,39 @@ async def _fetch_with_jina(url: str, timeout: float = 25.0) -> Optional[str]:
     """
     Fetch article content using Jina Reader API (async).
     Returns clean markdown content. Uses connection pooling.
+
+    Pages are cached by URL (see page_cache.py): fresh copies skip the
+    request, stale ones are revalidated and still used if the fetch fails.
     """
+    cache = get_page_cache()
+    cached = await cache.lookup(url) if cache else None
+    if cached and cache.is_fresh(cached):
+        return cached["content"]
+    stale_content = cached["content"] if cached else None
+
     try:
         jina_url = f"https://r.jina.ai/{url}"
         client = get_async_client()
-        response = await client.get(jina_url, headers={
-            "Accept": "text/plain",
-        }, timeout=timeout)
+        headers = {"Accept": "text/plain"}
+        if cached:
+            headers.update(cache.validators(cached))
+        response = await client.get(jina_url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and cached:
+            await cache.refresh(cached)
+            return stale_content
         if response.status_code == 200:
+            if cache:
+                await cache.store(url, response.text, response.headers)
             return response.text
         else:
             logger.warning(f"Jina Reader returned {response.status_code} for {url}")
-            return None
+            return stale_content
     except httpx.TimeoutException:
         logger.warning(f"Timeout while fetching content via Jina for {url}")
-        return None
+        return stale_content
     except Exception as e:
         logger.warning(f"Failed to fetch content via Jina for {url}: {e}")
-        return None
+        return stale_content
 
 
 async def _search_tavily(query: str, max_results: int = 5) -> str:
@@ -888,10 +1052,16 @@ async def _search_tavily(query: str, max_results: int = 5) -> str:
         return "[System Note: Tavily search failed. Please try again.]"
 
 
-async def _search_brave(query: str, max_results: int = 5, full_content_results: int = 3) -> str:
+async def _search_brave(
+    query: str,
+    max_results: int = 5,
+    full_content_results: int = 3,
+    background: Optional[List[asyncio.Task]] = None
+) -> str:
     """
     Search using Brave Search API (async).
-    Optionally fetches full content via Jina Reader for top N results.
+    Optionally fetches full content via Jina Reader for top N results
+    (deferred when `background` is given, see _complete_results).
     Requires BRAVE_API_KEY environment variable. Uses connection pooling.
     """
     start_time = time.time()
@@ -942,43 +1112,11 @@ async def _search_brave(query: str, max_results: int = 5, full_content_results:
             if full_content_results > 0 and i <= full_content_results and url and url != '#':
                 urls_to_fetch.append((i - 1, url))
 
-        # Fetch full content via Jina Reader for top results
-        for idx, url in urls_to_fetch:
-            # Check remaining time budget
-            elapsed = time.time() - start_time
-            remaining = SEARCH_TIMEOUT_BUDGET - elapsed
-
-            if remaining <= 5:  # Need at least 5s to fetch content
-                logger.warning(f"Search timeout budget exhausted, skipping remaining content fetches")
-                break
-
-            # Use remaining time as timeout for this fetch
-            content = await _fetch_with_jina(url, timeout=min(remaining, 25.0))
-            if content:
-                # If content is very short, append summary
-                if len(content) < 500:
-                    original_summary = search_results_data[idx]['summary']
-                    content += f"\n\n[System Note: Full content fetch yielded limited text. Appending original summary.]\nOriginal Summary: {original_summary}"
-                search_results_data[idx]['content'] = content
-
         if not search_results_data:
             return "No web search results found."
 
-        # Format results
-        formatted = []
-        for r in search_results_data:
-            text = f"Result {r['index']}:\nTitle: {r['title']}\nURL: {r['url']}"
-            if r['content']:
-                # Truncate content to ~2000 chars
-                content = r['content'][:2000]
-                if len(r['content']) > 2000:
-                    content += "..."
-                text += f"\nContent:\n{content}"
-            else:
-                text += f"\nSummary: {r['summary']}"
-            formatted.append(text)
-
-        return "\n\n".join(formatted)
+        # Fetch full content via Jina Reader for top results, then format
+        return await _complete_results(search_results_data, urls_to_fetch, start_time, "Brave: ", background)
 
     except httpx.HTTPStatusError as e:
         logger.error(f"Brave API error: {e.response.status_code} - {e.response.text}")
@@ -988,10 +1126,16 @@ async def _search_brave(query: str, max_results: int = 5, full_content_results:
         return "[System Note: Brave search failed. Please try again.]"
 
 
-async def _search_serper(query: str, max_results: int = 10, full_content_results: int = 3) -> str:
+async def _search_serper(
+    query: str,
+    max_results: int = 10,
+    full_content_results: int = 3,
+    background: Optional[List[asyncio.Task]] = None
+) -> str:
     """
     Search using Serper.dev API (Google Search results).
-    Optionally fetches full content via Jina Reader for top N results.
+    Optionally fetches full content via Jina Reader for top N results
+    (deferred when `background` is given, see _complete_results).
     Requires SERPER_API_KEY environment variable. Uses connection pooling.
     """
     start_time = time.time()
@@ -1041,60 +1185,11 @@ async def _search_serper(query: str, max_results: int = 10, full_content_results
             if full_content_results > 0 and i <= full_content_results and url and url != '#':
                 urls_to_fetch.append((i - 1, url))
 
-        # Fetch full content via Jina Reader for top results IN PARALLEL
-        if urls_to_fetch:
-            elapsed = time.time() - start_time
-            remaining = SEARCH_TIMEOUT_BUDGET - elapsed
-
-            if remaining > 5:
-                fetch_timeout = min(remaining, 25.0)
-
-                async def fetch_with_index(idx: int, url: str):
-                    content = await _fetch_with_jina(url, timeout=fetch_timeout)
-                    return (idx, content)
-
-                tasks = [fetch_with_index(idx, url) for idx, url in urls_to_fetch]
-
-                print(f"⚡ Serper: Starting PARALLEL fetch of {len(tasks)} URLs via Jina Reader...")
-                fetch_start = time.time()
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                fetch_elapsed = time.time() - fetch_start
-                print(f"⚡ Serper: Parallel fetch completed in {fetch_elapsed:.2f}s")
-
-                successful = 0
-                for result in results:
-                    if isinstance(result, Exception):
-                        logger.warning(f"Parallel Jina fetch failed: {result}")
-                        continue
-
-                    idx, content = result
-                    if content:
-                        successful += 1
-                        if len(content) < 500:
-                            original_summary = search_results_data[idx]['summary']
-                            content += f"\n\n[System Note: Full content fetch yielded limited text.]\nOriginal Summary: {original_summary}"
-                        search_results_data[idx]['content'] = content
-                print(f"⚡ Serper: Successfully fetched content from {successful}/{len(tasks)} URLs")
-            else:
-                logger.warning("Search timeout budget exhausted, skipping content fetches")
-
         if not search_results_data:
             return "No web search results found."
 
-        # Format results
-        formatted = []
-        for r in search_results_data:
-            text = f"Result {r['index']}:\nTitle: {r['title']}\nURL: {r['url']}"
-            if r.get('content'):
-                content = r['content'][:2000]
-                if len(r['content']) > 2000:
-                    content += "..."
-                text += f"\nContent:\n{content}"
-            else:
-                text += f"\nSummary: {r['summary']}"
-            formatted.append(text)
-
-        return "\n\n".join(formatted)
+        # Fetch full content via Jina Reader for top results IN PARALLEL, then format
+        return await _complete_results(search_results_data, urls_to_fetch, start_time, "Serper: ", background)
 
     except httpx.HTTPStatusError as e:
         logger.error(f"Serper API error: {e.response.status_code} - {e.response.text}")
@@ -0,0 +1,96 @@
+"""Cache of web search results.
+
+The same question asked minutes apart, even in different conversations,
+reuses the earlier search (and any full-page content fetched with it)
+instead of querying the search provider and Jina Reader again.
+
+Entries are keyed on the provider, the optimized query and the options
+that change the results. How long an entry lives depends on the query's
+intent (see search.detect_query_intent): current events go stale within
+minutes, factual and research answers do not. Built on the two-tier cache
+in response_cache.py: an in-memory LRU, plus a disk directory when
+SEARCH_CACHE_DIR is set. Disable with SEARCH_CACHE=0.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from .config import (
+    SEARCH_CACHE_ENABLED,
+    SEARCH_CACHE_TTL,
+    SEARCH_CACHE_TTL_CURRENT_EVENT,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_MAX_BYTES,
+    SEARCH_CACHE_DIR,
+    SEARCH_CACHE_DISK_MAX_BYTES,
+)
+from .response_cache import ResponseCache
+
+# Bump when the key derivation or the stored result format changes
+KEY_VERSION = 1
+
+# Results that report a failure rather than search results
+_FAILURE_PREFIXES = ("[System Note:", "No web search results found")
+
+
+def search_cache_key(
+    provider: str,
+    query: str,
+    max_results: int,
+    full_content_results: int,
+    hybrid_mode: bool,
+) -> str:
+    """sha256 over everything that determines a search's results."""
+    payload = json.dumps(
+        {
+            "v": KEY_VERSION,
+            "provider": provider,
+            "query": " ".join(query.lower().split()),
+            "max_results": max_results,
+            "full_content_results": full_content_results,
+            "hybrid_mode": hybrid_mode,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def ttl_for_intent(intent: str) -> float:
+    """Seconds a search with this intent stays fresh."""
+    if intent == "current_event":
+        return SEARCH_CACHE_TTL_CURRENT_EVENT
+    return SEARCH_CACHE_TTL
+
+
+class SearchCache(ResponseCache):
+    """ResponseCache for perform_web_search() results, with per-intent TTLs."""
+
+    async def put(self, key: str, result: Optional[Dict[str, Any]], intent: str = "factual"):
+        """Store a search result unless it reports a failure or found nothing."""
+        if not result or not isinstance(result.get("results"), str):
+            return
+        if result["results"].lstrip().startswith(_FAILURE_PREFIXES):
+            return
+        await self._store(key, result, ttl_for_intent(intent))
+
+
+_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Get the shared search cache, or None when SEARCH_CACHE is disabled."""
+    global _cache
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = SearchCache(
+            # Longest lifetime of any entry, used when pruning the disk tier
+            ttl=max(SEARCH_CACHE_TTL, SEARCH_CACHE_TTL_CURRENT_EVENT),
+            max_entries=SEARCH_CACHE_MAX_ENTRIES,
+            max_bytes=SEARCH_CACHE_MAX_BYTES,
+            directory=SEARCH_CACHE_DIR,
+            disk_max_bytes=SEARCH_CACHE_DISK_MAX_BYTES,
+        )
+    return _cache
@@ -0,0 +1,50 @@
+"""JSON encoding for SSE events, storage and API responses.
+
+Uses orjson when it is installed (``pip install orjson``) and the standard
+library otherwise. Both produce compact JSON (no indentation or spaces);
+the stdlib fallback keeps escaping non-ASCII characters, its fastest mode
+in CPython. Either one reads what the other wrote, so switching between
+them needs no data migration.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+if orjson is not None:
+    # Non-string keys (e.g. int-keyed filter maps) are stringified like json.dumps does
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def dumps(obj: Any) -> str:
+        """Serialize to a compact JSON string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from a string or bytes."""
+        return orjson.loads(data)
+
+else:
+    _encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes."""
+        return _encoder.encode(obj).encode("ascii")
+
+    def dumps(obj: Any) -> str:
+        """Serialize to a compact JSON string."""
+        return _encoder.encode(obj)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from a string or bytes."""
+        return json.loads(data)
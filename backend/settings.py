@@ -2,9 +2,10 @@
 
 import json
 import os
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, List, Dict
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Tuple
+from pydantic import BaseModel, ConfigDict
 from .search import SearchProvider
 
 # Settings file path
@@ -67,11 +68,14 @@ from .prompts import (
 )
 
 class Settings(BaseModel):
-    """Application settings."""
+    """Application settings (immutable snapshot; use update_settings() to change)."""
+    model_config = ConfigDict(frozen=True)
+
     search_provider: SearchProvider = SearchProvider.DUCKDUCKGO
     search_keyword_extraction: str = "direct"  # "direct" or "yake"
     search_result_count: int = 8  # Number of search results (5-15, default 8)
     search_hybrid_mode: bool = True  # Combine web+news search for DuckDuckGo
+    search_progressive_content: bool = False  # Start Stage 1 on snippets; full-content fetches land later
 
     # API Keys
     tavily_api_key: Optional[str] = None
@@ -107,6 +111,29 @@ class Settings(BaseModel):
     council_temperature: float = 0.5
     chairman_temperature: float = 0.4
     stage2_temperature: float = 0.3  # Lower for consistent ranking output
+
+    # Stage 1 early exit: proceed once this many council members answered
+    # successfully (0 = wait for all), or after the soft deadline in seconds
+    # with at least one answer (0 = no deadline). Remaining seats are cancelled.
+    stage1_quorum: int = 0
+    stage1_soft_deadline: float = 0.0
+
+    # Hedged requests: optional backup model per council member (model id ->
+    # fallback model id). If the member has not answered (or streamed a first
+    # token) within the hedge_percentile of its recent latency (at least
+    # hedge_min_delay seconds; hedge_default_delay while there is too little
+    # history), or it fails, the fallback is queried too and the first
+    # successful answer wins.
+    council_fallbacks: Dict[str, str] = {}
+    hedge_percentile: float = 0.9
+    hedge_min_delay: float = 2.0
+    hedge_default_delay: float = 15.0
+
+    # Pipelined Stage 2: start ranking once this many Stage 1 answers exist
+    # (0 = wait for Stage 1 to finish); answers arriving within the re-rank
+    # window (seconds) restart the ranking, later ones are not ranked
+    stage2_pipeline_quorum: int = 0
+    stage2_rerank_window: float = 10.0
     
     # Remote/Local filters
     council_member_filters: Optional[Dict[int, str]] = None
@@ -125,8 +152,25 @@ class Settings(BaseModel):
     execution_mode: str = "full"  # Default execution mode: 'chat_only', 'chat_ranking', 'full'
 
 
-def get_settings() -> Settings:
-    """Load settings from file, or return defaults."""
+# Cached settings snapshot, keyed by the settings file's (mtime_ns, size)
+_cached_settings: Optional[Settings] = None
+_cached_file_key: Optional[Tuple[int, int]] = None
+
+# Snapshot pinned for the current request (inherited by tasks it spawns)
+_request_settings: ContextVar[Optional[Settings]] = ContextVar("request_settings", default=None)
+
+
+def _settings_file_key() -> Optional[Tuple[int, int]]:
+    """Return a cheap change marker for the settings file, or None if missing."""
+    try:
+        stat = SETTINGS_FILE.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_settings_file() -> Settings:
+    """Read and validate settings from disk (uncached)."""
     if SETTINGS_FILE.exists():
         try:
             with open(SETTINGS_FILE, "r") as f:
@@ -137,6 +181,50 @@ def get_settings() -> Settings:
     return Settings()
 
 
+def _load_settings() -> Settings:
+    """Return the cached settings, re-reading the file only if it changed."""
+    global _cached_settings, _cached_file_key
+    file_key = _settings_file_key()
+    if _cached_settings is None or file_key != _cached_file_key:
+        _cached_settings = _read_settings_file()
+        _cached_file_key = file_key
+    return _cached_settings
+
+
+def invalidate_settings_cache() -> None:
+    """Drop the cached settings so the next read goes to disk."""
+    global _cached_settings, _cached_file_key
+    _cached_settings = None
+    _cached_file_key = None
+
+
+def get_settings() -> Settings:
+    """
+    Get current settings, or defaults if no settings file exists.
+
+    Returns the snapshot pinned by pin_settings() when called inside a request
+    that pinned one; otherwise the cached settings, which are invalidated on
+    save and whenever the settings file changes on disk.
+    """
+    pinned = _request_settings.get()
+    if pinned is not None:
+        return pinned
+    return _load_settings()
+
+
+def pin_settings() -> Settings:
+    """
+    Pin the current settings snapshot for the rest of the calling context.
+
+    Every get_settings() call made by this task (and by tasks it creates
+    afterwards) returns the same snapshot, so one council turn sees
+    consistent settings even if they are edited mid-turn.
+    """
+    snapshot = _load_settings()
+    _request_settings.set(snapshot)
+    return snapshot
+
+
 def save_settings(settings: Settings) -> None:
     """Save settings to file."""
     # Ensure data directory exists
@@ -145,10 +233,14 @@ def save_settings(settings: Settings) -> None:
     with open(SETTINGS_FILE, "w") as f:
         json.dump(settings.model_dump(), f, indent=2)
 
+    global _cached_settings, _cached_file_key
+    _cached_settings = settings
+    _cached_file_key = _settings_file_key()
+
 
 def update_settings(**kwargs) -> Settings:
     """Update specific settings and save."""
-    current = get_settings()
+    current = _load_settings()
     updated_data = current.model_dump()
     updated_data.update(kwargs)
     updated = Settings(**updated_data)
@@ -0,0 +1,75 @@
+"""Server-Sent Events framing.
+
+Streaming endpoints yield one framed event per chunk; StreamingResponse
+hands each chunk to the server as its own body message, so an event is
+flushed to the client as soon as it is yielded (no sleeps needed to "push"
+it out). Where several events are already waiting, as when a client resumes
+a detached run, batch() frames them into a single write instead.
+
+Streams can also be compressed (compress()): each event is flushed through
+the compressor on its own, so it still reaches the client immediately.
+"""
+
+import importlib.util
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+from . import serialization
+
+# Brotli needs the optional 'brotli' package; gzip is always available
+BROTLI_AVAILABLE = importlib.util.find_spec("brotli") is not None
+
+
+def event(payload: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    """Frame a JSON payload as one SSE event, with an optional id for resuming."""
+    data = f"data: {serialization.dumps(payload)}\n\n"
+    return with_id(data, event_id) if event_id is not None else data
+
+
+def with_id(chunk: str, event_id: int) -> str:
+    """Prefix an already framed event with its id."""
+    return f"id: {event_id}\n{chunk}"
+
+
+def batch(chunks: Iterable[str]) -> str:
+    """Coalesce framed events into one write (events stay separate on the client)."""
+    return "".join(chunks)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick "br" or "gzip" from an Accept-Encoding header, or None for identity."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+async def compress(chunks: AsyncIterator[str], encoding: str) -> AsyncIterator[bytes]:
+    """Compress a stream of events with `encoding` ("br" or "gzip"), flushing after each."""
+    if encoding == "br":
+        import brotli
+
+        compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=5)
+        async for chunk in chunks:
+            yield compressor.process(chunk.encode("utf-8")) + compressor.flush()
+        yield compressor.finish()
+        return
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    async for chunk in chunks:
+        yield compressor.compress(chunk.encode("utf-8")) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
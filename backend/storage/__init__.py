@@ -0,0 +1,264 @@
+"""Conversation storage.
+
+The module-level functions delegate to the backend selected by the
+``STORAGE_BACKEND`` environment variable (``jsonl`` or ``sqlite``).
+"""
+
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from ..config import STORAGE_BACKEND
+from .base import StorageBackend, now_iso
+from .jsonl import JsonlStorage
+from .sqlite import SQLiteStorage
+
+# Available backends
+BACKENDS = {
+    "jsonl": JsonlStorage,
+    "sqlite": SQLiteStorage,
+}
+
+_backend: Optional[StorageBackend] = None
+
+
+def get_backend() -> StorageBackend:
+    """Get the configured storage backend, creating it on first use."""
+    global _backend
+    if _backend is None:
+        backend_cls = BACKENDS.get(STORAGE_BACKEND)
+        if backend_cls is None:
+            raise ValueError(
+                f"Unknown STORAGE_BACKEND '{STORAGE_BACKEND}'. Must be one of: {list(BACKENDS)}"
+            )
+        _backend = backend_cls()
+    return _backend
+
+
+def migrate() -> int:
+    """Import data left by older storage formats into the active backend."""
+    return get_backend().migrate()
+
+
+def close():
+    """Release backend resources. Called on application shutdown."""
+    global _backend
+    if _backend is not None:
+        _backend.close()
+        _backend = None
+
+
+def create_conversation(conversation_id: str) -> Dict[str, Any]:
+    """
+    Create a new conversation.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        New conversation dict
+    """
+    return get_backend().create_conversation(conversation_id)
+
+
+def get_conversation(conversation_id: str, summary: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Load a conversation from storage.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+        summary: Return assistant messages without Stage 1/2 detail and large
+            metadata (see base.summarize_message); fetch them with get_message()
+
+    Returns:
+        Conversation dict or None if not found
+    """
+    backend = get_backend()
+    if not summary:
+        return backend.get_conversation(conversation_id)
+
+    meta = backend.get_conversation_meta(conversation_id)
+    if meta is None:
+        return None
+    return {
+        "id": meta["id"],
+        "created_at": meta["created_at"],
+        "title": meta["title"],
+        "messages": list(backend.iter_message_summaries(conversation_id)),
+    }
+
+
+def get_conversation_meta(conversation_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get conversation metadata (id, created_at, title, message_count) without
+    loading its messages.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        Metadata dict or None if not found
+    """
+    return get_backend().get_conversation_meta(conversation_id)
+
+
+def iter_messages(conversation_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over a conversation's messages in order.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Yields:
+        Message dicts
+    """
+    return get_backend().iter_messages(conversation_id)
+
+
+def get_message(conversation_id: str, index: int) -> Optional[Dict[str, Any]]:
+    """
+    Load one full message of a conversation.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+        index: Position of the message in the conversation
+
+    Returns:
+        Message dict or None if the conversation or message does not exist
+    """
+    return get_backend().get_message(conversation_id, index)
+
+
+def save_conversation(conversation: Dict[str, Any]):
+    """
+    Save a whole conversation to storage.
+
+    Args:
+        conversation: Conversation dict to save
+    """
+    get_backend().save_conversation(conversation)
+
+
+def list_conversations(limit: Optional[int] = None, before: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    List conversations (metadata only), newest first.
+
+    Args:
+        limit: Maximum number of entries (None for all)
+        before: Only include conversations created before this created_at
+            value (pass the last entry's created_at to get the next page)
+
+    Returns:
+        List of conversation metadata dicts
+    """
+    return get_backend().list_conversations(limit, before)
+
+
+def list_changes(since: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    List conversations changed and deleted after a timestamp.
+
+    Args:
+        since: updated_at/deleted_at cutoff (exclusive)
+
+    Returns:
+        (changed conversation metadata, deleted conversation ids)
+    """
+    return get_backend().list_changes(since)
+
+
+def listing_version() -> str:
+    """Opaque token that changes whenever the conversation listing changes."""
+    return get_backend().listing_version()
+
+
+def add_user_message(conversation_id: str, content: str):
+    """
+    Add a user message to a conversation.
+
+    Args:
+        conversation_id: Conversation identifier
+        content: User message content
+    """
+    get_backend().append_message(conversation_id, {
+        "role": "user",
+        "content": content
+    })
+
+
+def add_assistant_message(
+    conversation_id: str,
+    stage1: List[Dict[str, Any]],
+    stage2: Optional[List[Dict[str, Any]]] = None,
+    stage3: Optional[Dict[str,Any]] = None,
+    metadata: Optional[Dict[str, Any]] = None
+):
+    """
+    Add an assistant message to a conversation.
+
+    Supports partial execution modes where stage2 and/or stage3 may be None.
+
+    Args:
+        conversation_id: Conversation identifier
+        stage1: List of individual model responses (always present)
+        stage2: List of model rankings (None if execution_mode was 'chat_only')
+        stage3: Final synthesized response (None if execution_mode was not 'full')
+        metadata: Optional metadata including execution_mode, label_to_model, etc.
+    """
+    message = {
+        "role": "assistant",
+        "stage1": stage1,
+    }
+
+    # Only include stage2 and stage3 if they were executed
+    if stage2 is not None:
+        message["stage2"] = stage2
+    if stage3 is not None:
+        message["stage3"] = stage3
+
+    if metadata:
+        message["metadata"] = metadata
+
+    get_backend().append_message(conversation_id, message)
+
+
+def add_error_message(conversation_id: str, error_text: str):
+    """
+    Add an error message to a conversation to record a failed turn.
+
+    Args:
+        conversation_id: Conversation identifier
+        error_text: The error description
+    """
+    message = {
+        "role": "assistant",
+        "content": None,
+        "error": error_text,
+        "stage1": [],
+        "stage2": [],
+        "stage3": None
+    }
+
+    get_backend().append_message(conversation_id, message)
+
+
+def update_conversation_title(conversation_id: str, title: str):
+    """
+    Update the title of a conversation.
+
+    Args:
+        conversation_id: Conversation identifier
+        title: New title for the conversation
+    """
+    get_backend().update_conversation_title(conversation_id, title)
+
+
+def delete_conversation(conversation_id: str) -> bool:
+    """
+    Delete a conversation.
+
+    Args:
+        conversation_id: Conversation identifier
+
+    Returns:
+        True if deleted, False if not found
+    """
+    return get_backend().delete_conversation(conversation_id)
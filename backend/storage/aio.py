@@ -0,0 +1,119 @@
+"""Async facade over conversation storage.
+
+Storage backends do blocking file or SQLite I/O. Calling them directly from
+async handlers stalls the event loop, and with it every concurrent SSE
+stream, while a large conversation is written. These wrappers run each call
+on a dedicated, bounded thread pool instead.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .. import storage
+
+# Worker threads reserved for storage I/O (kept separate from the default
+# executor so slow disks cannot starve other to_thread() users)
+STORAGE_WORKERS = int(os.getenv("STORAGE_WORKERS", "4"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get the storage thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=STORAGE_WORKERS, thread_name_prefix="storage")
+    return _executor
+
+
+async def run(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking storage call on the storage thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def submit(func: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Queue a storage call without awaiting it.
+
+    Used from cancellation handlers, where awaiting again would be cancelled
+    but the write should still complete.
+    """
+    return _get_executor().submit(func, *args, **kwargs)
+
+
+def shutdown():
+    """Wait for queued storage calls and stop the thread pool. Called on application shutdown."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+async def create_conversation(conversation_id: str) -> Dict[str, Any]:
+    """Async version of storage.create_conversation()."""
+    return await run(storage.create_conversation, conversation_id)
+
+
+async def get_conversation(conversation_id: str, summary: bool = False) -> Optional[Dict[str, Any]]:
+    """Async version of storage.get_conversation()."""
+    return await run(storage.get_conversation, conversation_id, summary)
+
+
+async def get_message(conversation_id: str, index: int) -> Optional[Dict[str, Any]]:
+    """Async version of storage.get_message()."""
+    return await run(storage.get_message, conversation_id, index)
+
+
+async def get_conversation_meta(conversation_id: str) -> Optional[Dict[str, Any]]:
+    """Async version of storage.get_conversation_meta()."""
+    return await run(storage.get_conversation_meta, conversation_id)
+
+
+async def list_conversations(limit: Optional[int] = None, before: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Async version of storage.list_conversations()."""
+    return await run(storage.list_conversations, limit, before)
+
+
+async def list_changes(since: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """Async version of storage.list_changes()."""
+    return await run(storage.list_changes, since)
+
+
+async def listing_version() -> str:
+    """Async version of storage.listing_version()."""
+    return await run(storage.listing_version)
+
+
+async def add_user_message(conversation_id: str, content: str):
+    """Async version of storage.add_user_message()."""
+    await run(storage.add_user_message, conversation_id, content)
+
+
+async def add_assistant_message(
+    conversation_id: str,
+    stage1: List[Dict[str, Any]],
+    stage2: Optional[List[Dict[str, Any]]] = None,
+    stage3: Optional[Dict[str, Any]] = None,
+    metadata: Optional[Dict[str, Any]] = None
+):
+    """Async version of storage.add_assistant_message()."""
+    await run(storage.add_assistant_message, conversation_id, stage1, stage2, stage3, metadata)
+
+
+async def add_error_message(conversation_id: str, error_text: str):
+    """Async version of storage.add_error_message()."""
+    await run(storage.add_error_message, conversation_id, error_text)
+
+
+async def update_conversation_title(conversation_id: str, title: str):
+    """Async version of storage.update_conversation_title()."""
+    await run(storage.update_conversation_title, conversation_id, title)
+
+
+async def delete_conversation(conversation_id: str) -> bool:
+    """Async version of storage.delete_conversation()."""
+    return await run(storage.delete_conversation, conversation_id)
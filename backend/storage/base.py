@@ -0,0 +1,162 @@
+"""Base class for conversation storage backends."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+# Deleted conversation ids remembered for `since` change listings
+MAX_TOMBSTONES = 1000
+
+
+# Message keys omitted from summary messages (fetched on demand via get_message)
+DETAIL_STAGE_KEYS = ("stage1", "stage2")
+DETAIL_METADATA_KEYS = ("search_context",)
+
+
+def strip_detail_metadata(metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """Drop large metadata blobs; returns (metadata, whether anything was dropped)."""
+    stripped = {k: v for k, v in metadata.items() if k not in DETAIL_METADATA_KEYS}
+    return stripped, len(stripped) != len(metadata)
+
+
+def summarize_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce an assistant message to what the chat view renders up front.
+
+    Stage 1/2 payloads are dropped when a Stage 3 answer exists (without one,
+    the Stage 1 answers are the result and are kept), along with large
+    metadata such as search_context. Messages that lost anything are marked
+    ``summary: True`` so clients know to fetch the full message on demand.
+    """
+    if message.get("role") != "assistant":
+        return message
+
+    has_final = message.get("stage3") is not None
+    summary = {}
+    omitted = False
+    for key, value in message.items():
+        if key in DETAIL_STAGE_KEYS and (has_final or key != "stage1"):
+            omitted = omitted or bool(value)
+            continue
+        if key == "metadata" and isinstance(value, dict):
+            value, dropped = strip_detail_metadata(value)
+            omitted = omitted or dropped
+        summary[key] = value
+
+    if omitted:
+        summary["summary"] = True
+    return summary
+
+
+def now_iso() -> str:
+    """UTC timestamp used for updated_at/deleted_at (fixed width, so strings sort chronologically)."""
+    return datetime.utcnow().isoformat(timespec="microseconds")
+
+
+class StorageBackend(ABC):
+    """
+    Abstract base class for conversation storage backends.
+
+    Conversations are dicts with ``id``, ``created_at``, ``title`` and
+    ``messages``; metadata dicts replace ``messages`` with ``message_count``
+    and ``updated_at``.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def create_conversation(self, conversation_id: str) -> Dict[str, Any]:
+        """Create and return a new, empty conversation."""
+        pass
+
+    @abstractmethod
+    def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Load a conversation with all its messages, or None if not found."""
+        pass
+
+    @abstractmethod
+    def get_conversation_meta(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Load conversation metadata without its messages, or None if not found."""
+        pass
+
+    @abstractmethod
+    def iter_messages(self, conversation_id: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over a conversation's messages in order."""
+        pass
+
+    def iter_message_summaries(self, conversation_id: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over a conversation's messages reduced by summarize_message()."""
+        for message in self.iter_messages(conversation_id):
+            yield summarize_message(message)
+
+    def get_message(self, conversation_id: str, index: int) -> Optional[Dict[str, Any]]:
+        """Load one full message by position, or None if it does not exist."""
+        for position, message in enumerate(self.iter_messages(conversation_id)):
+            if position == index:
+                return message
+        return None
+
+    @abstractmethod
+    def list_conversations(self, limit: Optional[int] = None, before: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List conversation metadata, newest first.
+
+        Args:
+            limit: Maximum number of entries (None for all)
+            before: Only include conversations created before this created_at value
+        """
+        pass
+
+    @abstractmethod
+    def list_changes(self, since: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        List what changed after a timestamp.
+
+        Returns:
+            (metadata of conversations created or updated after ``since``,
+             ids of conversations deleted after ``since``)
+        """
+        pass
+
+    @abstractmethod
+    def listing_version(self) -> str:
+        """Opaque token that changes whenever list_conversations() output would."""
+        pass
+
+    @abstractmethod
+    def append_message(self, conversation_id: str, message: Dict[str, Any]):
+        """
+        Append a message to a conversation.
+
+        Raises:
+            ValueError: If the conversation does not exist
+        """
+        pass
+
+    @abstractmethod
+    def update_conversation_title(self, conversation_id: str, title: str):
+        """
+        Set the title of a conversation.
+
+        Raises:
+            ValueError: If the conversation does not exist
+        """
+        pass
+
+    @abstractmethod
+    def delete_conversation(self, conversation_id: str) -> bool:
+        """Delete a conversation. Returns False if it was not found."""
+        pass
+
+    @abstractmethod
+    def save_conversation(self, conversation: Dict[str, Any]):
+        """Store a whole conversation, replacing any existing copy."""
+        pass
+
+    def migrate(self) -> int:
+        """Import data left by older storage formats. Returns the number of conversations migrated."""
+        return 0
+
+    def close(self):
+        """Release any resources held by the backend."""
+        pass
@@ -0,0 +1,685 @@
+"""Append-only JSONL storage for conversations.
+
+Each conversation is stored as ``<id>.jsonl``: a ``create`` header record
+followed by one record per change (``message`` appended, ``title`` updated).
+Writing a turn appends a single line instead of rewriting the whole
+conversation. Superseded records are folded away by periodic compaction, and
+legacy ``<id>.json`` files are migrated to the log format on first access.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from pathlib import Path
+from ..config import DATA_DIR
+from .. import serialization
+from .base import StorageBackend, MAX_TOMBSTONES, now_iso
+
+
+INDEX_FILE_NAME = "conversations_index.json"
+DELETED_FILE_NAME = "conversations_deleted.json"
+LOG_SUFFIX = ".jsonl"
+LEGACY_SUFFIX = ".json"
+
+# Compact a log once this many superseded records (e.g. old titles) pile up
+COMPACT_THRESHOLD = 20
+
+# Records are written with compact separators and "op" first, so record
+# types can be recognised without parsing the line
+_MESSAGE_PREFIX = '{"op":"message"'
+_TITLE_PREFIX = '{"op":"title"'
+
+# Serializes read-modify-write cycles on the shared index file when storage
+# calls run on worker threads
+_index_lock = threading.RLock()
+
+# Per-conversation locks: a compaction replays the log and replaces the file,
+# so an append landing in between would be lost without them
+_conversation_locks: Dict[str, threading.RLock] = {}
+_conversation_locks_guard = threading.Lock()
+
+
+def _conversation_lock(conversation_id: str) -> threading.RLock:
+    """Lock serializing writes to one conversation's log."""
+    with _conversation_locks_guard:
+        lock = _conversation_locks.get(conversation_id)
+        if lock is None:
+            lock = _conversation_locks[conversation_id] = threading.RLock()
+        return lock
+
+
+def ensure_data_dir():
+    """Ensure the data directory exists."""
+    Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
+
+
+def get_conversation_path(conversation_id: str) -> str:
+    """Get the log file path for a conversation."""
+    return os.path.join(DATA_DIR, f"{conversation_id}{LOG_SUFFIX}")
+
+
+def get_legacy_conversation_path(conversation_id: str) -> str:
+    """Get the pre-JSONL (whole-file JSON) path for a conversation."""
+    return os.path.join(DATA_DIR, f"{conversation_id}{LEGACY_SUFFIX}")
+
+
+def get_index_path() -> str:
+    """Get the file path for the conversation index."""
+    return os.path.join(DATA_DIR, INDEX_FILE_NAME)
+
+
+def get_deleted_path() -> str:
+    """Get the file path for the deleted-conversation tombstones."""
+    return os.path.join(DATA_DIR, DELETED_FILE_NAME)
+
+
+def is_conversation_file(filename: str) -> bool:
+    """Whether a data directory entry is a conversation (log or legacy JSON)."""
+    if filename in (INDEX_FILE_NAME, DELETED_FILE_NAME):
+        return False
+    return filename.endswith(LOG_SUFFIX) or filename.endswith(LEGACY_SUFFIX)
+
+
+def _encode_record(record: Dict[str, Any]) -> str:
+    """Serialize one log record as a single line."""
+    return serialization.dumps(record) + "\n"
+
+
+def _append_record(conversation_id: str, record: Dict[str, Any]):
+    """Append one record to a conversation log."""
+    with open(get_conversation_path(conversation_id), 'a+b') as f:
+        # Terminate a torn line left by a crashed write so it stays isolated
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(_encode_record(record).encode("utf-8"))
+
+
+def _write_log(conversation: Dict[str, Any]):
+    """Atomically write a conversation as a compacted log (header + messages)."""
+    ensure_data_dir()
+    path = get_conversation_path(conversation["id"])
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(_encode_record({
+            "op": "create",
+            "id": conversation["id"],
+            "created_at": conversation["created_at"],
+            "title": conversation.get("title", "New Conversation"),
+        }))
+        for message in conversation["messages"]:
+            f.write(_encode_record({"op": "message", "message": message}))
+    os.replace(tmp_path, path)
+
+
+def _parse_record(line: str) -> Optional[Dict[str, Any]]:
+    """Parse one log line, or None for a torn line from a crashed write."""
+    try:
+        return serialization.loads(line)
+    except json.JSONDecodeError:
+        return None
+
+
+def _read_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a log, skipping a torn trailing line from a crashed write."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            record = _parse_record(line)
+            if record is not None:
+                yield record
+
+
+def _replay(path: str) -> Optional[Dict[str, Any]]:
+    """Rebuild a conversation dict from its log, or None if the log has no header."""
+    conversation = None
+    for record in _read_records(path):
+        op = record.get("op")
+        if op == "create":
+            conversation = {
+                "id": record["id"],
+                "created_at": record["created_at"],
+                "title": record.get("title", "New Conversation"),
+                "messages": [],
+            }
+        elif conversation is None:
+            continue
+        elif op == "message":
+            conversation["messages"].append(record["message"])
+        elif op == "title":
+            conversation["title"] = record["title"]
+    return conversation
+
+
+def _count_superseded(path: str) -> int:
+    """Count records that compaction would fold into the header."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return sum(1 for line in f if line.startswith(_TITLE_PREFIX))
+
+
+def _read_meta(path: str) -> Optional[Dict[str, Any]]:
+    """Read index metadata from a log, counting the message records that _replay() would keep."""
+    meta = None
+    message_count = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            record = _parse_record(line)
+            if record is None:
+                continue
+            if record.get("op") == "message":
+                message_count += 1
+            elif record.get("op") == "create":
+                meta = {
+                    "id": record["id"],
+                    "created_at": record["created_at"],
+                    "title": record.get("title", "New Conversation"),
+                }
+            elif record.get("op") == "title" and meta is not None:
+                meta["title"] = record["title"]
+    if meta is None:
+        return None
+    meta["message_count"] = message_count
+    return meta
+
+
+def migrate_legacy_conversation(conversation_id: str) -> bool:
+    """
+    Convert a legacy ``<id>.json`` conversation to the JSONL log format.
+
+    Returns:
+        True if a legacy file was migrated
+    """
+    legacy_path = get_legacy_conversation_path(conversation_id)
+    if not os.path.exists(legacy_path) or os.path.exists(get_conversation_path(conversation_id)):
+        return False
+    try:
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            conversation = serialization.loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return False
+    _write_log(conversation)
+    os.remove(legacy_path)
+    return True
+
+
+def migrate_legacy_conversations() -> int:
+    """
+    Migrate every legacy ``*.json`` conversation in the data directory.
+
+    Returns:
+        Number of conversations migrated
+    """
+    ensure_data_dir()
+    migrated = 0
+    for filename in os.listdir(DATA_DIR):
+        if filename.endswith(LEGACY_SUFFIX) and is_conversation_file(filename):
+            if migrate_legacy_conversation(filename[:-len(LEGACY_SUFFIX)]):
+                migrated += 1
+    return migrated
+
+
+def _resolve_log(conversation_id: str) -> Optional[str]:
+    """Return the log path for a conversation, migrating a legacy file if needed."""
+    path = get_conversation_path(conversation_id)
+    if os.path.exists(path):
+        return path
+    if migrate_legacy_conversation(conversation_id):
+        return path
+    return None
+
+
+def _load_index() -> Optional[List[Dict[str, Any]]]:
+    """Load the conversation index file."""
+    path = get_index_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return serialization.loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _save_index(index: List[Dict[str, Any]]):
+    """Save the conversation index file."""
+    ensure_data_dir()
+    path = get_index_path()
+    # Write-then-rename so concurrent readers never see a half-written index
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(serialization.dumps(index))
+    os.replace(tmp_path, path)
+
+
+def rebuild_index() -> List[Dict[str, Any]]:
+    """
+    Rebuild the conversation index from actual conversation files.
+    Use this fallback if index is missing or corrupted.
+    """
+    with _index_lock:
+        ensure_data_dir()
+        migrate_legacy_conversations()
+        index = []
+
+        for filename in os.listdir(DATA_DIR):
+            if filename.endswith(LOG_SUFFIX):
+                path = os.path.join(DATA_DIR, filename)
+                try:
+                    meta = _read_meta(path)
+                    if meta is not None:
+                        mtime = datetime.utcfromtimestamp(os.path.getmtime(path))
+                        meta["updated_at"] = mtime.isoformat(timespec="microseconds")
+                except OSError:
+                    continue
+                if meta is not None:
+                    index.append(meta)
+
+        # Sort by creation time, newest first
+        index.sort(key=lambda x: x["created_at"], reverse=True)
+        _save_index(index)
+        return index
+
+
+def _update_index_entry(conversation_id: str, **changes):
+    """
+    Update fields of a single index entry.
+
+    ``message_delta`` increments the message count; other keyword arguments
+    are set on the entry. Missing entries are recovered by rebuilding.
+    """
+    with _index_lock:
+        index = _load_index()
+        if index is None:
+            rebuild_index()
+            return  # rebuild already reflects the log on disk
+
+        message_delta = changes.pop("message_delta", 0)
+        for entry in index:
+            if entry["id"] == conversation_id:
+                entry.update(changes)
+                entry["updated_at"] = now_iso()
+                entry["message_count"] = entry.get("message_count", 0) + message_delta
+                break
+        else:
+            rebuild_index()
+            return
+
+        _save_index(index)
+
+
+def _add_index_entry(conversation: Dict[str, Any]):
+    """Add a new conversation to the index."""
+    with _index_lock:
+        index = _load_index()
+        if index is None:
+            rebuild_index()
+            return
+
+        index = [item for item in index if item["id"] != conversation["id"]]
+        index.append({
+            "id": conversation["id"],
+            "created_at": conversation["created_at"],
+            "title": conversation.get("title", "New Conversation"),
+            "message_count": len(conversation["messages"]),
+            "updated_at": now_iso()
+        })
+
+        # Sort and save
+        index.sort(key=lambda x: x["created_at"], reverse=True)
+        _save_index(index)
+
+
+def _remove_from_index(conversation_id: str):
+    """Remove an entry from the index."""
+    with _index_lock:
+        index = _load_index()
+        if index is None:
+            return  # No index to remove from
+
+        # Filter out the deleted conversation
+        new_index = [item for item in index if item["id"] != conversation_id]
+
+        if len(new_index) != len(index):
+            _save_index(new_index)
+
+
+def _load_tombstones() -> Dict[str, str]:
+    """Load the id -> deleted_at map of recently deleted conversations."""
+    path = get_deleted_path()
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return serialization.loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _add_tombstone(conversation_id: str):
+    """Remember a deletion for `since` listings, keeping the newest MAX_TOMBSTONES."""
+    with _index_lock:
+        tombstones = _load_tombstones()
+        tombstones[conversation_id] = now_iso()
+        if len(tombstones) > MAX_TOMBSTONES:
+            newest = sorted(tombstones.items(), key=lambda item: item[1], reverse=True)[:MAX_TOMBSTONES]
+            tombstones = dict(newest)
+        path = get_deleted_path()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(serialization.dumps(tombstones))
+        os.replace(tmp_path, path)
+
+
+def create_conversation(conversation_id: str) -> Dict[str, Any]:
+    """
+    Create a new conversation.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        New conversation dict
+    """
+    ensure_data_dir()
+
+    conversation = {
+        "id": conversation_id,
+        "created_at": datetime.utcnow().isoformat(),
+        "title": "New Conversation",
+        "messages": []
+    }
+
+    # Save to file
+    _write_log(conversation)
+
+    # Update index
+    _add_index_entry(conversation)
+
+    return conversation
+
+
+def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a conversation from storage.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        Conversation dict or None if not found
+    """
+    path = _resolve_log(conversation_id)
+    if path is None:
+        return None
+
+    return _replay(path)
+
+
+def get_conversation_meta(conversation_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get conversation metadata (id, created_at, title, message_count) without
+    loading its messages.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Returns:
+        Metadata dict or None if not found
+    """
+    path = _resolve_log(conversation_id)
+    if path is None:
+        return None
+
+    for entry in _load_index() or []:
+        if entry["id"] == conversation_id:
+            return entry
+    return _read_meta(path)
+
+
+def iter_messages(conversation_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily iterate over a conversation's messages in order.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+
+    Yields:
+        Message dicts
+    """
+    path = _resolve_log(conversation_id)
+    if path is None:
+        return
+    for record in _read_records(path):
+        if record.get("op") == "message":
+            yield record["message"]
+
+
+def get_message(conversation_id: str, index: int) -> Optional[Dict[str, Any]]:
+    """
+    Load a single message by position, parsing only that line of the log.
+
+    Args:
+        conversation_id: Unique identifier for the conversation
+        index: Zero-based message position
+
+    Returns:
+        Message dict or None if not found
+    """
+    path = _resolve_log(conversation_id)
+    if path is None or index < 0:
+        return None
+
+    position = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Only message lines are parsed; torn ones are skipped, as in _replay()
+            if not line.startswith(_MESSAGE_PREFIX):
+                continue
+            record = _parse_record(line)
+            if record is None:
+                continue
+            if position == index:
+                return record["message"]
+            position += 1
+    return None
+
+
+def save_conversation(conversation: Dict[str, Any]):
+    """
+    Save a whole conversation to storage, replacing its log with a compacted one.
+
+    Args:
+        conversation: Conversation dict to save
+    """
+    with _conversation_lock(conversation["id"]):
+        _write_log(conversation)
+
+    # Update index
+    _add_index_entry(conversation)
+
+
+def compact_conversation(conversation_id: str) -> bool:
+    """
+    Rewrite a conversation log as a header plus its messages, dropping
+    superseded records and any torn trailing line.
+
+    Args:
+        conversation_id: Conversation identifier
+
+    Returns:
+        True if compacted, False if not found
+    """
+    with _conversation_lock(conversation_id):
+        path = _resolve_log(conversation_id)
+        if path is None:
+            return False
+        conversation = _replay(path)
+        if conversation is None:
+            return False
+        _write_log(conversation)
+    return True
+
+
+def append_message(conversation_id: str, message: Dict[str, Any]):
+    """Append a message record and bump the indexed message count."""
+    with _conversation_lock(conversation_id):
+        if _resolve_log(conversation_id) is None:
+            raise ValueError(f"Conversation {conversation_id} not found")
+        _append_record(conversation_id, {"op": "message", "message": message})
+    _update_index_entry(conversation_id, message_delta=1)
+
+
+def _entry_updated_at(entry: Dict[str, Any]) -> str:
+    """updated_at of an index entry (entries written before it existed fall back to created_at)."""
+    return entry.get("updated_at") or entry["created_at"]
+
+
+def list_conversations(limit: Optional[int] = None, before: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    List conversations (metadata only), newest first.
+    Uses cached index file instead of reading conversation logs.
+
+    Args:
+        limit: Maximum number of entries (None for all)
+        before: Only include conversations created before this created_at value
+
+    Returns:
+        List of conversation metadata dicts
+    """
+    ensure_data_dir()
+
+    # Try to load from index first
+    index = _load_index()
+
+    # If index missing or invalid, rebuild it
+    if index is None:
+        index = rebuild_index()
+
+    if before is not None:
+        index = [entry for entry in index if entry["created_at"] < before]
+    if limit is not None:
+        index = index[:limit]
+    return index
+
+
+def list_changes(since: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    List conversations changed and deleted after a timestamp.
+
+    Args:
+        since: updated_at/deleted_at cutoff (exclusive)
+
+    Returns:
+        (changed conversation metadata, deleted conversation ids)
+    """
+    changed = [entry for entry in list_conversations() if _entry_updated_at(entry) > since]
+    deleted = [cid for cid, deleted_at in _load_tombstones().items() if deleted_at > since]
+    return changed, deleted
+
+
+def listing_version() -> str:
+    """Token derived from the index and tombstone files, which every listing change rewrites."""
+    parts = []
+    for path in (get_index_path(), get_deleted_path()):
+        try:
+            stat = os.stat(path)
+            parts.append(f"{stat.st_mtime_ns}-{stat.st_size}")
+        except OSError:
+            parts.append("-")
+    return ":".join(parts)
+
+
+def update_conversation_title(conversation_id: str, title: str):
+    """
+    Update the title of a conversation.
+
+    Args:
+        conversation_id: Conversation identifier
+        title: New title for the conversation
+    """
+    with _conversation_lock(conversation_id):
+        path = _resolve_log(conversation_id)
+        if path is None:
+            raise ValueError(f"Conversation {conversation_id} not found")
+        _append_record(conversation_id, {"op": "title", "title": title})
+        _update_index_entry(conversation_id, title=title)
+
+        # Title records supersede each other; fold them away once enough pile up
+        if _count_superseded(path) >= COMPACT_THRESHOLD:
+            compact_conversation(conversation_id)
+
+
+def delete_conversation(conversation_id: str) -> bool:
+    """
+    Delete a conversation.
+
+    Args:
+        conversation_id: Conversation identifier
+
+    Returns:
+        True if deleted, False if not found
+    """
+    deleted = False
+    with _conversation_lock(conversation_id):
+        for path in (get_conversation_path(conversation_id), get_legacy_conversation_path(conversation_id)):
+            if os.path.exists(path):
+                os.remove(path)
+                deleted = True
+    with _conversation_locks_guard:
+        _conversation_locks.pop(conversation_id, None)
+
+    if not deleted:
+        return False
+
+    # Update index
+    _remove_from_index(conversation_id)
+    _add_tombstone(conversation_id)
+
+    return True
+
+
+class JsonlStorage(StorageBackend):
+    """Storage backend keeping one append-only JSONL log per conversation."""
+
+    name = "jsonl"
+
+    def create_conversation(self, conversation_id: str) -> Dict[str, Any]:
+        return create_conversation(conversation_id)
+
+    def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        return get_conversation(conversation_id)
+
+    def get_conversation_meta(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        return get_conversation_meta(conversation_id)
+
+    def iter_messages(self, conversation_id: str) -> Iterator[Dict[str, Any]]:
+        return iter_messages(conversation_id)
+
+    def get_message(self, conversation_id: str, index: int) -> Optional[Dict[str, Any]]:
+        return get_message(conversation_id, index)
+
+    def list_conversations(self, limit: Optional[int] = None, before: Optional[str] = None) -> List[Dict[str, Any]]:
+        return list_conversations(limit, before)
+
+    def list_changes(self, since: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        return list_changes(since)
+
+    def listing_version(self) -> str:
+        return listing_version()
+
+    def append_message(self, conversation_id: str, message: Dict[str, Any]):
+        append_message(conversation_id, message)
+
+    def update_conversation_title(self, conversation_id: str, title: str):
+        update_conversation_title(conversation_id, title)
+
+    def delete_conversation(self, conversation_id: str) -> bool:
+        return delete_conversation(conversation_id)
+
+    def save_conversation(self, conversation: Dict[str, Any]):
+        save_conversation(conversation)
+
+    def migrate(self) -> int:
+        return migrate_legacy_conversations()
@@ -0,0 +1,407 @@
+"""SQLite storage backend for conversations.
+
+Conversations, messages and per-stage results are stored as rows in a single
+database file running in WAL mode, so listing, loading and appending are
+indexed lookups and several uvicorn workers can share the same data safely.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from ..config import DATA_DIR
+from .. import serialization
+from .base import StorageBackend, MAX_TOMBSTONES, DETAIL_STAGE_KEYS, now_iso, strip_detail_metadata
+from . import jsonl
+
+DB_FILE_NAME = "conversations.db"
+
+# Seconds a writer waits for another connection's lock before failing
+BUSY_TIMEOUT = 30.0
+
+# Message keys stored as separate stage_results rows
+STAGE_KEYS = ("stage1", "stage2", "stage3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    title TEXT NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_conversations_created_at ON conversations (created_at);
+
+CREATE TABLE IF NOT EXISTS deleted_conversations (
+    id TEXT PRIMARY KEY,
+    deleted_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_deleted_conversations_deleted_at ON deleted_conversations (deleted_at);
+
+CREATE TABLE IF NOT EXISTS messages (
+    conversation_id TEXT NOT NULL REFERENCES conversations (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS stage_results (
+    conversation_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, position, stage),
+    FOREIGN KEY (conversation_id, position) REFERENCES messages (conversation_id, position) ON DELETE CASCADE
+);
+"""
+
+# Applied after SCHEMA, once older databases have been upgraded
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_conversations_updated_at ON conversations (updated_at);
+"""
+
+
+def get_db_path() -> str:
+    """Get the file path for the conversation database."""
+    return os.path.join(DATA_DIR, DB_FILE_NAME)
+
+
+class SQLiteStorage(StorageBackend):
+    """Storage backend keeping conversations in a WAL-mode SQLite database."""
+
+    name = "sqlite"
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or get_db_path()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        # isolation_level=None: transactions are opened explicitly in _transaction()
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+
+        with self._lock:
+            if not self._schema_ready:
+                conn.executescript(SCHEMA)
+                self._upgrade_schema(conn)
+                conn.executescript(INDEXES)
+                self._schema_ready = True
+            self._connections.append(conn)
+        self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _upgrade_schema(conn: sqlite3.Connection):
+        """Add columns introduced after a database was first created."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(conversations)")}
+        if "updated_at" not in columns:
+            conn.execute("ALTER TABLE conversations ADD COLUMN updated_at TEXT NOT NULL DEFAULT ''")
+            conn.execute("UPDATE conversations SET updated_at = created_at")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write transaction, taking the write lock up front."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _meta_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "created_at": row["created_at"],
+            "title": row["title"],
+            "message_count": row["message_count"],
+            "updated_at": row["updated_at"],
+        }
+
+    @staticmethod
+    def _insert_message(conn: sqlite3.Connection, conversation_id: str, position: int, message: Dict[str, Any]):
+        """Insert a message row plus one stage_results row per stage key it carries."""
+        base = {k: v for k, v in message.items() if k not in STAGE_KEYS}
+        conn.execute(
+            "INSERT INTO messages (conversation_id, position, role, data) VALUES (?, ?, ?, ?)",
+            (conversation_id, position, message.get("role", ""), serialization.dumps(base)),
+        )
+        conn.executemany(
+            "INSERT INTO stage_results (conversation_id, position, stage, data) VALUES (?, ?, ?, ?)",
+            [
+                (conversation_id, position, stage, serialization.dumps(message[stage]))
+                for stage in STAGE_KEYS
+                if stage in message
+            ],
+        )
+
+    def create_conversation(self, conversation_id: str) -> Dict[str, Any]:
+        conversation = {
+            "id": conversation_id,
+            "created_at": datetime.utcnow().isoformat(),
+            "title": "New Conversation",
+            "messages": []
+        }
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO conversations (id, created_at, title, message_count, updated_at) VALUES (?, ?, ?, 0, ?)",
+                (conversation_id, conversation["created_at"], conversation["title"], now_iso()),
+            )
+        return conversation
+
+    def get_conversation_meta(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            "SELECT id, created_at, title, message_count, updated_at FROM conversations WHERE id = ?",
+            (conversation_id,),
+        ).fetchone()
+        return self._meta_from_row(row) if row else None
+
+    def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        meta = self.get_conversation_meta(conversation_id)
+        if meta is None:
+            return None
+        conversation = {
+            "id": meta["id"],
+            "created_at": meta["created_at"],
+            "title": meta["title"],
+            "messages": list(self.iter_messages(conversation_id)),
+        }
+        return conversation
+
+    def iter_messages(self, conversation_id: str) -> Iterator[Dict[str, Any]]:
+        conn = self._connect()
+        stages: Dict[int, Dict[str, Any]] = {}
+        for row in conn.execute(
+            "SELECT position, stage, data FROM stage_results WHERE conversation_id = ?",
+            (conversation_id,),
+        ):
+            stages.setdefault(row["position"], {})[row["stage"]] = serialization.loads(row["data"])
+
+        for row in conn.execute(
+            "SELECT position, data FROM messages WHERE conversation_id = ? ORDER BY position",
+            (conversation_id,),
+        ):
+            message = serialization.loads(row["data"])
+            message.update(stages.get(row["position"], {}))
+            yield message
+
+    def iter_message_summaries(self, conversation_id: str) -> Iterator[Dict[str, Any]]:
+        """Like summarize_message() over iter_messages(), without reading omitted stage payloads."""
+        conn = self._connect()
+        stages: Dict[int, Dict[str, Any]] = {}
+        omitted = set()
+        # Stage 1 is kept only where there is no Stage 3 answer; other detail stages never are
+        for row in conn.execute(
+            """
+            SELECT position, stage, data != '[]' AS has_data,
+                CASE WHEN stage = 'stage3' OR (stage = 'stage1' AND NOT EXISTS (
+                    SELECT 1 FROM stage_results AS final
+                    WHERE final.conversation_id = stage_results.conversation_id
+                      AND final.position = stage_results.position
+                      AND final.stage = 'stage3' AND final.data != 'null'
+                )) THEN data END AS data
+            FROM stage_results WHERE conversation_id = ?
+            """,
+            (conversation_id,),
+        ):
+            if row["data"] is not None:
+                stages.setdefault(row["position"], {})[row["stage"]] = serialization.loads(row["data"])
+            elif row["stage"] in DETAIL_STAGE_KEYS and row["has_data"]:
+                omitted.add(row["position"])
+
+        for row in conn.execute(
+            "SELECT position, data FROM messages WHERE conversation_id = ? ORDER BY position",
+            (conversation_id,),
+        ):
+            message = serialization.loads(row["data"])
+            message.update(stages.get(row["position"], {}))
+            dropped = False
+            if isinstance(message.get("metadata"), dict):
+                message["metadata"], dropped = strip_detail_metadata(message["metadata"])
+            if dropped or row["position"] in omitted:
+                message["summary"] = True
+            yield message
+
+    def get_message(self, conversation_id: str, index: int) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT data FROM messages WHERE conversation_id = ? AND position = ?",
+            (conversation_id, index),
+        ).fetchone()
+        if row is None:
+            return None
+        message = serialization.loads(row["data"])
+        for stage_row in conn.execute(
+            "SELECT stage, data FROM stage_results WHERE conversation_id = ? AND position = ?",
+            (conversation_id, index),
+        ):
+            message[stage_row["stage"]] = serialization.loads(stage_row["data"])
+        return message
+
+    def list_conversations(self, limit: Optional[int] = None, before: Optional[str] = None) -> List[Dict[str, Any]]:
+        query = "SELECT id, created_at, title, message_count, updated_at FROM conversations"
+        params: List[Any] = []
+        if before is not None:
+            query += " WHERE created_at < ?"
+            params.append(before)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._connect().execute(query, params).fetchall()
+        return [self._meta_from_row(row) for row in rows]
+
+    def list_changes(self, since: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT id, created_at, title, message_count, updated_at FROM conversations "
+            "WHERE updated_at > ? ORDER BY created_at DESC",
+            (since,),
+        ).fetchall()
+        deleted = [
+            row["id"] for row in conn.execute(
+                "SELECT id FROM deleted_conversations WHERE deleted_at > ?", (since,)
+            )
+        ]
+        return [self._meta_from_row(row) for row in rows], deleted
+
+    def listing_version(self) -> str:
+        conn = self._connect()
+        count, updated = conn.execute("SELECT COUNT(*), MAX(updated_at) FROM conversations").fetchone()
+        deleted = conn.execute("SELECT MAX(deleted_at) FROM deleted_conversations").fetchone()[0]
+        return f"{count}:{updated}:{deleted}"
+
+    def append_message(self, conversation_id: str, message: Dict[str, Any]):
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT message_count FROM conversations WHERE id = ?", (conversation_id,)
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Conversation {conversation_id} not found")
+
+            position = row["message_count"]
+            self._insert_message(conn, conversation_id, position, message)
+            conn.execute(
+                "UPDATE conversations SET message_count = ?, updated_at = ? WHERE id = ?",
+                (position + 1, now_iso(), conversation_id),
+            )
+
+    def update_conversation_title(self, conversation_id: str, title: str):
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE conversations SET title = ?, updated_at = ? WHERE id = ?",
+                (title, now_iso(), conversation_id)
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Conversation {conversation_id} not found")
+
+    def delete_conversation(self, conversation_id: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM conversations WHERE id = ?", (conversation_id,))
+            if cursor.rowcount == 0:
+                return False
+            # Remember the deletion for `since` listings, keeping the newest MAX_TOMBSTONES
+            conn.execute(
+                "INSERT OR REPLACE INTO deleted_conversations (id, deleted_at) VALUES (?, ?)",
+                (conversation_id, now_iso()),
+            )
+            conn.execute(
+                "DELETE FROM deleted_conversations WHERE id NOT IN "
+                "(SELECT id FROM deleted_conversations ORDER BY deleted_at DESC LIMIT ?)",
+                (MAX_TOMBSTONES,),
+            )
+        # Drop any JSON/JSONL file it was migrated from, so migrate() cannot bring it back
+        for path in (jsonl.get_conversation_path(conversation_id), jsonl.get_legacy_conversation_path(conversation_id)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return True
+
+    def save_conversation(self, conversation: Dict[str, Any]):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM conversations WHERE id = ?", (conversation["id"],))
+            conn.execute(
+                "INSERT INTO conversations (id, created_at, title, message_count, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    conversation["id"],
+                    conversation["created_at"],
+                    conversation.get("title", "New Conversation"),
+                    len(conversation["messages"]),
+                    now_iso(),
+                ),
+            )
+            for position, message in enumerate(conversation["messages"]):
+                self._insert_message(conn, conversation["id"], position, message)
+
+    def migrate(self) -> int:
+        """
+        Import conversations stored as JSONL logs or legacy JSON files.
+
+        Files are left in place; conversations already in the database, or
+        deleted from it, are skipped.
+        """
+        if not os.path.isdir(DATA_DIR):
+            return 0
+
+        conn = self._connect()
+        existing = {row["id"] for row in conn.execute("SELECT id FROM conversations")}
+        existing.update(row["id"] for row in conn.execute("SELECT id FROM deleted_conversations"))
+        migrated = 0
+        for filename in os.listdir(DATA_DIR):
+            conversation_id, ext = os.path.splitext(filename)
+            if conversation_id in existing or not jsonl.is_conversation_file(filename):
+                continue
+
+            path = os.path.join(DATA_DIR, filename)
+            try:
+                if ext == jsonl.LOG_SUFFIX:
+                    conversation = jsonl._replay(path)
+                elif ext == jsonl.LEGACY_SUFFIX:
+                    with open(path, 'r') as f:
+                        conversation = json.load(f)
+                else:
+                    continue
+            except (json.JSONDecodeError, OSError):
+                continue
+
+            if conversation is None:
+                continue
+            self.save_conversation(conversation)
+            existing.add(conversation["id"])
+            migrated += 1
+        return migrated
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
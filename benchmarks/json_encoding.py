@@ -0,0 +1,136 @@
+"""
+Micro-benchmark: JSON encoding on the streaming, storage and REST paths.
+
+Builds a realistic conversation (TURNS turns, each with COUNCIL_SIZE Stage 1
+answers, rankings, a synthesis and web search context) and times, per turn:
+
+- framing its SSE events (stdlib json.dumps with default settings, as the
+  generator used to, vs backend.serialization),
+- writing and reading it as a file (the old indented JSON document vs
+  compact JSONL records), including on-disk size,
+- rendering it as a REST response (JSONResponse vs ORJSONResponse).
+
+backend.serialization uses orjson when installed and compact stdlib JSON
+otherwise; run once with and once without orjson to see both.
+
+Usage (from the project root):
+    uv run python -m benchmarks.json_encoding
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from fastapi.responses import JSONResponse
+
+from backend import serialization
+from backend.serialization import ORJSON_AVAILABLE
+
+COUNCIL_SIZE = 6
+TURNS = 20
+ROUNDS = 20
+
+PARAGRAPH = (
+    "Server-sent events keep a single HTTP response open and push small text frames — "
+    "ideal for streaming model output. Each frame is “data: …” followed by a blank line. "
+)
+
+
+def _conversation():
+    messages = []
+    for turn in range(TURNS):
+        models = [f"openrouter:vendor/model-{i}" for i in range(COUNCIL_SIZE)]
+        messages.append({"role": "user", "content": f"Question {turn}: how do SSE streams work?"})
+        messages.append({
+            "role": "assistant",
+            "stage1": [{"model": m, "response": PARAGRAPH * 20, "error": None} for m in models],
+            "stage2": [
+                {
+                    "model": m,
+                    "ranking": PARAGRAPH * 4 + "FINAL RANKING:\n1. Response A\n2. Response B",
+                    "parsed_ranking": [f"Response {chr(65 + i)}" for i in range(COUNCIL_SIZE)],
+                    "error": None,
+                }
+                for m in models
+            ],
+            "stage3": {"model": "openrouter:vendor/chairman", "response": PARAGRAPH * 30},
+            "metadata": {
+                "execution_mode": "full",
+                "label_to_model": {f"Response {chr(65 + i)}": m for i, m in enumerate(models)},
+                "aggregate_rankings": [{"model": m, "average_rank": 1.5, "rankings_count": 6} for m in models],
+                "search_context": PARAGRAPH * 60,
+            },
+        })
+    return {"id": "bench", "created_at": "2025-01-01T00:00:00", "title": "Benchmark", "messages": messages}
+
+
+def _turn_events(message):
+    """The payloads a turn streams (progress events plus full *_complete events)."""
+    events = [{"type": "stage1_progress", "data": r, "count": i + 1, "total": COUNCIL_SIZE} for i, r in enumerate(message["stage1"])]
+    events.append({"type": "stage1_complete", "data": message["stage1"]})
+    events += [{"type": "stage2_progress", "data": r, "count": i + 1, "total": COUNCIL_SIZE} for i, r in enumerate(message["stage2"])]
+    events.append({"type": "stage2_complete", "data": message["stage2"], "metadata": message["metadata"]})
+    events.append({"type": "stage3_complete", "data": message["stage3"]})
+    return events
+
+
+def _time(fn) -> float:
+    """Mean milliseconds per call of fn over ROUNDS (after one warm-up call)."""
+    fn()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) * 1000 / ROUNDS
+
+
+def main():
+    conversation = _conversation()
+    events = [e for m in conversation["messages"] if m["role"] == "assistant" for e in _turn_events(m)]
+
+    sse_old = _time(lambda: [f"data: {json.dumps(e)}\n\n" for e in events]) / TURNS
+    sse_new = _time(lambda: [f"data: {serialization.dumps(e)}\n\n" for e in events]) / TURNS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, "conversation.json")
+        new_path = os.path.join(tmp, "conversation.jsonl")
+
+        def write_old():
+            with open(old_path, "w") as f:
+                json.dump(conversation, f, indent=2)
+
+        def write_new():
+            with open(new_path, "w", encoding="utf-8") as f:
+                for message in conversation["messages"]:
+                    f.write(serialization.dumps({"op": "message", "message": message}) + "\n")
+
+        def read_old():
+            with open(old_path) as f:
+                json.load(f)
+
+        def read_new():
+            with open(new_path, encoding="utf-8") as f:
+                [serialization.loads(line) for line in f]
+
+        write_old_ms, write_new_ms = _time(write_old), _time(write_new)
+        read_old_ms, read_new_ms = _time(read_old), _time(read_new)
+        old_size, new_size = os.path.getsize(old_path), os.path.getsize(new_path)
+
+    rest_old = _time(lambda: JSONResponse(conversation))
+    if ORJSON_AVAILABLE:
+        from fastapi.responses import ORJSONResponse
+        rest_new = _time(lambda: ORJSONResponse(conversation))
+    else:
+        rest_new = rest_old
+
+    print(f"Serializer: {'orjson' if ORJSON_AVAILABLE else 'stdlib json (compact)'}")
+    print(f"Conversation: {TURNS} turns, council of {COUNCIL_SIZE}")
+    print(f"  SSE framing per turn:     {sse_old:8.2f} ms -> {sse_new:8.2f} ms")
+    print(f"  write whole conversation: {write_old_ms:8.2f} ms -> {write_new_ms:8.2f} ms")
+    print(f"  read whole conversation:  {read_old_ms:8.2f} ms -> {read_new_ms:8.2f} ms")
+    print(f"  size on disk:             {old_size / 1024:8.0f} KiB -> {new_size / 1024:8.0f} KiB")
+    print(f"  REST response render:     {rest_old:8.2f} ms -> {rest_new:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
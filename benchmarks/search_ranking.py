@@ -0,0 +1,128 @@
+"""
+Micro-benchmark: query analysis and result reranking in backend.search.
+
+Runs the CPU-bound steps of a web search turn over a fixed corpus of
+realistic queries (prompt-style, news, comparison, research) and result
+sets with a mix of authoritative, ordinary and low-quality URLs:
+
+- detect_query_intent()
+- optimize_search_query() (DuckDuckGo path)
+- _preprocess_query() (the YAKE pre-pass used by the other providers)
+- rerank_results() over RESULTS_PER_QUERY results
+
+and reports the mean time per call.
+
+Usage (from the project root):
+    uv run python -m benchmarks.search_ranking
+"""
+
+import random
+import time
+
+from backend import search
+
+ROUNDS = 200
+RESULTS_PER_QUERY = 12
+SEED = 7
+
+QUERIES = [
+    "What is the latest news about Nvidia earnings this week?",
+    "Act as a financial analyst and evaluate the theory that the current market in late 2025 is a bubble",
+    "Can you explain how photosynthesis works?",
+    "tesla vs byd which is better for a family car",
+    "history of the byzantine empire",
+    "Please tell me about the impact of social media on teenagers",
+    "bitcoin price today",
+    "how do i configure nginx as a reverse proxy for a fastapi app",
+    "You are an expert economist. What are the causes of inflation in 2024?",
+    "difference between TCP and UDP",
+    "Who is the CEO of OpenAI and what did they announce yesterday?",
+    "pros and cons of remote work for software teams",
+    "what's the weather forecast for London tomorrow",
+    "Explain to me what quantum entanglement is, like I'm five",
+    "Imagine you are a senior analyst: compare the current AI chip market leaders",
+    "research on intermittent fasting and longevity",
+    "Give me a summary of the 2026 World Cup qualifiers",
+    "origin of the word 'quarantine'",
+    "How to bake sourdough bread at home?",
+    "Microsoft announces new Surface lineup - what changed?",
+    "apple stock split history and current share price",
+    "evolution of javascript frameworks since 2010",
+    "Tell me about \"retrieval augmented generation\" and how it compares to fine-tuning",
+    "best practices for postgres indexing",
+    "effects of caffeine on sleep quality study",
+    "Is it true that Amazon shares dropped after earnings?",
+    "analysis of the 2024 US election polling errors",
+    "what are the advantages of rust over c++",
+    "Behave as a journalist and describe the breaking news about the election",
+    "write a haiku about autumn",
+]
+
+DOMAINS = [
+    "en.wikipedia.org", "www.britannica.com", "www.reuters.com", "apnews.com",
+    "www.bbc.co.uk", "www.nytimes.com", "techcrunch.com", "arstechnica.com",
+    "www.nature.com", "www.nasa.gov", "cs.stanford.edu", "medium.com",
+    "stackoverflow.com", "github.com", "www.forbes.com", "www.investopedia.com",
+    "www.pinterest.com", "www.facebook.com", "twitter.com", "www.reddit.com",
+    "blog.example.com", "news.ycombinator.com", "www.theverge.com", "docs.python.org",
+]
+
+FILLER = (
+    "according to the report published today the company said that analysts expect "
+    "results to improve over the next quarter while researchers noted the study found "
+    "significant effects in several regions and the market reacted hours ago"
+).split()
+
+
+def _results(query: str, rng: random.Random):
+    """A result set whose titles and snippets share some words with the query."""
+    query_words = [w for w in query.lower().replace("?", "").split() if len(w) > 3] or ["topic"]
+    results = []
+    for i in range(RESULTS_PER_QUERY):
+        domain = rng.choice(DOMAINS)
+        path = "user/someone" if domain == "www.reddit.com" and i % 2 else f"article/{i}"
+        title_words = rng.sample(query_words, min(len(query_words), 3)) + rng.sample(FILLER, 4)
+        summary_words = rng.sample(query_words, min(len(query_words), 2)) + rng.sample(FILLER, 25)
+        if i % 4 == 0:
+            summary_words.append(str(search.CURRENT_YEAR))
+        results.append({
+            "title": " ".join(title_words).title(),
+            "url": f"https://{domain}/{path}",
+            "summary": " ".join(summary_words),
+            "type": "web",
+            "content": None,
+        })
+    return results
+
+
+def _time(fn) -> float:
+    """Mean microseconds per call of fn() over ROUNDS (after one warm-up call)."""
+    fn()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) * 1e6 / ROUNDS
+
+
+def main():
+    rng = random.Random(SEED)
+    result_sets = [_results(q, rng) for q in QUERIES]
+    n = len(QUERIES)
+
+    intent_us = _time(lambda: [search.detect_query_intent(q) for q in QUERIES]) / n
+    optimize_us = _time(lambda: [search.optimize_search_query(q) for q in QUERIES]) / n
+    preprocess_us = _time(lambda: [search._preprocess_query(q) for q in QUERIES]) / n
+    rerank_us = _time(lambda: [
+        search.rerank_results([dict(r) for r in results], q, "current_event" if i % 3 == 0 else "factual")
+        for i, (q, results) in enumerate(zip(QUERIES, result_sets))
+    ]) / n
+
+    print(f"{n} queries, {RESULTS_PER_QUERY} results each, mean of {ROUNDS} rounds")
+    print(f"  detect_query_intent:   {intent_us:8.1f} us/query")
+    print(f"  optimize_search_query: {optimize_us:8.1f} us/query")
+    print(f"  _preprocess_query:     {preprocess_us:8.1f} us/query")
+    print(f"  rerank_results:        {rerank_us:8.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Micro-benchmark: per-turn overhead of settings lookups.
+
+A full council turn calls get_settings() roughly once per stage, once per
+config lookup and once per provider API-key lookup. This compares reading
+and validating data/settings.json on every call (the old behaviour) against
+the cached snapshot.
+
+Usage (from the project root):
+    uv run python -m benchmarks.settings_overhead
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from backend import settings as settings_module
+
+COUNCIL_SIZE = 5
+TURNS = 200
+
+# main.py + stage1/2/3 + council models + chairman model + one API-key lookup
+# per council member in stages 1 and 2 + one for the chairman
+CALLS_PER_TURN = 1 + 3 + 1 + 1 + COUNCIL_SIZE * 2 + 1
+
+
+def _run(lookup) -> float:
+    """Return mean milliseconds per simulated turn."""
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        for _ in range(CALLS_PER_TURN):
+            lookup()
+    return (time.perf_counter() - start) * 1000 / TURNS
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "settings.json"
+        sample = settings_module.Settings(
+            council_models=[f"openrouter:model-{i}" for i in range(COUNCIL_SIZE)],
+            chairman_model="openrouter:chairman",
+            openrouter_api_key="sk-test",
+        )
+        path.write_text(json.dumps(sample.model_dump(), indent=2))
+
+        original_path = settings_module.SETTINGS_FILE
+        settings_module.SETTINGS_FILE = path
+        settings_module.invalidate_settings_cache()
+        try:
+            uncached = _run(settings_module._read_settings_file)
+            cached = _run(settings_module.get_settings)
+        finally:
+            settings_module.SETTINGS_FILE = original_path
+            settings_module.invalidate_settings_cache()
+
+    print(f"Settings lookups per turn: {CALLS_PER_TURN} (council of {COUNCIL_SIZE}, {TURNS} turns)")
+    print(f"  uncached (read + validate each call): {uncached:8.3f} ms/turn")
+    print(f"  cached (mtime-checked snapshot):      {cached:8.3f} ms/turn")
+    print(f"  speedup: {uncached / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
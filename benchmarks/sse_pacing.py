@@ -0,0 +1,140 @@
+"""
+Benchmark: end-to-end latency of a council turn over SSE.
+
+Drives POST /api/conversations/{id}/message/stream through the ASGI app with
+mocked council models that answer after MODEL_LATENCY seconds, and reports
+when the first Stage 1 answer and the final `complete` event reach the
+client. The "paced" run reproduces the fixed asyncio.sleep() calls the event
+generator used to make after its events (50 ms after stage start/complete
+events, 10 ms after each progress event) by sleeping in the client's send
+callable, which stalls the generator exactly as those sleeps did.
+
+Usage (from the project root):
+    uv run python -m benchmarks.sse_pacing
+"""
+
+import asyncio
+import json
+import tempfile
+import time
+
+from backend import council, main as app_module, storage
+from backend.storage import aio as async_storage
+from backend.storage import jsonl
+
+COUNCIL_SIZE = 5
+MODEL_LATENCY = 0.05
+TURNS = 5
+
+# Delay the old generator added after each event type
+OLD_PACING = {
+    "search_complete": 0.05,
+    "stage1_start": 0.05,
+    "stage1_progress": 0.01,
+    "stage1_complete": 0.05,
+    "stage2_start": 0.05,
+    "stage2_progress": 0.01,
+    "stage2_complete": 0.05,
+    "stage3_start": 0.05,
+}
+
+RANKING = "FINAL RANKING:\n" + "\n".join(f"{i + 1}. Response {chr(65 + i)}" for i in range(COUNCIL_SIZE))
+
+
+async def _mock_query(model, messages, timeout=None, temperature=0.7, fallback=None, stage="default"):
+    await asyncio.sleep(MODEL_LATENCY)
+    return {"content": RANKING if stage == "stage2" else f"Answer from {model}"}
+
+
+async def _mock_stream(model, messages, timeout=None, temperature=0.7, fallback=None, stage="default"):
+    yield {"type": "done", "response": await _mock_query(model, messages, stage=stage)}
+
+
+async def _mock_title(user_query):
+    return "Benchmark"
+
+
+async def _turn(conversation_id: str, paced: bool):
+    """Run one turn; return (ms to first stage1_progress, ms to complete)."""
+    body = json.dumps({"content": "What is SSE?", "execution_mode": "full", "stream_tokens": False}).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "POST",
+        "path": f"/api/conversations/{conversation_id}/message/stream",
+        "raw_path": b"",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("bench", 1),
+        "server": ("bench", 80),
+        "scheme": "http",
+        "root_path": "",
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    started = time.perf_counter()
+    marks = {}
+
+    async def send(message):
+        if message["type"] != "http.response.body":
+            return
+        for line in message.get("body", b"").decode().splitlines():
+            if not line.startswith("data: "):
+                continue
+            event_type = json.loads(line[6:])["type"]
+            marks.setdefault(event_type, (time.perf_counter() - started) * 1000)
+            if paced and event_type in OLD_PACING:
+                await asyncio.sleep(OLD_PACING[event_type])
+
+    await app_module.app(scope, receive, send)
+    disconnected.set()
+    return marks["stage1_progress"], marks["complete"]
+
+
+async def _measure(paced: bool):
+    first, total = [], []
+    for i in range(TURNS):
+        conversation_id = f"bench-{'paced' if paced else 'direct'}-{i}"
+        storage.create_conversation(conversation_id)
+        first_ms, total_ms = await _turn(conversation_id, paced)
+        first.append(first_ms)
+        total.append(total_ms)
+    return sum(first) / TURNS, sum(total) / TURNS
+
+
+async def main():
+    council.query_model = _mock_query
+    council.stream_model = _mock_stream
+    council.get_council_models = lambda: [f"openrouter:model-{i}" for i in range(COUNCIL_SIZE)]
+    council.get_chairman_model = lambda: "openrouter:chairman"
+    app_module.generate_conversation_title = _mock_title
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl.DATA_DIR = tmp
+        storage._backend = jsonl.JsonlStorage()
+        try:
+            paced_first, paced_total = await _measure(paced=True)
+            direct_first, direct_total = await _measure(paced=False)
+        finally:
+            async_storage.shutdown()
+            storage.close()
+
+    print(f"Council of {COUNCIL_SIZE}, models answer in {MODEL_LATENCY * 1000:.0f} ms, mean of {TURNS} turns")
+    print("                          first answer    complete")
+    print(f"  fixed sleep pacing:     {paced_first:9.1f} ms {paced_total:9.1f} ms")
+    print(f"  flush on yield:         {direct_first:9.1f} ms {direct_total:9.1f} ms")
+    print(f"  saved per turn: {paced_total - direct_total:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark: does a slow storage write stall other SSE streams?
+
+One simulated stream saves its assistant message through a storage backend
+whose writes take SLOW_WRITE_SECONDS (a slow disk or a huge conversation).
+Meanwhile another stream emits stage1_progress-style events every
+EVENT_INTERVAL seconds. The largest gap between those events shows how long
+the event loop was blocked: with direct (synchronous) storage calls it
+matches the slow write; with the async storage facade it stays near the
+event interval.
+
+Usage (from the project root):
+    uv run python -m benchmarks.storage_event_loop
+"""
+
+import asyncio
+import tempfile
+import time
+
+from backend import storage
+from backend.storage import aio as async_storage
+from backend.storage import jsonl
+
+SLOW_WRITE_SECONDS = 0.5
+EVENT_INTERVAL = 0.01
+EVENTS = 80
+
+
+class SlowWriteStorage(jsonl.JsonlStorage):
+    """JSONL backend with an artificially slow append."""
+
+    def append_message(self, conversation_id, message):
+        time.sleep(SLOW_WRITE_SECONDS)
+        super().append_message(conversation_id, message)
+
+
+async def _progress_stream() -> float:
+    """Emit events at a fixed interval; return the largest observed gap in ms."""
+    largest_gap = 0.0
+    last = time.perf_counter()
+    for _ in range(EVENTS):
+        await asyncio.sleep(EVENT_INTERVAL)
+        now = time.perf_counter()
+        largest_gap = max(largest_gap, now - last)
+        last = now
+    return largest_gap * 1000
+
+
+async def _run(save) -> float:
+    progress = asyncio.create_task(_progress_stream())
+    await asyncio.sleep(EVENT_INTERVAL * 5)  # let the other stream get going
+    await save()
+    return await progress
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl.DATA_DIR = tmp
+        storage._backend = SlowWriteStorage()
+        storage.create_conversation("bench")
+        stage1 = [{"model": f"model-{i}", "response": "x" * 4000} for i in range(5)]
+
+        async def sync_save():
+            storage.add_assistant_message("bench", stage1)
+
+        async def async_save():
+            await async_storage.add_assistant_message("bench", stage1)
+
+        try:
+            blocked = await _run(sync_save)
+            offloaded = await _run(async_save)
+        finally:
+            async_storage.shutdown()
+            storage.close()
+
+    print(f"Slow write: {SLOW_WRITE_SECONDS * 1000:.0f} ms, other stream emits every {EVENT_INTERVAL * 1000:.0f} ms")
+    print(f"  largest event gap, direct storage call: {blocked:8.1f} ms")
+    print(f"  largest event gap, async facade:        {offloaded:8.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
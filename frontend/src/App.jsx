@@ -26,6 +26,8 @@ function App() {
   const [sidebarOpen, setSidebarOpen] = useState(false);
   const abortControllerRef = useRef(null);
   const requestIdRef = useRef(0);
+  // Sync cursor from the last conversation list response (see loadConversations)
+  const syncCursorRef = useRef(null);
   const isInitialMount = useRef(true);
 
   // Check initial configuration on mount
@@ -186,10 +188,26 @@ function App() {
 
   const loadConversations = async (retryCount = 0) => {
     try {
-      const convs = await api.listConversations();
+      // After the first full load, only fetch entries changed since the last sync
+      if (syncCursorRef.current) {
+        const { updated, deleted, cursor } = await api.listConversationChanges(syncCursorRef.current);
+        syncCursorRef.current = cursor;
+        if (updated.length || deleted.length) {
+          setConversations((prev) => {
+            const changedIds = new Set([...deleted, ...updated.map(c => c.id)]);
+            return [...updated, ...prev.filter(c => !changedIds.has(c.id))]
+              .sort((a, b) => (a.created_at < b.created_at ? 1 : -1));
+          });
+        }
+        return;
+      }
+      const { conversations: convs, cursor } = await api.listConversations();
+      syncCursorRef.current = cursor;
       setConversations(convs);
     } catch (error) {
       console.error('Failed to load conversations:', error);
+      // Fall back to a full reload on the next attempt
+      syncCursorRef.current = null;
       // Retry up to 3 times with increasing delays (1s, 2s, 3s)
       if (retryCount < 3) {
         setTimeout(() => loadConversations(retryCount + 1), (retryCount + 1) * 1000);
@@ -206,6 +224,22 @@ function App() {
     }
   };
 
+  // Replace a summarized message with its full version (Stage 1/2, search context)
+  const loadMessageDetail = async (index) => {
+    const conversationId = currentConversationId;
+    try {
+      const message = await api.getMessage(conversationId, index);
+      setCurrentConversation((prev) => {
+        if (!prev || prev.id !== conversationId) return prev;
+        const messages = [...prev.messages];
+        messages[index] = message;
+        return { ...prev, messages };
+      });
+    } catch (error) {
+      console.error('Failed to load message details:', error);
+    }
+  };
+
   const handleNewConversation = async () => {
     // Check if there's already an empty/unused conversation
     const existingEmpty = conversations.find(conv => !conv.title && conv.message_count === 0);
@@ -307,10 +341,13 @@ function App() {
         messages: [...prev.messages, assistantMessage],
       }));
 
-      // Send message with streaming
+      // Set when a resumed stream skipped events; the saved message is reloaded at the end
+      let eventsMissed = false;
+
+      // Send message with streaming (as a detached run that survives dropped connections)
       await api.sendMessageStream(
         currentConversationId,
-        { content, webSearch, executionMode },
+        { content, webSearch, executionMode, detach: true },
         (eventType, event) => {
           switch (eventType) {
             case 'search_start':
@@ -355,6 +392,22 @@ function App() {
               });
               break;
 
+            case 'search_content':
+              // Progressive search: full article content replaced the snippets
+              setCurrentConversation((prev) => {
+                const messages = [...prev.messages];
+                const lastMsg = messages[messages.length - 1];
+                messages[messages.length - 1] = {
+                  ...lastMsg,
+                  metadata: {
+                    ...lastMsg.metadata,
+                    search_context: event.data.search_context,
+                  }
+                };
+                return { ...prev, messages };
+              });
+              break;
+
             case 'stage1_start':
               setCurrentConversation((prev) => {
                 const messages = [...prev.messages];
@@ -400,13 +453,36 @@ function App() {
               });
               break;
 
+            case 'stage1_delta':
+              setCurrentConversation((prev) => {
+                const messages = [...prev.messages];
+                const lastMsg = messages[messages.length - 1];
+
+                // Append the token delta to this model's in-progress response
+                const stage1 = lastMsg.stage1 ? [...lastMsg.stage1] : [];
+                const idx = stage1.findIndex(r => r.model === event.model && r.streaming);
+                if (idx === -1) {
+                  stage1.push({ model: event.model, response: event.delta, error: null, streaming: true });
+                } else {
+                  stage1[idx] = { ...stage1[idx], response: stage1[idx].response + event.delta };
+                }
+
+                messages[messages.length - 1] = { ...lastMsg, stage1 };
+                return { ...prev, messages };
+              });
+              break;
+
             case 'stage1_progress':
               setCurrentConversation((prev) => {
                 const messages = [...prev.messages];
                 const lastMsg = messages[messages.length - 1];
 
-                // Immutable update for stage1
-                const updatedStage1 = lastMsg.stage1 ? [...lastMsg.stage1, event.data] : [event.data];
+                // Immutable update for stage1 (replaces the model's streaming entry if any)
+                const previousStage1 = lastMsg.stage1 || [];
+                const streamingIdx = previousStage1.findIndex(r => r.model === event.data.model && r.streaming);
+                const updatedStage1 = streamingIdx === -1
+                  ? [...previousStage1, event.data]
+                  : previousStage1.map((r, i) => (i === streamingIdx ? event.data : r));
                 const updatedLastMsg = {
                   ...lastMsg,
                   progress: {
@@ -431,10 +507,18 @@ function App() {
                 const messages = [...prev.messages];
                 const lastMsg = messages[messages.length - 1];
 
+                // Compact events carry no results: keep the ones from stage1_progress,
+                // dropping partial answers of seats that were cancelled
+                const stage1 = event.data ?? (lastMsg.stage1 || []).filter((r) => !r.streaming);
+
                 // Immutable update to prevent React rendering issues
                 const updatedLastMsg = {
                   ...lastMsg,
-                  stage1: event.data,
+                  stage1,
+                  // Seats cancelled when Stage 1 ended early (quorum/deadline)
+                  ...(event.dropped && {
+                    metadata: { ...lastMsg.metadata, stage1_dropped: event.dropped }
+                  }),
                   loading: {
                     ...lastMsg.loading,
                     stage1: false
@@ -528,7 +612,8 @@ function App() {
                 // Immutable update to prevent React rendering issues
                 const updatedLastMsg = {
                   ...lastMsg,
-                  stage2: event.data,
+                  // Compact events carry no results; they arrived with stage2_progress
+                  stage2: event.data ?? (lastMsg.stage2 || []),
                   loading: {
                     ...lastMsg.loading,
                     stage2: false
@@ -570,6 +655,30 @@ function App() {
               });
               break;
 
+            case 'stage3_delta':
+            case 'stage3_reasoning':
+              setCurrentConversation((prev) => {
+                const messages = [...prev.messages];
+                const lastMsg = messages[messages.length - 1];
+
+                // Accumulate answer and reasoning separately, render reasoning as a think block
+                const current = lastMsg.stage3?.streaming
+                  ? lastMsg.stage3
+                  : { model: event.model, content: '', reasoning: '', streaming: true };
+                const content = current.content + (event.type === 'stage3_delta' ? event.delta : '');
+                const reasoning = current.reasoning + (event.type === 'stage3_reasoning' ? event.delta : '');
+                const response = reasoning
+                  ? `<think>\n${reasoning}\n</think>\n\n${content}`
+                  : content;
+
+                messages[messages.length - 1] = {
+                  ...lastMsg,
+                  stage3: { ...current, content, reasoning, response },
+                };
+                return { ...prev, messages };
+              });
+              break;
+
             case 'stage3_complete':
               setCurrentConversation((prev) => {
                 const messages = [...prev.messages];
@@ -604,9 +713,17 @@ function App() {
             case 'complete':
               // Stream complete, reload conversations list
               loadConversations();
+              if (eventsMissed) {
+                loadConversation(currentConversationId);
+              }
               setIsLoading(false);
               break;
 
+            case 'events_missed':
+              // Reconnected after the server's event buffer moved on
+              eventsMissed = true;
+              break;
+
             case 'error':
               console.error('Stream error:', event.message);
               setIsLoading(false);
@@ -710,6 +827,7 @@ function App() {
         conversation={currentConversation}
         onSendMessage={handleSendMessage}
         onAbort={handleAbort}
+        onLoadMessageDetail={loadMessageDetail}
         isLoading={isLoading}
         councilConfigured={councilConfigured}
         councilModels={councilModels}
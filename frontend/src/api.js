@@ -17,15 +17,74 @@ const getApiBase = () => {
 
 const API_BASE = getApiBase();
 
+// Reconnect attempts for a detached run whose event stream dropped
+const RUN_RESUME_ATTEMPTS = 5;
+
+/**
+ * Read an SSE response, calling onEvent(type, event) for each `data:` line
+ * and onEventId(id) for each `id:` line.
+ */
+async function readEventStream(response, onEvent, onEventId) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  // Holds a trailing partial line until the rest of it arrives
+  let buffer = '';
+
+  try {
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+
+      for (const line of lines) {
+        if (line.startsWith('id: ')) {
+          onEventId?.(Number(line.slice(4)));
+        } else if (line.startsWith('data: ')) {
+          const data = line.slice(6);
+          try {
+            const event = JSON.parse(data);
+            onEvent(event.type, event);
+          } catch (e) {
+            console.error('Failed to parse SSE event:', e);
+          }
+        }
+      }
+    }
+  } finally {
+    reader.releaseLock();
+  }
+}
+
 export const api = {
   /**
    * List all conversations.
+   * Returns { conversations, cursor } where cursor feeds listConversationChanges().
    */
   async listConversations() {
     const response = await fetch(`${API_BASE}/api/conversations`);
     if (!response.ok) {
       throw new Error('Failed to list conversations');
     }
+    return {
+      conversations: await response.json(),
+      cursor: response.headers.get('X-Sync-Cursor'),
+    };
+  },
+
+  /**
+   * List conversations changed or deleted since a sync cursor.
+   * Returns { updated, deleted, cursor }.
+   */
+  async listConversationChanges(since) {
+    const response = await fetch(
+      `${API_BASE}/api/conversations?since=${encodeURIComponent(since)}`
+    );
+    if (!response.ok) {
+      throw new Error('Failed to list conversation changes');
+    }
     return response.json();
   },
 
@@ -48,10 +107,12 @@ export const api = {
 
   /**
    * Get a specific conversation.
+   * Assistant messages come back summarized (final answer only); messages
+   * marked `summary` are loaded in full with getMessage().
    */
   async getConversation(conversationId) {
     const response = await fetch(
-      `${API_BASE}/api/conversations/${conversationId}`
+      `${API_BASE}/api/conversations/${conversationId}?view=summary`
     );
     if (!response.ok) {
       throw new Error('Failed to get conversation');
@@ -59,6 +120,19 @@ export const api = {
     return response.json();
   },
 
+  /**
+   * Get one full message (all stages) of a conversation.
+   */
+  async getMessage(conversationId, index) {
+    const response = await fetch(
+      `${API_BASE}/api/conversations/${conversationId}/messages/${index}`
+    );
+    if (!response.ok) {
+      throw new Error('Failed to get message');
+    }
+    return response.json();
+  },
+
   /**
    * Delete a conversation.
    */
@@ -311,8 +385,8 @@ export const api = {
    * @returns {Promise<void>}
    */
   async sendMessageStream(conversationId, options, onEvent, signal) {
-    const { content, webSearch = false, executionMode = 'full' } = options;
-    const response = await fetch(
+    const { content, webSearch = false, executionMode = 'full', streamTokens = true, detach = false } = options;
+    let response = await fetch(
       `${API_BASE}/api/conversations/${conversationId}/message/stream?_t=${Date.now()}`,
       {
         method: 'POST',
@@ -320,7 +394,16 @@ export const api = {
           'Content-Type': 'application/json',
           'Cache-Control': 'no-cache',
         },
-        body: JSON.stringify({ content, web_search: webSearch, execution_mode: executionMode }),
+        body: JSON.stringify({
+          content,
+          web_search: webSearch,
+          execution_mode: executionMode,
+          stream_tokens: streamTokens,
+          detach,
+          // Compact events (no repeated results in *_complete) and a compressed stream
+          protocol: 2,
+          compress: true,
+        }),
         signal,
         cache: 'no-store',
       }
@@ -330,31 +413,70 @@ export const api = {
       throw new Error('Failed to send message');
     }
 
-    const reader = response.body.getReader();
-    const decoder = new TextDecoder();
+    if (!detach) {
+      await readEventStream(response, onEvent);
+      return;
+    }
+
+    // Detached run: the council keeps working on the server if the connection
+    // drops, so reconnect and continue after the last event received
+    let runId = null;
+    let lastEventId = 0;
+    let attempts = 0;
+    const cancelRun = () => {
+      if (runId) this.cancelRun(runId).catch(() => {});
+    };
+    signal?.addEventListener('abort', cancelRun);
 
     try {
       while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        const chunk = decoder.decode(value);
-        const lines = chunk.split('\n');
-
-        for (const line of lines) {
-          if (line.startsWith('data: ')) {
-            const data = line.slice(6);
-            try {
-              const event = JSON.parse(data);
-              onEvent(event.type, event);
-            } catch (e) {
-              console.error('Failed to parse SSE event:', e);
+        try {
+          await readEventStream(
+            response,
+            (type, event) => {
+              if (type === 'run_started') {
+                runId = event.run_id;
+                return;
+              }
+              onEvent(type, event);
+            },
+            (id) => {
+              lastEventId = id;
+              attempts = 0;
             }
+          );
+          return; // the server ends the stream when the run is done
+        } catch (error) {
+          if (error.name === 'AbortError' || !runId || attempts >= RUN_RESUME_ATTEMPTS) {
+            throw error;
           }
         }
+
+        attempts += 1;
+        await new Promise((resolve) => setTimeout(resolve, 500 * 2 ** attempts));
+        response = await fetch(
+          `${API_BASE}/api/runs/${runId}/events?last_event_id=${lastEventId}&compress=true`,
+          { signal, cache: 'no-store' }
+        );
+        if (!response.ok) {
+          throw new Error('Failed to resume council run');
+        }
       }
     } finally {
-      reader.releaseLock();
+      signal?.removeEventListener('abort', cancelRun);
+    }
+  },
+
+  /**
+   * Cancel a detached council run.
+   */
+  async cancelRun(runId) {
+    const response = await fetch(`${API_BASE}/api/runs/${runId}`, {
+      method: 'DELETE',
+    });
+    if (!response.ok) {
+      throw new Error('Failed to cancel run');
     }
+    return response.json();
   },
 };
@@ -14,6 +14,7 @@ export default function ChatInterface({
     conversation,
     onSendMessage,
     onAbort,
+    onLoadMessageDetail,
     isLoading,
     councilConfigured,
     onOpenSettings,
@@ -154,7 +155,7 @@ export default function ChatInterface({
                                                     status={msg.loading?.stage1 ? 'thinking' : 'complete'}
                                                     progress={{
                                                         currentModel: msg.progress?.stage1?.currentModel,
-                                                        completed: msg.stage1?.map(r => r.model) || []
+                                                        completed: msg.stage1?.filter(r => !r.streaming).map(r => r.model) || []
                                                     }}
                                                 />
                                             </div>
@@ -173,6 +174,14 @@ export default function ChatInterface({
                                             )
                                         ) : null}
 
+                                        {/* Stage 1 ended early: seats that were dropped */}
+                                        {msg.metadata?.stage1_dropped && (
+                                            <div className="stage1-dropped-note">
+                                                ⏱ {msg.metadata.stage1_dropped.reason === 'deadline' ? 'Deadline reached' : 'Quorum reached'}
+                                                {' '}— continued without {msg.metadata.stage1_dropped.models.join(', ')}
+                                            </div>
+                                        )}
+
                                         {/* Stage 2 */}
                                         {msg.loading?.stage2 && (
                                             <Stage2Skeleton />
@@ -187,8 +196,18 @@ export default function ChatInterface({
                                             />
                                         )}
 
+                                        {/* Summarized message: Stage 1/2 and search context load on demand */}
+                                        {msg.summary && onLoadMessageDetail && (
+                                            <button
+                                                className="message-details-button"
+                                                onClick={() => onLoadMessageDetail(index)}
+                                            >
+                                                Show council details
+                                            </button>
+                                        )}
+
                                         {/* Stage 3 */}
-                                        {msg.loading?.stage3 && (
+                                        {msg.loading?.stage3 && !msg.stage3 && (
                                             <Stage3Skeleton />
                                         )}
                                         {msg.stage3 && (
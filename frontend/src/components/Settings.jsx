@@ -20,6 +20,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
   const [fullContentResults, setFullContentResults] = useState(3);
   const [searchResultCount, setSearchResultCount] = useState(8);
   const [searchHybridMode, setSearchHybridMode] = useState(true);
+  const [searchProgressiveContent, setSearchProgressiveContent] = useState(false);
 
   // OpenRouter State
   const [openrouterApiKey, setOpenrouterApiKey] = useState('');
@@ -96,6 +97,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
   const [councilTemperature, setCouncilTemperature] = useState(0.5);
   const [chairmanTemperature, setChairmanTemperature] = useState(0.4);
   const [stage2Temperature, setStage2Temperature] = useState(0.3);
+  const [stage1Quorum, setStage1Quorum] = useState(0);
+  const [stage1SoftDeadline, setStage1SoftDeadline] = useState(0);
+  const [stage2PipelineQuorum, setStage2PipelineQuorum] = useState(0);
+  const [stage2RerankWindow, setStage2RerankWindow] = useState(10);
+  const [councilFallbacks, setCouncilFallbacks] = useState({});
 
   // System Prompts State
   const [prompts, setPrompts] = useState({
@@ -141,6 +147,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       if (fullContentResults !== (settings.full_content_results ?? 3)) return true;
       if (searchResultCount !== (settings.search_result_count ?? 8)) return true;
       if (searchHybridMode !== (settings.search_hybrid_mode ?? true)) return true;
+      if (searchProgressiveContent !== (settings.search_progressive_content ?? false)) return true;
       if (showFreeOnly !== (settings.show_free_only ?? false)) return true;
 
       // Enabled Providers
@@ -153,6 +160,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       if (councilTemperature !== (settings.council_temperature ?? 0.5)) return true;
       if (chairmanTemperature !== (settings.chairman_temperature ?? 0.4)) return true;
       if (stage2Temperature !== (settings.stage2_temperature ?? 0.3)) return true;
+      if (stage1Quorum !== (settings.stage1_quorum ?? 0)) return true;
+      if (stage1SoftDeadline !== (settings.stage1_soft_deadline ?? 0)) return true;
+      if (stage2PipelineQuorum !== (settings.stage2_pipeline_quorum ?? 0)) return true;
+      if (stage2RerankWindow !== (settings.stage2_rerank_window ?? 10)) return true;
+      if (JSON.stringify(councilFallbacks) !== JSON.stringify(settings.council_fallbacks || {})) return true;
 
       // Remote/Local filters
       if (JSON.stringify(councilMemberFilters) !== JSON.stringify(settings.council_member_filters || {})) return true;
@@ -175,6 +187,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
     fullContentResults,
     searchResultCount,
     searchHybridMode,
+    searchProgressiveContent,
     showFreeOnly,
     enabledProviders,
     directProviderToggles,
@@ -183,6 +196,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
     councilTemperature,
     chairmanTemperature,
     stage2Temperature,
+    stage1Quorum,
+    stage1SoftDeadline,
+    stage2PipelineQuorum,
+    stage2RerankWindow,
+    councilFallbacks,
     councilMemberFilters,
     chairmanFilter,
     prompts
@@ -327,6 +345,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       setFullContentResults(data.full_content_results ?? 3);
       setSearchResultCount(data.search_result_count ?? 8);
       setSearchHybridMode(data.search_hybrid_mode ?? true);
+      setSearchProgressiveContent(data.search_progressive_content ?? false);
       setShowFreeOnly(data.show_free_only ?? false);
 
       // Enabled Providers - use saved settings if available, otherwise auto-enable based on configured keys
@@ -368,6 +387,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       setCouncilTemperature(data.council_temperature ?? 0.5);
       setChairmanTemperature(data.chairman_temperature ?? 0.4);
       setStage2Temperature(data.stage2_temperature ?? 0.3);
+      setStage1Quorum(data.stage1_quorum ?? 0);
+      setStage1SoftDeadline(data.stage1_soft_deadline ?? 0);
+      setStage2PipelineQuorum(data.stage2_pipeline_quorum ?? 0);
+      setStage2RerankWindow(data.stage2_rerank_window ?? 10);
+      setCouncilFallbacks(data.council_fallbacks || {});
 
       // Initialize refs for auto-save tracking (prevents auto-save on initial load)
       prevCouncilModelsRef.current = loadedCouncilModels;
@@ -960,6 +984,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       setCouncilTemperature(0.5);
       setChairmanTemperature(0.4);
       setStage2Temperature(0.3);
+      setStage1Quorum(0);
+      setStage1SoftDeadline(0);
+      setStage2PipelineQuorum(0);
+      setStage2RerankWindow(10);
+      setCouncilFallbacks({});
 
       // Reset filters to 'remote' default
       // Reset filters to 'remote' default
@@ -970,6 +999,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       setSelectedSearchProvider('duckduckgo');
       setSearchKeywordExtraction('direct');
       setFullContentResults(3);
+      setSearchProgressiveContent(false);
       setShowFreeOnly(false);
       setOllamaBaseUrl('http://localhost:11434');
 
@@ -986,6 +1016,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       const updates = {
         search_provider: 'duckduckgo',
         full_content_results: 3,
+        search_progressive_content: false,
         enabled_providers: {
           openrouter: false,
           ollama: false,
@@ -1004,6 +1035,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
         council_temperature: 0.5,
         chairman_temperature: 0.4,
         stage2_temperature: 0.3,
+        stage1_quorum: 0,
+        stage1_soft_deadline: 0,
+        stage2_pipeline_quorum: 0,
+        stage2_rerank_window: 10,
+        council_fallbacks: {},
         search_query_model: '',
         council_member_filters: { 0: 'remote', 1: 'remote' },
         chairman_filter: 'remote',
@@ -1077,6 +1113,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       full_content_results: fullContentResults,
       search_result_count: searchResultCount,
       search_hybrid_mode: searchHybridMode,
+      search_progressive_content: searchProgressiveContent,
       show_free_only: showFreeOnly,
 
       // Enabled Providers
@@ -1092,6 +1129,15 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
       chairman_temperature: chairmanTemperature,
       stage2_temperature: stage2Temperature,
 
+      // Stage 1 early exit
+      stage1_quorum: stage1Quorum,
+      stage1_soft_deadline: stage1SoftDeadline,
+      stage2_pipeline_quorum: stage2PipelineQuorum,
+      stage2_rerank_window: stage2RerankWindow,
+
+      // Hedged requests
+      council_fallbacks: councilFallbacks,
+
       // Filters
       council_member_filters: councilMemberFilters,
       chairman_filter: chairmanFilter,
@@ -1127,6 +1173,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
         if (config.full_content_results !== undefined) setFullContentResults(config.full_content_results);
         if (config.search_result_count !== undefined) setSearchResultCount(config.search_result_count);
         if (config.search_hybrid_mode !== undefined) setSearchHybridMode(config.search_hybrid_mode);
+        if (config.search_progressive_content !== undefined) setSearchProgressiveContent(config.search_progressive_content);
         if (config.show_free_only !== undefined) setShowFreeOnly(config.show_free_only);
 
         // Apply Enabled Providers
@@ -1145,6 +1192,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
         if (config.council_temperature !== undefined) setCouncilTemperature(config.council_temperature);
         if (config.chairman_temperature !== undefined) setChairmanTemperature(config.chairman_temperature);
         if (config.stage2_temperature !== undefined) setStage2Temperature(config.stage2_temperature);
+        if (config.stage1_quorum !== undefined) setStage1Quorum(config.stage1_quorum);
+        if (config.stage1_soft_deadline !== undefined) setStage1SoftDeadline(config.stage1_soft_deadline);
+        if (config.stage2_pipeline_quorum !== undefined) setStage2PipelineQuorum(config.stage2_pipeline_quorum);
+        if (config.stage2_rerank_window !== undefined) setStage2RerankWindow(config.stage2_rerank_window);
+        if (config.council_fallbacks) setCouncilFallbacks(config.council_fallbacks);
 
         // Apply Filters
         if (config.council_member_filters) setCouncilMemberFilters(config.council_member_filters);
@@ -1227,6 +1279,7 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
         full_content_results: fullContentResults,
         search_result_count: searchResultCount,
         search_hybrid_mode: searchHybridMode,
+        search_progressive_content: searchProgressiveContent,
         show_free_only: showFreeOnly,
 
         // Enabled Providers
@@ -1239,6 +1292,11 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
         council_temperature: councilTemperature,
         chairman_temperature: chairmanTemperature,
         stage2_temperature: stage2Temperature,
+        stage1_quorum: stage1Quorum,
+        stage1_soft_deadline: stage1SoftDeadline,
+        stage2_pipeline_quorum: stage2PipelineQuorum,
+        stage2_rerank_window: stage2RerankWindow,
+        council_fallbacks: councilFallbacks,
 
         // Remote/Local filters for each selection
         council_member_filters: councilMemberFilters,
@@ -1519,6 +1577,16 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
                 setCouncilTemperature={setCouncilTemperature}
                 chairmanTemperature={chairmanTemperature}
                 setChairmanTemperature={setChairmanTemperature}
+                stage1Quorum={stage1Quorum}
+                setStage1Quorum={setStage1Quorum}
+                stage1SoftDeadline={stage1SoftDeadline}
+                setStage1SoftDeadline={setStage1SoftDeadline}
+                stage2PipelineQuorum={stage2PipelineQuorum}
+                setStage2PipelineQuorum={setStage2PipelineQuorum}
+                stage2RerankWindow={stage2RerankWindow}
+                setStage2RerankWindow={setStage2RerankWindow}
+                councilFallbacks={councilFallbacks}
+                setCouncilFallbacks={setCouncilFallbacks}
                 // Data
                 allModels={allAvailableModels}
                 filteredModels={filteredAvailableModels}
@@ -1588,6 +1656,8 @@ export default function Settings({ onClose, ollamaStatus, onRefreshOllama, initi
                 setSearchResultCount={setSearchResultCount}
                 searchHybridMode={searchHybridMode}
                 setSearchHybridMode={setSearchHybridMode}
+                searchProgressiveContent={searchProgressiveContent}
+                setSearchProgressiveContent={setSearchProgressiveContent}
               />
             )}
 
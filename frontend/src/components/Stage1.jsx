@@ -100,6 +100,11 @@ export default function Stage1({ responses, startTime, endTime }) {
               <span className="model-provider-badge" style={{ borderColor: currentVisuals.color, color: currentVisuals.color }}>
                 {currentVisuals.name}
               </span>
+              {currentResponse.hedged_by && (
+                <span className="model-provider-badge" title="Answered by this seat's fallback model">
+                  via {currentResponse.hedged_by}
+                </span>
+              )}
             </div>
           </div>
 
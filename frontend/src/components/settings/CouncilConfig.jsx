@@ -31,6 +31,16 @@ export default function CouncilConfig({
     setCouncilTemperature,
     chairmanTemperature,
     setChairmanTemperature,
+    stage1Quorum,
+    setStage1Quorum,
+    stage1SoftDeadline,
+    setStage1SoftDeadline,
+    stage2PipelineQuorum,
+    setStage2PipelineQuorum,
+    stage2RerankWindow,
+    setStage2RerankWindow,
+    councilFallbacks,
+    setCouncilFallbacks,
     // Data
     allModels, // Result of getAllAvailableModels()
     filteredModels, // Result of getFilteredAvailableModels()
@@ -344,6 +354,42 @@ export default function CouncilConfig({
                         </div>
                     )}
 
+                    {/* Fallback Models (hedged requests) */}
+                    {councilModels.some(Boolean) && (
+                        <div className="subsection" style={{ marginTop: '20px' }}>
+                            <h4 style={{ margin: '0 0 8px 0' }}>Fallback Models</h4>
+                            <p className="section-description" style={{ marginTop: 0 }}>
+                                Optional. If a member is slower than usual or fails, its fallback is asked too and
+                                the first answer wins.
+                            </p>
+                            <div className="council-members">
+                                {councilModels.map((modelId, index) => modelId && (
+                                    <div key={index} className="council-member-row">
+                                        <span className="member-label">Member {index + 1}</span>
+                                        <div className="model-select-wrapper">
+                                            <SearchableModelSelect
+                                                models={filteredModels.filter(m => m.id !== modelId)}
+                                                value={councilFallbacks[modelId] || ''}
+                                                onChange={(value) => {
+                                                    const next = { ...councilFallbacks };
+                                                    if (value) {
+                                                        next[modelId] = value;
+                                                    } else {
+                                                        delete next[modelId];
+                                                    }
+                                                    setCouncilFallbacks(next);
+                                                }}
+                                                placeholder="No fallback"
+                                                isLoading={isLoadingModels}
+                                                allModels={allModels}
+                                            />
+                                        </div>
+                                    </div>
+                                ))}
+                            </div>
+                        </div>
+                    )}
+
                     {/* Rate Limit Warning Banner */}
                     {rateLimitWarning && (
                         <div className={`rate-limit-warning ${rateLimitWarning.type}`}>
@@ -393,6 +439,85 @@ export default function CouncilConfig({
                             </button>
                         </p>
                     </div>
+
+                    {/* Stage 1 Early Exit */}
+                    <div className="subsection" style={{ marginTop: '20px' }}>
+                        <div className="heat-slider-header">
+                            <h4>Quorum</h4>
+                            <span className="heat-value">
+                                {stage1Quorum > 0 ? `${stage1Quorum} of ${councilModels.length}` : 'All'}
+                            </span>
+                        </div>
+                        <input
+                            type="range"
+                            min="0"
+                            max={Math.max(councilModels.length, stage1Quorum)}
+                            step="1"
+                            value={stage1Quorum}
+                            onChange={(e) => setStage1Quorum(parseInt(e.target.value, 10))}
+                            className="heat-slider"
+                        />
+                        <div className="heat-slider-header" style={{ marginTop: '12px' }}>
+                            <h4>Soft Deadline</h4>
+                            <span className="heat-value">{stage1SoftDeadline > 0 ? `${stage1SoftDeadline}s` : 'Off'}</span>
+                        </div>
+                        <input
+                            type="range"
+                            min="0"
+                            max="120"
+                            step="5"
+                            value={stage1SoftDeadline}
+                            onChange={(e) => setStage1SoftDeadline(parseFloat(e.target.value))}
+                            className="heat-slider"
+                        />
+                        <p className="heat-note" style={{ fontSize: '11px', color: '#94a3b8', marginTop: '8px' }}>
+                            ℹ️ Stage 1 moves on once this many members have answered, or after the deadline
+                            if at least one has. Slower members are cancelled and noted in the response.
+                        </p>
+                    </div>
+
+                    {/* Pipelined Stage 2 */}
+                    <div className="subsection" style={{ marginTop: '20px' }}>
+                        <div className="heat-slider-header">
+                            <h4>Early Ranking</h4>
+                            <span className="heat-value">
+                                {stage2PipelineQuorum > 0 ? `after ${stage2PipelineQuorum} answers` : 'Off'}
+                            </span>
+                        </div>
+                        <input
+                            type="range"
+                            min="1"
+                            max={Math.max(councilModels.length, stage2PipelineQuorum, 2)}
+                            step="1"
+                            value={stage2PipelineQuorum > 0 ? stage2PipelineQuorum : 1}
+                            onChange={(e) => {
+                                const value = parseInt(e.target.value, 10);
+                                setStage2PipelineQuorum(value < 2 ? 0 : value);
+                            }}
+                            className="heat-slider"
+                        />
+                        {stage2PipelineQuorum > 0 && (
+                            <>
+                                <div className="heat-slider-header" style={{ marginTop: '12px' }}>
+                                    <h4>Re-rank Window</h4>
+                                    <span className="heat-value">{stage2RerankWindow}s</span>
+                                </div>
+                                <input
+                                    type="range"
+                                    min="0"
+                                    max="60"
+                                    step="5"
+                                    value={stage2RerankWindow}
+                                    onChange={(e) => setStage2RerankWindow(parseFloat(e.target.value))}
+                                    className="heat-slider"
+                                />
+                            </>
+                        )}
+                        <p className="heat-note" style={{ fontSize: '11px', color: '#94a3b8', marginTop: '8px' }}>
+                            ℹ️ Members that have answered start peer ranking while slower ones finish. Answers arriving
+                            within the re-rank window restart the ranking; later ones are not ranked.
+                        </p>
+                    </div>
                 </div>
                 {/* Chairman */}
                 <div className="subsection" style={{ marginTop: '24px' }}>
@@ -65,7 +65,9 @@ export default function SearchSettings({
     searchResultCount,
     setSearchResultCount,
     searchHybridMode,
-    setSearchHybridMode
+    setSearchHybridMode,
+    searchProgressiveContent,
+    setSearchProgressiveContent
 }) {
     return (
         <section className="settings-section">
@@ -218,6 +220,23 @@ export default function SearchSettings({
                     />
                     <span className="full-content-value">{fullContentResults} results</span>
                 </div>
+
+                {/* Progressive content toggle (Tavily returns its own content, nothing to fetch) */}
+                {fullContentResults > 0 && selectedSearchProvider !== 'tavily' && (
+                    <div className="progressive-content-section" style={{ marginTop: '16px' }}>
+                        <label className="toggle-wrapper">
+                            <input
+                                type="checkbox"
+                                checked={searchProgressiveContent}
+                                onChange={e => setSearchProgressiveContent(e.target.checked)}
+                            />
+                            <span className="toggle-label">Start Council Before Articles Load</span>
+                        </label>
+                        <p className="setting-hint" style={{ marginTop: '4px', marginLeft: '28px' }}>
+                            Stage 1 answers from search snippets right away; full articles are given to the rankings and the chairman once fetched.
+                        </p>
+                    </div>
+                )}
             </div>
 
             {/* DuckDuckGo-specific optimization settings */}
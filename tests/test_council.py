@@ -0,0 +1,52 @@
+"""Tests for the council stages in backend.council."""
+
+import asyncio
+import time
+
+from backend import council
+from backend.settings import Settings
+
+
+def _collect(agen):
+    async def run():
+        return [item async for item in agen]
+    return asyncio.run(run())
+
+
+def test_stage1_waits_quietly_after_soft_deadline(monkeypatch):
+    """A passed soft deadline with no answer yet must block on the queue, not spin."""
+    async def slow_query(model, messages, timeout=None, temperature=0.7, fallback=None, stage="default"):
+        await asyncio.sleep(0.5)
+        return {"content": f"answer from {model}"}
+
+    monkeypatch.setattr(council, "get_settings", lambda: Settings(stage1_soft_deadline=0.05))
+    monkeypatch.setattr(council, "get_council_models", lambda: ["openai:a", "openai:b"])
+    monkeypatch.setattr(council, "query_model", slow_query)
+
+    cpu_started = time.process_time()
+    items = _collect(council.stage1_collect_responses("question"))
+    cpu = time.process_time() - cpu_started
+
+    assert items[0] == 2
+    assert [i["model"] for i in items[1:] if "model" in i]
+    assert cpu < 0.2, f"Stage 1 loop used {cpu:.2f}s of CPU while waiting"
+
+
+def test_stream_hedge_not_started_after_primary_streams(monkeypatch):
+    """Once the primary has streamed output, a pause past the hedge delay must not start the fallback."""
+    started = []
+
+    async def fake_stream(model, messages, timeout, temperature, stage):
+        started.append(model)
+        yield {"type": "delta", "content": "first "}
+        await asyncio.sleep(0.3)
+        yield {"type": "delta", "content": "second"}
+        yield {"type": "done", "response": {"content": "first second"}}
+
+    monkeypatch.setattr(council, "_stream_one", fake_stream)
+    monkeypatch.setattr(council, "_hedge_delay", lambda model, stage, kind: 0.1)
+
+    events = _collect(council.stream_model("openai:p", [], fallback="openai:f"))
+
+    assert started == ["openai:p"]
+    assert events[-1] == {"type": "done", "response": {"content": "first second"}}
@@ -0,0 +1,182 @@
+"""Tests for the SSE endpoints in backend.main."""
+
+import asyncio
+import json
+import time
+from typing import Optional
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import council, main as app_module, settings, storage
+from backend.settings import Settings
+from backend.storage import aio as async_storage
+from backend.storage import jsonl
+
+SLOW_WRITE_SECONDS = 0.4
+COUNCIL_SIZE = 5
+# Seat i answers after (i + 1) * ANSWER_INTERVAL, so progress events arrive at a steady pace
+ANSWER_INTERVAL = 0.05
+
+
+class SlowWriteStorage(jsonl.JsonlStorage):
+    """JSONL backend whose appends to the "slow" conversation take SLOW_WRITE_SECONDS."""
+
+    def append_message(self, conversation_id, message):
+        if conversation_id == "slow":
+            time.sleep(SLOW_WRITE_SECONDS)
+        super().append_message(conversation_id, message)
+
+
+async def _mock_query(model, messages, timeout=None, temperature=0.7, fallback=None, stage="default"):
+    await asyncio.sleep((int(model.rsplit("-", 1)[1]) + 1) * ANSWER_INTERVAL)
+    return {"content": f"Answer from {model}"}
+
+
+async def _mock_stream(model, messages, timeout=None, temperature=0.7, fallback=None, stage="default"):
+    yield {"type": "done", "response": await _mock_query(model, messages, stage=stage)}
+
+
+async def _mock_title(user_query):
+    return "Test"
+
+
+@pytest.fixture
+def settings_client(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SETTINGS_FILE", tmp_path / "settings.json")
+    monkeypatch.setattr(settings, "_cached_settings", None)
+    return TestClient(app_module.app)
+
+
+@pytest.fixture
+def council_app(tmp_path, monkeypatch):
+    monkeypatch.setattr(jsonl, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(storage, "_backend", SlowWriteStorage())
+    monkeypatch.setattr(settings, "_load_settings", lambda: Settings())
+    monkeypatch.setattr(council, "query_model", _mock_query)
+    monkeypatch.setattr(council, "stream_model", _mock_stream)
+    monkeypatch.setattr(council, "get_council_models", lambda: [f"openai:model-{i}" for i in range(COUNCIL_SIZE)])
+    monkeypatch.setattr(app_module, "generate_conversation_title", _mock_title)
+    yield
+    async_storage.shutdown()
+    storage.close()
+
+
+async def _stream(conversation_id: str, execution_mode: str = "chat_only", disconnect_on: Optional[str] = None):
+    """
+    Run one turn through the ASGI app; return (event type, arrival time) pairs.
+
+    With `disconnect_on`, the client disconnects as soon as that event arrives.
+    """
+    body = json.dumps({"content": "What is SSE?", "execution_mode": execution_mode, "stream_tokens": False}).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "POST",
+        "path": f"/api/conversations/{conversation_id}/message/stream",
+        "raw_path": b"",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+        "scheme": "http",
+        "root_path": "",
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+    events = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] != "http.response.body":
+            return
+        for line in message.get("body", b"").decode().splitlines():
+            if line.startswith("data: "):
+                event_type = json.loads(line[6:])["type"]
+                events.append((event_type, time.perf_counter()))
+                if event_type == disconnect_on:
+                    disconnected.set()
+
+    await app_module.app(scope, receive, send)
+    disconnected.set()
+    return events
+
+
+def test_slow_write_does_not_delay_other_streams(council_app):
+    """A slow storage write in one stream must not hold back another stream's stage1_progress events."""
+    storage.create_conversation("fast")
+    storage.create_conversation("slow")
+
+    async def run():
+        fast = asyncio.create_task(_stream("fast"))
+        # Start the slow stream (whose first write blocks) once the fast one is in Stage 1
+        await asyncio.sleep(ANSWER_INTERVAL * 1.5)
+        slow_started = time.perf_counter()
+        slow = asyncio.create_task(_stream("slow"))
+        return await fast, await slow, slow_started
+
+    fast_events, slow_events, slow_started = asyncio.run(run())
+
+    progress = [at for event_type, at in fast_events if event_type == "stage1_progress"]
+    assert len(progress) == COUNCIL_SIZE
+    assert any(event_type == "complete" for event_type, _ in slow_events)
+    # The slow write started while the fast stream was still in Stage 1
+    assert slow_started < progress[-1]
+
+    largest_gap = max(later - earlier for earlier, later in zip(progress, progress[1:]))
+    assert largest_gap < SLOW_WRITE_SECONDS / 2, f"stage1_progress events stalled for {largest_gap * 1000:.0f} ms"
+
+
+def test_disconnect_mid_turn_saves_collected_results(council_app):
+    """Stage 1 answers already collected are saved (marked partial) when the client leaves during Stage 2."""
+    storage.create_conversation("left")
+
+    events = asyncio.run(_stream("left", execution_mode="chat_ranking", disconnect_on="stage2_start"))
+    async_storage.shutdown()  # wait for the queued save
+
+    assert "complete" not in [event_type for event_type, _ in events]
+    messages = storage.get_conversation("left")["messages"]
+    assert [m["role"] for m in messages] == ["user", "assistant"]
+    assert len(messages[1]["stage1"]) == COUNCIL_SIZE
+    assert messages[1]["metadata"]["partial"] is True
+
+
+def test_settings_put_echoes_stage1_early_exit(settings_client):
+    """PUT /api/settings returns the same settings document as GET, including Stage 1 early exit."""
+    updated = settings_client.put("/api/settings", json={"stage1_quorum": 3, "stage1_soft_deadline": 12.5}).json()
+
+    assert updated["stage1_quorum"] == 3
+    assert updated["stage1_soft_deadline"] == 12.5
+    assert updated == settings_client.get("/api/settings").json()
+
+
+def test_settings_put_echoes_stage2_pipeline(settings_client):
+    """PUT /api/settings reads back the pipelined Stage 2 quorum it accepted."""
+    updated = settings_client.put("/api/settings", json={"stage2_pipeline_quorum": 3, "stage2_rerank_window": 5}).json()
+
+    assert updated["stage2_pipeline_quorum"] == 3
+    assert updated["stage2_rerank_window"] == 5
+    assert settings_client.put("/api/settings", json={"stage2_pipeline_quorum": 1}).status_code == 400
+
+
+def test_settings_put_echoes_normalized_hedging(settings_client):
+    """PUT /api/settings returns the hedge settings, with cleared and self-hedged fallbacks removed."""
+    updated = settings_client.put("/api/settings", json={
+        "council_fallbacks": {"openai:a": "openai:b", "openai:b": "openai:b", "openai:c": ""},
+        "hedge_percentile": 0.9,
+        "hedge_min_delay": 1.5,
+        "hedge_default_delay": 4,
+    }).json()
+
+    assert updated["council_fallbacks"] == {"openai:a": "openai:b"}
+    assert updated["hedge_percentile"] == 0.9
+    assert updated["hedge_min_delay"] == 1.5
+    assert updated["hedge_default_delay"] == 4
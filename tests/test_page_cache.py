@@ -0,0 +1,44 @@
+"""Tests for the Jina Reader page cache in backend.page_cache."""
+
+import threading
+import time
+
+from backend.page_cache import PageCache
+
+
+def _entry(url: str, content: str):
+    return {"url": url, "stored_at": time.time(), "etag": None, "last_modified": None, "content": content}
+
+
+def test_concurrent_writes_of_one_page(tmp_path):
+    """Parallel stores of the same URL must not collide on a shared temp file."""
+    cache = PageCache(str(tmp_path), max_age=60, max_bytes=1 << 20)
+    errors = []
+
+    def write(i):
+        try:
+            for _ in range(20):
+                cache._write(_entry("https://example.com/page", f"content {i} " * 200))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert cache._read("https://example.com/page") is not None
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_overwrite_keeps_disk_usage_estimate(tmp_path):
+    """Rewriting an entry (e.g. after revalidation) replaces its size instead of adding to it."""
+    cache = PageCache(str(tmp_path), max_age=60, max_bytes=1 << 20)
+    cache._write(_entry("https://example.com/a", "a" * 1000))
+    cache._write(_entry("https://example.com/b", "b" * 1000))
+    for _ in range(50):
+        cache._write(_entry("https://example.com/a", "a" * 1000))
+
+    assert cache._disk_bytes == sum(size for _, size, _ in cache._scan())
@@ -0,0 +1,42 @@
+"""Tests for the per-provider limiter in backend.providers.rate_limit."""
+
+import asyncio
+
+from backend.providers import rate_limit
+
+
+def test_stream_retry_closes_rate_limited_attempt(monkeypatch):
+    """A stream retried after a 429 is closed before its slot is released and the retry opens."""
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_RETRIES", 1)
+    limiter = rate_limit.ProviderLimiter("test", concurrency=1)
+    opened, closed = [], []
+
+    async def fake_stream():
+        attempt = len(opened)
+        opened.append(list(closed))
+        try:
+            if attempt == 0:
+                rate_limit.note_rate_limited(retry_after=0.01)
+                yield {"type": "done", "response": {"error": True, "error_message": "429"}}
+            else:
+                yield {"type": "delta", "content": "hi"}
+                yield {"type": "done", "response": {"content": "hi"}}
+        finally:
+            closed.append(attempt)
+
+    streams = []
+
+    def open_stream():
+        # Keep every stream referenced so only an explicit close can run its finally
+        streams.append(fake_stream())
+        return streams[-1]
+
+    async def run():
+        return [event async for event in limiter.stream(open_stream)]
+
+    events = asyncio.run(run())
+
+    assert [e["type"] for e in events] == ["delta", "done"]
+    # The rate-limited attempt was already closed when the retry opened
+    assert opened == [[], [0]]
+    assert closed == [0, 1]